@@ -1,4 +1,6 @@
-from flask import Flask, jsonify
+import time
+
+from flask import Flask, Response, g, jsonify, request
 from flask_cors import CORS
 from flasgger import Swagger
 from werkzeug.exceptions import HTTPException
@@ -49,6 +51,41 @@ def create_app():
 
     Swagger(app, config=swagger_config, template=swagger_template)
 
+    # --- METRICS ---
+    # latency histograms per route, upstream host and parse, served at /metrics (Prometheus format)
+    from app.services import metrics
+
+    app.json = metrics.InstrumentedJSONProvider(app)
+
+    @app.before_request
+    def start_timer():
+        g.request_started = time.perf_counter()
+
+    # registered before the encoding hook so that it runs after it and sees the sent body
+    @app.after_request
+    def record_request(response):
+        started = g.pop("request_started", None)
+        if started is not None:
+            route = request.url_rule.rule if request.url_rule else "unmatched"
+            metrics.request_duration.observe(time.perf_counter() - started, route, request.method, str(response.status_code))
+            if not response.is_streamed:
+                metrics.response_bytes.observe(response.content_length or 0, route)
+        return response
+
+    @app.route("/metrics")
+    def prometheus_metrics():
+        return Response(metrics.registry.render(), mimetype="text/plain; version=0.0.4")
+
+    # --- RESPONSE ENCODING ---
+    # compact JSON, strong ETags with 304 answers, gzip/brotli bodies
+    from app.services.response_encoding import response_encoder
+
+    app.json.compact = True
+
+    @app.after_request
+    def encode_response(response):
+        return response_encoder.apply(request, response)
+
     # --- ERROR HANDLING ---
 
     # Handle HTTP errors (e.g. 404, 400, 405) as JSON
@@ -67,6 +104,7 @@ def create_app():
     # Handle generic uncaught exceptions as JSON
     @app.errorhandler(Exception)
     def handle_exception(e):
+        metrics.exceptions.inc(type(e).__name__)
         response = {
             "success": False,
             "error": {
@@ -100,4 +138,25 @@ def create_app():
 
     CORS(app) 
 
+    # cache hit ratios and circuit states, read from their stats() when /metrics is scraped
+    from app.routes import response_cache
+    from app.services.circuit_breaker import breakers
+    from app.services.scraping import season_pages, season_sections
+
+    caches = {"responses": response_cache, "pages": season_pages, "sections": season_sections.pages}
+    metrics.registry.collected(
+        "footballapi_cache_hit_ratio", "Hit ratio of the in-memory caches", ("cache",),
+        lambda: {(name,): cache.stats()["hit_ratio"] for name, cache in caches.items()})
+    metrics.registry.collected(
+        "footballapi_cache_entries", "Entries held by the in-memory caches", ("cache",),
+        lambda: {(name,): cache.stats()["size"] for name, cache in caches.items()})
+    metrics.registry.collected(
+        "footballapi_circuit_open", "1 while the circuit of an upstream host is open or half-open", ("host",),
+        lambda: {(host,): int(state["state"] != "closed") for host, state in breakers.stats().items()})
+
+    # --- BACKGROUND REFRESH ---
+    # keeps the leagues listed in FOOTBALLAPI_LIVE_LEAGUES warm (no-op when unset)
+    from app.services.live_refresher import live_rankings
+    live_rankings.start()
+
     return app
@@ -0,0 +1,236 @@
+import asyncio
+import io
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import Response, g, request
+from pydantic import ValidationError
+
+from app import create_app
+from app.routes import LeagueParam, LeagueSeasonParams, gamedays_cacheable, response_cache
+from app.services import async_http, async_scraping
+from app.services.live_refresher import live_rankings
+from app.services.response_cache import is_success, ttl_for
+from app.services.season_store import season_store
+
+
+# Threads running the Flask app for the routes without an async handler
+WSGI_WORKERS = int(os.environ.get("FOOTBALLAPI_ASGI_WSGI_WORKERS", 16))
+
+# Query parameters of a plain /gamedays request; filters and NDJSON go through Flask
+GAMEDAYS_PARAMS = {"league", "start", "end"}
+
+
+async def cached(endpoint, scraper, *args, cacheable=is_success):
+    """
+    routes.cached() for coroutine scrapers. Both engines share the response cache and the
+    season store, so each serves what the other scraped.
+    """
+    ttl = ttl_for(endpoint, *args[1:])
+    return await response_cache.get_async(
+        (endpoint,) + args,
+        ttl,
+        lambda: season_store.load_or_scrape_async(endpoint, scraper, args, ttl, cacheable),
+        cacheable=cacheable,
+    )
+
+
+def season_params(args):
+    # None lets the Flask view answer with its usual 400
+    try:
+        return LeagueSeasonParams(
+            league=args.get("league"),
+            start=int(args.get("start")),
+            end=int(args.get("end")),
+        )
+    except (ValidationError, TypeError, ValueError):
+        return None
+
+
+async def season_route(endpoint: str, scraper):
+    params = season_params(request.args)
+    if params is None:
+        return None
+    return await cached(endpoint, scraper, params.league, params.start, params.end)
+
+
+async def ranking_route():
+    try:
+        params = LeagueParam(league=request.args.get("league"))
+    except (ValidationError, TypeError, ValueError):
+        return None
+    warm = live_rankings.get(params.league)
+    if warm is not None:
+        return warm
+    return await cached("ranking", async_scraping.get_live_league_ranking, params.league)
+
+
+async def gamedays_route():
+    if set(request.args) - GAMEDAYS_PARAMS:
+        return None
+    params = season_params(request.args)
+    if params is None:
+        return None
+    data = await cached(
+        "gamedays", async_scraping.get_league_giornate, params.league, params.start, params.end,
+        cacheable=gamedays_cacheable,
+    )
+    if isinstance(data, dict):
+        return data
+    return Response(data, mimetype="application/json")  # already a JSON string
+
+
+ROUTES = {
+    "/api/intro": lambda: season_route("intro", async_scraping.get_wikipedia_intro_en),
+    "/api/infobox": lambda: season_route("infobox", async_scraping.get_infobox_it),
+    "/api/teams": lambda: season_route("teams", async_scraping.get_league_teams),
+    "/api/scorers": lambda: season_route("scorers", async_scraping.scrape_top_scorers),
+    "/api/ranking": ranking_route,
+    "/api/gamedays": gamedays_route,
+}
+
+
+class AsyncAPI:
+    """
+    ASGI application serving the API of create_app().
+
+    The routes in ROUTES run on the event loop with the async scraping engine, so a request
+    waiting on Wikipedia or Eurosport holds no thread. Their results go through the Flask
+    response pipeline (JSON provider, ETag/compression, CORS, metrics), so they are answered
+    exactly like under WSGI. Every other route, and any request those handlers decline
+    (invalid parameters, gamedays filters or NDJSON), is passed to the Flask app in a
+    thread pool.
+    """
+
+    def __init__(self, flask_app, wsgi_workers: int = 16):
+        self.flask_app = flask_app
+        self.routes = ROUTES
+        self.executor = ThreadPoolExecutor(max_workers=wsgi_workers, thread_name_prefix="wsgi")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        handler = self.routes.get(scope["path"]) if scope["method"] in ("GET", "HEAD") else None
+        if handler is None or not await self._handle(handler, scope, send):
+            await self._call_wsgi(scope, receive, send)
+
+    async def _handle(self, handler, scope, send) -> bool:
+        environ = wsgi_environ(scope, b"")
+        with self.flask_app.request_context(environ):
+            g.request_started = time.perf_counter()
+            try:
+                result = await handler()
+                if result is None:
+                    return False
+                response = self.flask_app.make_response(result)
+            except Exception as e:
+                response = self.flask_app.make_response(self.flask_app.handle_user_exception(e))
+            response = self.flask_app.process_response(response)
+
+        body = b"" if scope["method"] == "HEAD" else response.get_data()
+        await send({
+            "type": "http.response.start",
+            "status": response.status_code,
+            "headers": [(name.lower().encode("latin-1"), value.encode("latin-1"))
+                        for name, value in response.headers.items()],
+        })
+        await send({"type": "http.response.body", "body": body})
+        return True
+
+    async def _call_wsgi(self, scope, receive, send):
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self.executor, self._run_wsgi, wsgi_environ(scope, body), loop, send)
+
+    def _run_wsgi(self, environ: dict, loop, send):
+        # runs in one worker thread from start to end, so Flask's context locals stay valid
+        # while a streamed body is produced
+        def send_sync(message):
+            asyncio.run_coroutine_threadsafe(send(message), loop).result()
+
+        head = {}
+
+        def start_response(status, headers, exc_info=None):
+            head["message"] = {
+                "type": "http.response.start",
+                "status": int(status.split(" ", 1)[0]),
+                "headers": [(name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers],
+            }
+
+        iterable = self.flask_app.wsgi_app(environ, start_response)
+        try:
+            started = False
+            for chunk in iterable:
+                if not started:
+                    send_sync(head["message"])
+                    started = True
+                if chunk:
+                    send_sync({"type": "http.response.body", "body": chunk, "more_body": True})
+            if not started:
+                send_sync(head["message"])
+            send_sync({"type": "http.response.body", "body": b""})
+        finally:
+            if hasattr(iterable, "close"):
+                iterable.close()
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await async_http.aclose()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+def wsgi_environ(scope: dict, body: bytes) -> dict:
+    """
+    Builds the WSGI environ of an ASGI HTTP request.
+    """
+    server = scope.get("server") or ("localhost", 80)
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": scope.get("root_path", "").encode("utf-8").decode("latin-1"),
+        "PATH_INFO": scope["path"].encode("utf-8").decode("latin-1"),
+        "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+        "SERVER_NAME": server[0],
+        "SERVER_PORT": str(server[1]),
+        "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": False,
+        "wsgi.run_once": False,
+    }
+    if scope.get("client"):
+        environ["REMOTE_ADDR"], environ["REMOTE_PORT"] = scope["client"][0], str(scope["client"][1])
+    for name, value in scope.get("headers", []):
+        name, value = name.decode("latin-1"), value.decode("latin-1")
+        if name == "content-type":
+            key = "CONTENT_TYPE"
+        elif name == "content-length":
+            key = "CONTENT_LENGTH"
+        else:
+            key = "HTTP_" + name.upper().replace("-", "_")
+        environ[key] = f"{environ[key]},{value}" if key in environ else value
+    if body and "CONTENT_LENGTH" not in environ:
+        environ["CONTENT_LENGTH"] = str(len(body))  # the body is read whole, even if it came chunked
+    return environ
+
+
+def create_asgi_app():
+    return AsyncAPI(create_app(), wsgi_workers=WSGI_WORKERS)
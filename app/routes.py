@@ -1,17 +1,104 @@
-from flask import Blueprint, jsonify, request
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from flask import Blueprint, Response, jsonify, request, stream_with_context
+from typing import List, Literal, Optional
+
 from pydantic import BaseModel, ValidationError, Field
 
 from app.services.scraping import (
     get_wikipedia_intro_en,
+    get_wikipedia_intros,
     get_infobox_it,
     get_league_teams,
     get_live_league_ranking,
     scrape_top_scorers,
-    get_league_giornate
+    get_league_giornate,
+    stream_league_giornate,
+    prefetch_giornate,
+    leaguesGiornate,
+    season_pages,
+    season_sections,
+    scrapes
 )
+from app.services.analytics import SeasonColumns, overall_summary, season_summary
+from app.services.cache_backends import backend_from_env
+from app.services.circuit_breaker import breakers, last_good
+from app.services.leaderboard import aggregate_scorers
+from app.services.live_refresher import live_rankings
+from app.services.match_index import MatchIndex
+from app.services.response_cache import ResponseCache, is_success, season_is_over, ttl_for
+from app.services.response_encoding import response_encoder
+from app.services.season_store import season_store
+from app.services.standings import StandingsEngine
+from app.services.upstream_scheduler import upstream
 
 bp = Blueprint("api", __name__)
 
+response_cache = ResponseCache(
+    maxsize=int(os.environ.get("FOOTBALLAPI_RESPONSE_CACHE_SIZE", 1024)),
+    backend=backend_from_env(),
+)
+
+
+def cached(endpoint, scraper, *args, cacheable=is_success):
+    """
+    Calls scraper(*args) through the response cache, keyed by endpoint and arguments, then
+    through the persistent season store.
+    Arguments are (league,) or (league, start, end); the TTL depends on endpoint and season age.
+    """
+    ttl = ttl_for(endpoint, *args[1:])
+    return response_cache.get(
+        (endpoint,) + args,
+        ttl,
+        lambda: season_store.load_or_scrape(endpoint, scraper, args, ttl, cacheable),
+        cacheable=cacheable,
+    )
+
+
+def derived(endpoint, build, league: str, start: int, end: int):
+    """
+    Caches an object built from other cached endpoints, e.g. the MatchIndex of the gamedays.
+    It skips the season store: build reads its source through cached(), so a stored source
+    serves it, offline mode included.
+    """
+    return response_cache.get(
+        (endpoint, league, start, end),
+        ttl_for(endpoint, start, end),
+        lambda: build(league, start, end),
+    )
+
+
+def cached_many(endpoint, bulk_scraper, seasons, cacheable=is_success):
+    """
+    Batched cached(): seasons found in neither the response cache nor the season store are
+    fetched with one bulk_scraper call, e.g. get_wikipedia_intros.
+    """
+    keys = [(endpoint,) + season for season in seasons]
+    ttls = [ttl_for(endpoint, *season[1:]) for season in seasons]
+
+    ttl_of = dict(zip(keys, ttls))
+
+    def compute_many(missing):
+        return season_store.load_or_scrape_many(
+            endpoint, bulk_scraper, [key[1:] for key in missing], [ttl_of[key] for key in missing], cacheable
+        )
+
+    return response_cache.get_many(keys, ttls, compute_many, cacheable=cacheable)
+
+
+def live_ranking(league: str) -> dict:
+    """
+    Serves the standings kept warm by the background refresher (with their age and last
+    refresh error under 'meta'), falling back to a cached scrape for other leagues.
+    """
+    warm = live_rankings.get(league)
+    if warm is not None:
+        return warm
+    return cached("ranking", get_live_league_ranking, league)
+
 
 class LeagueSeasonParams(BaseModel):
     league: str = Field(..., min_length=2, max_length=30)
@@ -23,6 +110,209 @@ class LeagueParam(BaseModel):
     league: str = Field(..., min_length=2, max_length=30)
 
 
+class IntroRangeParams(BaseModel):
+    leagues: List[str] = Field(..., min_length=1, max_length=12)
+    start: int = Field(..., ge=1990, le=2100)
+    end: int = Field(..., ge=1990, le=2100)
+
+
+class ScorersRangeParams(BaseModel):
+    leagues: List[str] = Field(..., min_length=1, max_length=12)
+    start: int = Field(..., ge=1990, le=2100)
+    end: int = Field(..., ge=1990, le=2100)
+    limit: int = Field(20, ge=1, le=500)
+
+
+class GamedaysFilterParams(BaseModel):
+    matchday: Optional[int] = Field(None, ge=1, le=60)
+    from_matchday: Optional[int] = Field(None, ge=1, le=60)
+    to_matchday: Optional[int] = Field(None, ge=1, le=60)
+    team: Optional[str] = Field(None, min_length=2, max_length=40)
+    date: Optional[str] = Field(None, min_length=1, max_length=30)
+    page: int = Field(1, ge=1)
+    per_page: int = Field(50, ge=1, le=500)
+
+
+class StandingsParams(BaseModel):
+    matchday: Optional[int] = Field(None, ge=0, le=60)
+
+
+class AnalyticsParams(BaseModel):
+    leagues: List[str] = Field(..., min_length=1, max_length=12)
+    start: int = Field(..., ge=1990, le=2100)
+    end: int = Field(..., ge=1990, le=2100)
+    form: int = Field(5, ge=1, le=38)
+
+
+class StreamParams(BaseModel):
+    format: Literal["json", "ndjson"] = "json"
+    unit: Literal["matchday", "match"] = "matchday"
+
+
+class GamedaysExportParams(BaseModel):
+    leagues: List[str] = Field(..., min_length=1, max_length=12)
+    start: int = Field(..., ge=1990, le=2100)
+    end: int = Field(..., ge=1990, le=2100)
+
+
+def gamedays_cacheable(data: str) -> bool:
+    # get_league_giornate returns a JSON list on success, a JSON error object otherwise
+    return isinstance(data, str) and data.startswith("[")
+
+
+def season_gamedays(league: str, start: int, end: int):
+    """
+    Returns the matchdays of a season as a list, from the cached or stored gamedays payload,
+    or the gamedays error dict.
+    """
+    data = cached("gamedays", get_league_giornate, league, start, end, cacheable=gamedays_cacheable)
+    if isinstance(data, str):
+        data = json.loads(data)
+    return data
+
+
+def gamedays_index(league: str, start: int, end: int):
+    """
+    Builds the MatchIndex of a season, or returns the gamedays error dict.
+    """
+    data = season_gamedays(league, start, end)
+    return data if isinstance(data, dict) else MatchIndex(data)
+
+
+def season_columns(league: str, start: int, end: int):
+    """
+    Loads the played matches of a season into SeasonColumns, or returns the gamedays error dict.
+    """
+    data = season_gamedays(league, start, end)
+    return data if isinstance(data, dict) else SeasonColumns(data)
+
+
+def standings_engine(league: str, start: int, end: int):
+    """
+    Builds the StandingsEngine (all matchday snapshots) of a season, or returns the gamedays error dict.
+    """
+    data = season_gamedays(league, start, end)
+    return data if isinstance(data, dict) else StandingsEngine(data)
+
+
+
+class GamedaysUnavailable(LookupError):
+    """
+    The matchdays of a season cannot be served: offline and not stored, or a stored error.
+    """
+
+
+def iter_season_gamedays(league: str, start: int, end: int):
+    """
+    Yields the matchdays of a season one at a time: from the response cache or the season store
+    when they already hold it, otherwise straight from the page as its tables are extracted.
+
+    Raises:
+        GamedaysUnavailable: if the season is neither cached nor stored in offline mode, or
+        the cached payload is an error
+        KeyError: if league is not in leaguesGiornate and the page has to be downloaded
+        requests.RequestException: if the page cannot be downloaded
+    """
+    data = response_cache.peek(("gamedays", league, start, end))
+    if data is None and (season_store.offline or season_is_over(end)):
+        stored = season_store.get("gamedays", league, start, end)
+        data = stored[0] if stored else None
+    if data is None and season_store.offline:
+        raise GamedaysUnavailable("Offline mode: this data is not available in the local store.")
+
+    if isinstance(data, str):
+        data = json.loads(data)
+    if isinstance(data, list):
+        yield from data
+    elif data is not None:
+        raise GamedaysUnavailable(data.get("error") if isinstance(data, dict) else "Invalid gamedays data.")
+    else:
+        yield from stream_league_giornate(league, start, end)
+
+
+def ndjson_lines(league: str, start: int, end: int, unit: str):
+    """
+    Serializes a season as newline-delimited JSON, one matchday or one match per line.
+    Errors are reported as a final {'success': false, ...} line since headers are already sent.
+    """
+    def line(obj):
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+    season = {"league": league, "start": start, "end": end}
+    if league not in leaguesGiornate:
+        yield line({**season, "success": False, "error": f"Chiave lega '{league}' non trovata nel dizionario."})
+        return
+    try:
+        for matchday, rows in enumerate(iter_season_gamedays(league, start, end), start=1):
+            if unit == "match":
+                for match in rows:
+                    yield line({**season, "matchday": matchday, **match})
+            else:
+                yield line({**season, "matchday": matchday, "matches": rows})
+    except (GamedaysUnavailable, requests.RequestException) as e:
+        yield line({**season, "success": False, "error": str(e)})
+
+
+# endpoint name -> (scraper, params model, cacheable predicate)
+ENDPOINTS = {
+    "intro": (get_wikipedia_intro_en, LeagueSeasonParams, is_success),
+    "infobox": (get_infobox_it, LeagueSeasonParams, is_success),
+    "teams": (get_league_teams, LeagueSeasonParams, is_success),
+    "ranking": (get_live_league_ranking, LeagueParam, is_success),
+    "scorers": (scrape_top_scorers, LeagueSeasonParams, is_success),
+    "gamedays": (get_league_giornate, LeagueSeasonParams, gamedays_cacheable),
+}
+
+BATCH_MAX_ITEMS = int(os.environ.get("FOOTBALLAPI_BATCH_MAX_ITEMS", 50))
+# Upper bound of league seasons (leagues x years) requested by one multi-season call
+RANGE_MAX_SEASONS = int(os.environ.get("FOOTBALLAPI_RANGE_MAX_SEASONS", 100))
+batch_pool = ThreadPoolExecutor(
+    max_workers=int(os.environ.get("FOOTBALLAPI_BATCH_WORKERS", 8)),
+    thread_name_prefix="batch",
+)
+# Multi-season routes fan out on their own pool, so a wide range never queues ahead of /batch items
+range_pool = ThreadPoolExecutor(
+    max_workers=int(os.environ.get("FOOTBALLAPI_RANGE_WORKERS", 8)),
+    thread_name_prefix="range",
+)
+
+
+def parse_season_range(model, **fields):
+    """
+    Validates the query of a multi-season route: 'league' (repeatable or comma separated),
+    'start' and 'end', plus the route's own fields, and lists the seasons it covers.
+
+    Args:
+        model (type): Params model with leagues, start and end fields
+        **fields: Other fields of the model, already read from the query
+
+    Returns:
+        tuple: (params, seasons) with seasons as (league, start, end) tuples
+
+    Raises:
+        ValueError: on invalid parameters (ValidationError included), when 'end' is not
+        greater than 'start' or when more than RANGE_MAX_SEASONS seasons are requested
+        TypeError: when 'start' or 'end' is missing
+    """
+    params = model(
+        leagues=[l for arg in request.args.getlist("league") for l in arg.split(",") if l],
+        start=int(request.args.get("start")),
+        end=int(request.args.get("end")),
+        **fields,
+    )
+    if params.end <= params.start:
+        raise ValueError("'end' must be greater than 'start'.")
+
+    seasons = [
+        (league, year, year + 1)
+        for league in dict.fromkeys(params.leagues)
+        for year in range(params.start, params.end)
+    ]
+    if len(seasons) > RANGE_MAX_SEASONS:
+        raise ValueError(f"At most {RANGE_MAX_SEASONS} league seasons per request, {len(seasons)} requested.")
+    return params, seasons
+
+
 @bp.route("/intro", methods=["GET"])
 def wikipedia_intro():
     """
@@ -57,7 +347,50 @@ def wikipedia_intro():
     except (ValidationError, TypeError, ValueError) as e:
         return jsonify({"success": False, "error": str(e)}), 400
     
-    return jsonify(get_wikipedia_intro_en(params.league,params.start, params.end))
+    return jsonify(cached("intro", get_wikipedia_intro_en, params.league, params.start, params.end))
+
+
+@bp.route("/intro/range", methods=["GET"])
+def wikipedia_intro_range():
+    """
+    Get the introductions of many league seasons, fetched in bulk from the Wikipedia API
+    ---
+    parameters:
+      - name: league
+        in: query
+        type: array
+        items:
+          type: string
+        collectionFormat: multi
+        required: true
+        description: league name, repeatable or comma separated (e.g. SerieA,PremierLeague)
+      - name: start
+        in: query
+        type: integer
+        required: true
+        description: Start year of the first season
+      - name: end
+        in: query
+        type: integer
+        required: true
+        description: End year of the last season
+    responses:
+      200:
+        description: One /intro result per league and season, with league, start and end
+      400:
+        description: Invalid parameters or more than FOOTBALLAPI_RANGE_MAX_SEASONS league seasons
+    """
+    try:
+        _, seasons = parse_season_range(IntroRangeParams)
+    except (ValidationError, TypeError, ValueError) as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+
+    results = cached_many("intro", get_wikipedia_intros, seasons)
+    data = [
+        {"league": league, "start": year_start, "end": year_end, **result}
+        for (league, year_start, year_end), result in zip(seasons, results)
+    ]
+    return jsonify({"success": True, "data": data, "error": None})
 
 
 @bp.route("/infobox", methods=["GET"])
@@ -95,7 +428,7 @@ def get_infoboxit():
         return jsonify({"success": False, "error": str(e)}), 400
     
 
-    return jsonify(get_infobox_it(params.league, params.start, params.end))
+    return jsonify(cached("infobox", get_infobox_it, params.league, params.start, params.end))
 
 
 @bp.route("/teams", methods=["GET"])
@@ -133,7 +466,7 @@ def get_league_teams_call():
         return jsonify({"success": False, "error": str(e)}), 400
     
 
-    return jsonify(get_league_teams(params.league, params.start, params.end))
+    return jsonify(cached("teams", get_league_teams, params.league, params.start, params.end))
 
 
 @bp.route("/ranking", methods=["GET"])
@@ -161,7 +494,7 @@ def ranking():
         return jsonify({"success": False, "error": str(e)}), 400
     
 
-    return jsonify(get_live_league_ranking(paramLeague.league))
+    return jsonify(live_ranking(paramLeague.league))
 
 
 @bp.route("/scorers", methods=["GET"])
@@ -199,16 +532,214 @@ def top_scorers():
         return jsonify({"success": False, "error": str(e)}), 400
     
 
-    data = scrape_top_scorers(params.league, params.start, params.end)
+    data = cached("scorers", scrape_top_scorers, params.league, params.start, params.end)
     return jsonify(data)
 
 
+@bp.route("/scorers/range", methods=["GET"])
+def top_scorers_range():
+    """
+    Get an aggregated top scorers leaderboard over a range of seasons and one or more leagues
+    ---
+    parameters:
+      - name: league
+        in: query
+        type: array
+        items:
+          type: string
+        collectionFormat: multi
+        required: true
+        description: league name, repeatable or comma separated (e.g. SerieA,PremierLeague)
+      - name: start
+        in: query
+        type: integer
+        required: true
+        description: Start year of the first season
+      - name: end
+        in: query
+        type: integer
+        required: true
+        description: End year of the last season
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        description: Number of players to return (default 20)
+    responses:
+      200:
+        description: Leaderboard with goals and appearances summed per player, plus per-season errors
+      400:
+        description: Invalid parameters or more than FOOTBALLAPI_RANGE_MAX_SEASONS league seasons
+    """
+    try:
+        params, seasons = parse_season_range(ScorersRangeParams, limit=int(request.args.get("limit", 20)))
+    except (ValidationError, TypeError, ValueError) as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+
+    # each season goes through the response cache, so repeated ranges only fetch what is missing
+    results = range_pool.map(lambda season: cached("scorers", scrape_top_scorers, *season), seasons)
+
+    found, errors = [], []
+    for (league, year_start, year_end), result in zip(seasons, results):
+        if result["success"]:
+            found.append((league, year_start, year_end, result["data"]))
+        else:
+            errors.append({"league": league, "start": year_start, "end": year_end, "error": result["error"]})
+
+    if not found:
+        return jsonify({"success": False, "data": None, "error": "No season could be retrieved.", "errors": errors})
+
+    return jsonify({
+        "success": True,
+        "data": {
+            "leaderboard": aggregate_scorers(found, params.limit),
+            "seasons": len(found),
+            "errors": errors,
+        },
+        "error": None
+    })
+
+
+@bp.route("/standings", methods=["GET"])
+def standings():
+    """
+    Get the league table of a season after any matchday, computed from the Wikipedia results
+    ---
+    parameters:
+      - name: league
+        in: query
+        type: string
+        required: true
+        description: league name
+      - name: start
+        in: query
+        type: integer
+        required: true
+        description: Start year of the season
+      - name: end
+        in: query
+        type: integer
+        required: true
+        description: End year of the season
+      - name: matchday
+        in: query
+        type: integer
+        required: false
+        description: Table after this matchday (default the last one, 0 for the initial table)
+    responses:
+      200:
+        description: Standings with played, won, drawn, lost, goals and points per team
+    """
+    try:
+        params = LeagueSeasonParams(
+            league=request.args.get("league"),
+            start=int(request.args.get("start")),
+            end=int(request.args.get("end")),
+        )
+        query = StandingsParams(matchday=request.args.get("matchday"))
+    except (ValidationError, TypeError, ValueError) as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+
+    engine = derived("standings", standings_engine, params.league, params.start, params.end)
+    if isinstance(engine, dict):
+        return jsonify(engine)
+    if query.matchday is not None and query.matchday > engine.rounds:
+        return jsonify({
+            "success": False,
+            "data": None,
+            "error": f"Matchday {query.matchday} not available, the season has {engine.rounds} matchdays."
+        })
+
+    matchday = engine.rounds if query.matchday is None else query.matchday
+    return jsonify({
+        "success": True,
+        "data": {
+            "matchday": matchday,
+            "rounds": engine.rounds,
+            "table": engine.table(matchday),
+        },
+        "error": None
+    })
+
+@bp.route("/analytics", methods=["GET"])
+def analytics():
+    """
+    Get season statistics (goals per matchday, home/away win rates, scoring distribution, team form)
+    ---
+    parameters:
+      - name: league
+        in: query
+        type: array
+        items:
+          type: string
+        collectionFormat: multi
+        required: true
+        description: league name, repeatable or comma separated (e.g. SerieA,PremierLeague)
+      - name: start
+        in: query
+        type: integer
+        required: true
+        description: Start year of the first season
+      - name: end
+        in: query
+        type: integer
+        required: true
+        description: End year of the last season
+      - name: form
+        in: query
+        type: integer
+        required: false
+        description: Number of last matches in each team's form (default 5)
+    responses:
+      200:
+        description: Per-season statistics and totals over all requested seasons
+      400:
+        description: Invalid parameters or more than FOOTBALLAPI_RANGE_MAX_SEASONS league seasons
+    """
+    try:
+        params, seasons = parse_season_range(AnalyticsParams, form=int(request.args.get("form", 5)))
+    except (ValidationError, TypeError, ValueError) as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+
+    results = range_pool.map(lambda season: derived("analytics", season_columns, *season), seasons)
+
+    found, summaries, errors = [], [], []
+    for (league, year_start, year_end), columns in zip(seasons, results):
+        if isinstance(columns, dict):
+            errors.append({"league": league, "start": year_start, "end": year_end, "error": columns.get("error")})
+            continue
+        found.append(columns)
+        summaries.append({
+            "league": league,
+            "start": year_start,
+            "end": year_end,
+            **season_summary(columns, params.form),
+        })
+
+    if not found:
+        return jsonify({"success": False, "data": None, "error": "No season could be retrieved.", "errors": errors})
+
+    return jsonify({
+        "success": True,
+        "data": {
+            "seasons": summaries,
+            "overall": overall_summary(found),
+            "errors": errors,
+        },
+        "error": None
+    })
+
 @bp.route("/gamedays", methods=["GET"])
 def giornate():
     """
     Get the full matchday schedule for a Serie A season from Wikipedia
     ---
     parameters:
+      - name: league
+        in: query
+        type: string
+        required: true
+        description: league name
       - name: start
         in: query
         type: integer
@@ -219,9 +750,56 @@ def giornate():
         type: integer
         required: true
         description: End year of the season
+      - name: matchday
+        in: query
+        type: integer
+        required: false
+        description: Only this matchday (1-based)
+      - name: from_matchday
+        in: query
+        type: integer
+        required: false
+        description: First matchday of a range
+      - name: to_matchday
+        in: query
+        type: integer
+        required: false
+        description: Last matchday of a range
+      - name: team
+        in: query
+        type: string
+        required: false
+        description: Only matches of this team (full or partial name, case insensitive)
+      - name: date
+        in: query
+        type: string
+        required: false
+        description: Only matches played on this date, as written on Wikipedia
+      - name: page
+        in: query
+        type: integer
+        required: false
+        description: Page number of the filtered matches (default 1)
+      - name: per_page
+        in: query
+        type: integer
+        required: false
+        description: Matches per page (default 50)
+      - name: format
+        in: query
+        type: string
+        enum: [json, ndjson]
+        required: false
+        description: ndjson streams the season as newline-delimited JSON (filters are ignored)
+      - name: unit
+        in: query
+        type: string
+        enum: [matchday, match]
+        required: false
+        description: One NDJSON line per matchday (default) or per match
     responses:
       200:
-        description: JSON with full matchday schedule
+        description: JSON with full matchday schedule, or a page of matches when filters/pagination are used
     """
 
     try:
@@ -230,9 +808,201 @@ def giornate():
             start=int(request.args.get("start")),
             end=int(request.args.get("end")),
         )
+        filters = GamedaysFilterParams(**{
+            name: request.args.get(name)
+            for name in GamedaysFilterParams.model_fields
+            if request.args.get(name) is not None
+        })
+        stream = StreamParams(
+            format=request.args.get("format", "json"),
+            unit=request.args.get("unit", "matchday"),
+        )
     except (ValidationError, TypeError, ValueError) as e:
         return jsonify({"success": False, "error": str(e)}), 400
     
 
-    data = get_league_giornate(params.league, params.start, params.end)
-    return data  # JSON string
+    if stream.format == "ndjson":
+        lines = ndjson_lines(params.league, params.start, params.end, stream.unit)
+        return Response(stream_with_context(lines), mimetype="application/x-ndjson")
+
+    if filters.model_fields_set:
+        index = derived("gamedays_index", gamedays_index, params.league, params.start, params.end)
+        if isinstance(index, dict):
+            return jsonify(index)
+        positions = index.query(
+            matchday=filters.matchday,
+            from_matchday=filters.from_matchday,
+            to_matchday=filters.to_matchday,
+            team=filters.team,
+            date=filters.date,
+        )
+        return jsonify({"success": True, "data": index.page(positions, filters.page, filters.per_page), "error": None})
+
+    data = cached(
+        "gamedays", get_league_giornate, params.league, params.start, params.end,
+        cacheable=gamedays_cacheable,
+    )
+    if isinstance(data, dict):
+        return jsonify(data)
+    return Response(data, mimetype="application/json")  # already a JSON string
+
+
+@bp.route("/gamedays/export", methods=["GET"])
+def giornate_export():
+    """
+    Stream the matchdays of many seasons and leagues as newline-delimited JSON
+    ---
+    parameters:
+      - name: league
+        in: query
+        type: array
+        items:
+          type: string
+        collectionFormat: multi
+        required: true
+        description: league name, repeatable or comma separated (e.g. SerieA,PremierLeague)
+      - name: start
+        in: query
+        type: integer
+        required: true
+        description: Start year of the first season
+      - name: end
+        in: query
+        type: integer
+        required: true
+        description: End year of the last season
+      - name: unit
+        in: query
+        type: string
+        enum: [matchday, match]
+        required: false
+        description: One line per matchday (default) or per match
+    responses:
+      200:
+        description: NDJSON stream; every line carries league, start, end and matchday
+      400:
+        description: Invalid parameters or more than FOOTBALLAPI_RANGE_MAX_SEASONS league seasons
+    """
+    try:
+        _, seasons = parse_season_range(GamedaysExportParams)
+        stream = StreamParams(format="ndjson", unit=request.args.get("unit", "matchday"))
+    except (ValidationError, TypeError, ValueError) as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+
+    def export():
+        for position, season in enumerate(seasons):
+            # download the next season while this one is being streamed
+            if position + 1 < len(seasons) and not season_store.offline:
+                range_pool.submit(prefetch_giornate, *seasons[position + 1])
+            yield from ndjson_lines(*season, stream.unit)
+
+    return Response(stream_with_context(export()), mimetype="application/x-ndjson")
+
+
+def resolve_batch_item(item) -> dict:
+    """
+    Validates and runs one batch item, returning it in the {'success', 'data', 'error'} shape.
+    """
+    if not isinstance(item, dict) or item.get("endpoint") not in ENDPOINTS:
+        return {
+            "success": False,
+            "data": None,
+            "error": f"Unknown endpoint, expected one of: {', '.join(ENDPOINTS)}."
+        }
+
+    endpoint = item["endpoint"]
+    scraper, model, cacheable = ENDPOINTS[endpoint]
+    try:
+        params = model(**{k: v for k, v in item.items() if k != "endpoint"})
+    except (ValidationError, TypeError, ValueError) as e:
+        return {"success": False, "data": None, "error": str(e)}
+
+    args = tuple(params.model_dump().values())
+    try:
+        if endpoint == "ranking":
+            result = live_ranking(*args)
+        else:
+            result = cached(endpoint, scraper, *args, cacheable=cacheable)
+    except Exception as e:
+        return {"success": False, "data": None, "error": f"Internal error: {str(e)}"}
+
+    if endpoint == "gamedays" and isinstance(result, str):
+        result = json.loads(result)
+        if isinstance(result, list):
+            return {"success": True, "data": result, "error": None}
+    return result
+
+
+@bp.route("/batch", methods=["POST"])
+def batch():
+    """
+    Resolve many endpoint/league/season queries concurrently in a single call
+    ---
+    parameters:
+      - name: body
+        in: body
+        required: true
+        schema:
+          type: object
+          properties:
+            items:
+              type: array
+              items:
+                type: object
+                properties:
+                  endpoint:
+                    type: string
+                    enum: [intro, infobox, teams, ranking, scorers, gamedays]
+                  league:
+                    type: string
+                  start:
+                    type: integer
+                  end:
+                    type: integer
+          example:
+            items:
+              - {endpoint: ranking, league: SerieA}
+              - {endpoint: scorers, league: PremierLeague, start: 2022, end: 2023}
+    responses:
+      200:
+        description: One result per item, in request order, each with its own success/data/error
+      400:
+        description: Malformed body or too many items
+    """
+    body = request.get_json(silent=True)
+    items = body.get("items") if isinstance(body, dict) else None
+    if not isinstance(items, list) or not items:
+        return jsonify({"success": False, "error": "Body must be a JSON object with a non-empty 'items' list."}), 400
+    if len(items) > BATCH_MAX_ITEMS:
+        return jsonify({"success": False, "error": f"At most {BATCH_MAX_ITEMS} items per batch."}), 400
+
+    # results may be shared cache entries: copy them instead of adding keys in place
+    results = [
+        {"request": item, **result}
+        for item, result in zip(items, batch_pool.map(resolve_batch_item, items))
+    ]
+    return jsonify({"success": True, "data": results, "error": None})
+
+
+@bp.route("/cache", methods=["GET"])
+def cache_stats():
+    """
+    Get cache and request coalescing counters
+    ---
+    responses:
+      200:
+        description: Page cache, response cache, season store, coalescing, encoding, upstream queue and circuit breaker counters
+    """
+    stats = {
+        "pages": season_pages.stats(),
+        "sections": season_sections.stats(),
+        "responses": response_cache.stats(),
+        "coalesced": scrapes.stats(),
+        "live": live_rankings.stats(),
+        "store": season_store.stats(),
+        "encoding": response_encoder.stats(),
+        "upstream": upstream.stats(),
+        "circuits": breakers.stats(),
+        "last_good": last_good.stats(),
+    }
+    return jsonify({"success": True, "data": stats, "error": None})
@@ -0,0 +1,121 @@
+import numpy as np
+
+from app.services.match_index import side_counts, split_match
+from app.services.standings import parse_result
+
+
+class SeasonColumns:
+    """
+    Played matches of a season (as returned by get_league_giornate) stored column-wise:
+    matchday, home/away team indexes into 'teams' and home/away goals, one NumPy array each.
+    """
+
+    def __init__(self, giornate: list):
+        counts = side_counts(giornate)
+        rows = [
+            (matchday, *result)
+            for matchday, matches in enumerate(giornate, start=1)
+            for result in (parse_result(match, counts) for match in matches) if result
+        ]
+        names = {team for matches in giornate for m in matches for team in split_match(m.get("match") or "", counts)}
+        self.teams = sorted(names)
+        index = {team: i for i, team in enumerate(self.teams)}
+
+        self.rounds = len(giornate)
+        self.matchday = np.array([r[0] for r in rows], dtype=np.int16)
+        self.home = np.array([index[r[1]] for r in rows], dtype=np.int16)
+        self.away = np.array([index[r[2]] for r in rows], dtype=np.int16)
+        self.home_goals = np.array([r[3] for r in rows], dtype=np.int16)
+        self.away_goals = np.array([r[4] for r in rows], dtype=np.int16)
+
+    def __len__(self) -> int:
+        return len(self.matchday)
+
+
+def _outcome_rates(home_goals, away_goals) -> dict:
+    matches = len(home_goals)
+    if not matches:
+        return {"home_win_rate": 0.0, "draw_rate": 0.0, "away_win_rate": 0.0}
+    return {
+        "home_win_rate": round(float(np.mean(home_goals > away_goals)), 4),
+        "draw_rate": round(float(np.mean(home_goals == away_goals)), 4),
+        "away_win_rate": round(float(np.mean(home_goals < away_goals)), 4),
+    }
+
+
+def _distribution(values) -> dict:
+    counts = np.bincount(values) if len(values) else np.array([], dtype=np.int64)
+    return {str(goals): int(count) for goals, count in enumerate(counts) if count}
+
+
+def team_form(columns: SeasonColumns, window: int = 5) -> dict:
+    """
+    Last results of every team, oldest first, e.g. {'Inter': {'form': 'WWDLW', 'points': 10}}.
+    """
+    # every match seen from both sides: (team, matchday, goals for, goals against)
+    team = np.concatenate([columns.home, columns.away])
+    matchday = np.concatenate([columns.matchday, columns.matchday])
+    scored = np.concatenate([columns.home_goals, columns.away_goals])
+    conceded = np.concatenate([columns.away_goals, columns.home_goals])
+    points = np.where(scored > conceded, 3, np.where(scored == conceded, 1, 0))
+    letters = np.array(["L", "D", "W"])[np.sign(scored.astype(np.int32) - conceded) + 1]
+
+    order = np.lexsort((matchday, team))
+    team, points, letters = team[order], points[order], letters[order]
+    starts = np.searchsorted(team, np.arange(len(columns.teams)))
+    ends = np.searchsorted(team, np.arange(len(columns.teams)), side="right")
+
+    return {
+        name: {
+            "form": "".join(letters[max(start, end - window):end]),
+            "points": int(points[max(start, end - window):end].sum()),
+        }
+        for name, start, end in zip(columns.teams, starts, ends)
+    }
+
+
+def season_summary(columns: SeasonColumns, form_window: int = 5) -> dict:
+    """
+    Returns:
+        dict: {
+            'matches': int,
+            'goals': int,
+            'goals_per_match': float,
+            'goals_per_matchday': list[int],
+            'home_win_rate': float,
+            'draw_rate': float,
+            'away_win_rate': float,
+            'goal_distribution': dict[str, int],
+            'form': dict[str, dict]
+        }
+    """
+    total = columns.home_goals.astype(np.int32) + columns.away_goals
+    per_matchday = np.bincount(columns.matchday, weights=total, minlength=columns.rounds + 1)[1:]
+    return {
+        "matches": len(columns),
+        "goals": int(total.sum()),
+        "goals_per_match": round(float(total.mean()), 3) if len(columns) else 0.0,
+        "goals_per_matchday": [int(goals) for goals in per_matchday],
+        **_outcome_rates(columns.home_goals, columns.away_goals),
+        "goal_distribution": _distribution(total),
+        "form": team_form(columns, form_window),
+    }
+
+
+def overall_summary(seasons: list) -> dict:
+    """
+    Aggregates several SeasonColumns into league-independent totals.
+    """
+    empty = [np.zeros(0, dtype=np.int16)]
+    home_goals = np.concatenate([s.home_goals for s in seasons] or empty)
+    away_goals = np.concatenate([s.away_goals for s in seasons] or empty)
+    total = home_goals.astype(np.int32) + away_goals
+    return {
+        "matches": len(total),
+        "goals": int(total.sum()),
+        "goals_per_match": round(float(total.mean()), 3) if len(total) else 0.0,
+        **_outcome_rates(home_goals, away_goals),
+        "home_goals_per_match": round(float(home_goals.mean()), 3) if len(total) else 0.0,
+        "away_goals_per_match": round(float(away_goals.mean()), 3) if len(total) else 0.0,
+        "goal_distribution": _distribution(total),
+    }
@@ -0,0 +1,149 @@
+import asyncio
+import os
+import time
+import weakref
+from urllib.parse import urlparse
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from app.services import http_client, metrics
+from app.services.circuit_breaker import CircuitOpen, breakers
+from app.services.http_client import (
+    BACKOFF,
+    DEFAULT_HEADERS,
+    FAILURE_STATUSES,
+    POOL_SIZE,
+    RETRIES,
+    RETRY_STATUSES,
+    TIMEOUT,
+)
+from app.services.upstream_scheduler import UpstreamBusy, upstream
+
+
+# Upper bound of concurrent upstream connections per event loop (httpx only)
+MAX_CONNECTIONS = int(os.environ.get("FOOTBALLAPI_ASYNC_MAX_CONNECTIONS", 100))
+
+# One httpx.AsyncClient per event loop, since its connections belong to the loop
+_clients = weakref.WeakKeyDictionary()
+
+
+def get_client():
+    """
+    Returns the httpx.AsyncClient of the running event loop, creating it on first use.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = _clients[loop] = httpx.AsyncClient(
+            headers=DEFAULT_HEADERS,
+            follow_redirects=True,  # like requests: Wikipedia redirects renamed season titles
+            limits=httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=POOL_SIZE),
+        )
+    return client
+
+
+async def aclose():
+    """
+    Closes the client of the running event loop, e.g. on ASGI lifespan shutdown.
+    """
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+async def get(url: str, params: dict = None, headers: dict = None, timeout: float = None,
+              priority: int = None) -> requests.Response:
+    """
+    Coroutine version of http_client.get(): same upstream scheduler, circuit breakers, retries
+    and metrics, with the request sent by httpx so that no thread waits on the network.
+    Without httpx installed, the blocking client runs in the default executor instead.
+
+    Returns:
+        requests.Response: the response, so that scrapers handle both engines alike
+
+    Raises:
+        requests.RequestException: on network errors once the retries are exhausted,
+        UpstreamBusy when no slot is granted in time, or CircuitOpen while the host is failing
+    """
+    if httpx is None:
+        return await asyncio.to_thread(http_client.get, url, params, headers, timeout, priority)
+
+    host = urlparse(url).hostname
+    breaker = breakers.get(host)
+    try:
+        breaker.before_request()
+    except CircuitOpen:
+        metrics.upstream_errors.inc(host, "circuit_open")
+        raise
+    try:
+        await upstream.acquire_async(host, priority)
+    except UpstreamBusy:
+        breaker.cancel()
+        metrics.upstream_errors.inc(host, "busy")
+        raise
+
+    started = time.perf_counter()
+    try:
+        response = await _send(url, params, headers, TIMEOUT if timeout is None else timeout)
+    except requests.RequestException as e:
+        breaker.record_failure()
+        metrics.upstream_errors.inc(host, http_client._failure_cause(e))
+        raise
+    finally:
+        metrics.upstream_duration.observe(time.perf_counter() - started, host)
+
+    metrics.upstream_bytes.inc(host, amount=len(response.content))
+    if response.status_code in FAILURE_STATUSES:
+        breaker.record_failure()
+        metrics.upstream_errors.inc(host, f"http_{response.status_code}")
+    else:
+        breaker.record_success()
+    return response
+
+
+async def _send(url: str, params: dict, headers: dict, timeout: float) -> requests.Response:
+    # the retry policy of http_client: connection errors and RETRY_STATUSES, exponential backoff
+    if params:
+        # encode values the way requests does (e.g. True -> 'True')
+        params = {key: value if isinstance(value, (str, bytes)) else str(value) for key, value in params.items()}
+    attempt = 0
+    while True:
+        try:
+            reply = await get_client().get(url, params=params, headers=headers, timeout=timeout)
+        except httpx.TimeoutException as e:
+            if attempt >= RETRIES:
+                raise requests.Timeout(str(e) or type(e).__name__) from e
+            delay = BACKOFF * 2 ** attempt
+        except httpx.TransportError as e:
+            if attempt >= RETRIES:
+                raise requests.ConnectionError(str(e) or type(e).__name__) from e
+            delay = BACKOFF * 2 ** attempt
+        else:
+            if reply.status_code not in RETRY_STATUSES or attempt >= RETRIES:
+                return _to_response(reply)
+            delay = _retry_after(reply) or BACKOFF * 2 ** attempt
+        attempt += 1
+        await asyncio.sleep(delay)
+
+
+def _retry_after(reply) -> float:
+    value = reply.headers.get("Retry-After", "")
+    return float(value) if value.isdigit() else 0.0
+
+
+def _to_response(reply) -> requests.Response:
+    response = requests.Response()
+    response.status_code = reply.status_code
+    response.reason = reply.reason_phrase
+    response.url = str(reply.url)
+    response.headers = CaseInsensitiveDict(reply.headers)
+    response.encoding = get_encoding_from_headers(response.headers)
+    response._content = reply.content
+    return response
@@ -0,0 +1,349 @@
+import asyncio
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from app.services import async_http
+from app.services.circuit_breaker import last_good
+from app.services.metrics import timed_scraper
+from app.services.page_cache import normalize_title
+from app.services.scraping import (
+    EUROSPORT_HOST,
+    EUROSPORT_URL,
+    INTRO_BATCH_SIZE,
+    WIKI_FETCH,
+    WIKIPEDIA_HOST,
+    WIKIPEDIA_URL,
+    leagues,
+    leaguesGiornate,
+    leaguesRank,
+    leaguesScorers,
+    season_pages,
+    season_sections,
+    _intro_params,
+    _intro_results,
+    _intro_titles,
+    _merge_intro_pages,
+    _parse_giornate,
+    _parse_infobox,
+    _parse_ranking,
+    _parse_scorers,
+    _parse_teams,
+    _store_season_page,
+)
+from app.services.singleflight import AsyncSingleFlight
+from app.services.upstream_scheduler import LIVE
+from app.services.wiki_sections import LEAD, SectionMissing, parse_reply, section_key
+
+
+# Threads building BeautifulSoup trees, so that parsing never blocks the event loop
+PARSE_WORKERS = int(os.environ.get("FOOTBALLAPI_PARSE_WORKERS", os.cpu_count() or 4))
+
+parse_pool = ThreadPoolExecutor(max_workers=PARSE_WORKERS, thread_name_prefix="parse")
+
+# Concurrent identical scrapes on the event loop share a single upstream fetch
+flights = AsyncSingleFlight()
+
+
+async def in_parse_pool(fn, *args):
+    return await asyncio.get_running_loop().run_in_executor(parse_pool, fn, *args)
+
+
+async def memo(page, name: str, extract):
+    """
+    CachedPage.memo() run in the parse pool, unless the result is already memoized.
+    """
+    if page.has_memo(name):
+        return page.memo(name, extract)
+    return await in_parse_pool(page.memo, name, extract)
+
+
+async def get_season_page(page_title: str):
+    """
+    Coroutine version of scraping.get_season_page(), sharing its page cache.
+
+    Raises:
+        requests.RequestException: if the page cannot be downloaded and no copy is cached
+    """
+    page = season_pages.get(page_title)
+    if page is None or not page.is_fresh(season_pages.ttl):
+        page = await flights.do(("page", normalize_title(page_title)), lambda: _download_season_page(page_title, page))
+    return page
+
+
+async def _download_season_page(page_title: str, cached=None):
+    url = f"{WIKIPEDIA_URL}/wiki/{page_title}"
+    try:
+        response = await async_http.get(url, headers=cached.conditional_headers() if cached else None)
+        if response.status_code != 304:
+            response.raise_for_status()
+    except requests.RequestException:
+        if cached is None:
+            raise
+        season_pages.unreachable(cached)
+        return cached  # serve the previous copy while Wikipedia is unreachable
+
+    return await in_parse_pool(_store_season_page, page_title, response, cached)
+
+
+async def season_section(page_title: str, anchor=LEAD):
+    """
+    Coroutine version of SectionFetcher.section(), sharing the indexes and sections of
+    scraping.season_sections.
+
+    Raises:
+        SectionMissing: if the page or the section does not exist
+        requests.RequestException: on network errors
+    """
+    title = normalize_title(page_title)
+    index = season_sections.cached_index(title)
+    if index is None:
+        index = await flights.do(("sections", title), lambda: _fetch_section_index(title))
+    number = index.number(anchor)
+    page = season_sections.cached_section(index, number)
+    if page is None:
+        page = await flights.do(
+            ("section", section_key(index, number), index.revision), lambda: _fetch_section(index, number)
+        )
+    return page
+
+
+async def _fetch_section_index(title: str):
+    return season_sections.store_index(title, await _query_sections(season_sections.index_params(title)))
+
+
+async def _fetch_section(index, number: int):
+    return season_sections.store_section(index, number, await _query_sections(season_sections.section_params(index, number)))
+
+
+async def _query_sections(params: dict) -> dict:
+    response = await async_http.get(season_sections.api_url, params=params)
+    response.raise_for_status()
+    return parse_reply(response.json())
+
+
+async def season_extract(page_title: str, anchor, name: str, extract) -> dict:
+    """
+    Coroutine version of scraping.season_extract(): the section alone when WIKI_FETCH is
+    'sections', the full page otherwise or as a fallback.
+    """
+    cached = season_pages.peek(page_title)
+    if WIKI_FETCH == "sections" and (cached is None or not cached.is_fresh(season_pages.ttl)):
+        try:
+            result = await memo(await season_section(page_title, anchor), name, extract)
+            if result["success"]:
+                return result
+        except (SectionMissing, requests.RequestException):
+            pass
+        season_sections.record_fallback()
+    return await memo(await get_season_page(page_title), name, extract)
+
+
+@flights.wrap(aliases=leagues)
+async def get_wikipedia_intro_en(league_key: str, year_start: int, year_end: int) -> dict:
+    """
+    Coroutine version of scraping.get_wikipedia_intro_en().
+    """
+    return (await get_wikipedia_intros([(league_key, year_start, year_end)]))[0]
+
+
+@timed_scraper
+async def get_wikipedia_intros(seasons: list) -> list:
+    """
+    Coroutine version of scraping.get_wikipedia_intros(): the batches of INTRO_BATCH_SIZE
+    titles are requested concurrently.
+    """
+    results, titles = _intro_titles(seasons)
+    batch = list(titles)
+    chunks = [batch[offset:offset + INTRO_BATCH_SIZE] for offset in range(0, len(batch), INTRO_BATCH_SIZE)]
+    for fetched in await asyncio.gather(*(_fetch_intros(chunk) for chunk in chunks)):
+        for page_title, result in fetched.items():
+            for position in titles[page_title]:
+                results[position] = last_good.resolve(WIKIPEDIA_HOST, ("intro",) + tuple(seasons[position]), result)
+    return results
+
+
+async def _fetch_intros(page_titles: list) -> dict:
+    url = f"{WIKIPEDIA_URL}/w/api.php"
+    params = _intro_params(page_titles)
+
+    try:
+        pages, normalized = {}, {}
+        while True:
+            response = await async_http.get(url, params=params)
+            response.raise_for_status()
+            data = response.json()
+
+            _merge_intro_pages(data, pages, normalized)
+            if "continue" not in data:
+                break
+            params = {**params, **data["continue"]}
+
+    except requests.RequestException as e:
+        return dict.fromkeys(page_titles, {
+            "success": False,
+            "data": None,
+            "error": f"Request error: {str(e)}"
+        })
+    except Exception as e:
+        return dict.fromkeys(page_titles, {
+            "success": False,
+            "data": None,
+            "error": f"Internal error: {str(e)}"
+        })
+
+    return await in_parse_pool(_intro_results, page_titles, pages, normalized)
+
+
+@flights.wrap(aliases=leagues)
+@last_good.wrap(WIKIPEDIA_HOST)
+@timed_scraper
+async def get_infobox_it(league_key: str, year_start: int, year_end: int) -> dict:
+    """
+    Coroutine version of scraping.get_infobox_it().
+    """
+    if league_key not in leagues:
+        return {
+            "success": False,
+            "data": None,
+            "error": f"League key '{league_key}' not found in dictionary."
+        }
+
+    page_title = f"{leagues[league_key].rstrip('_')}_{year_start}-{year_end}"
+    try:
+        return await season_extract(page_title, LEAD, "infobox", _parse_infobox)
+
+    except requests.RequestException as e:
+        return {
+            "success": False,
+            "data": None,
+            "error": f"Request error: {str(e)}"
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "data": None,
+            "error": f"Parsing error: {str(e)}"
+        }
+
+
+@flights.wrap(aliases=leagues)
+@last_good.wrap(WIKIPEDIA_HOST)
+@timed_scraper
+async def get_league_teams(league_key: str, year_start: int, year_end: int) -> dict:
+    """
+    Coroutine version of scraping.get_league_teams().
+    """
+    if league_key not in leagues:
+        return {
+            "success": False,
+            "data": None,
+            "error": f"League key '{league_key}' not found in dictionary."
+        }
+
+    page_title = f"{leagues[league_key].rstrip('_')}_{year_start}-{year_end}"
+    try:
+        return await season_extract(page_title, "Squadre_partecipanti", "teams", _parse_teams)
+
+    except requests.RequestException as e:
+        return {
+            "success": False,
+            "data": None,
+            "error": f"Request error: {str(e)}"
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "data": None,
+            "error": f"Parsing error: {str(e)}"
+        }
+
+
+@flights.wrap(aliases=leaguesRank)
+@last_good.wrap(EUROSPORT_HOST)
+@timed_scraper
+async def get_live_league_ranking(league_key: str) -> dict:
+    """
+    Coroutine version of scraping.get_live_league_ranking().
+    """
+    if league_key not in leaguesRank:
+        return {
+            "success": False,
+            "data": None,
+            "error": f"League key '{league_key}' not found in leaguesRank dictionary."
+        }
+
+    url = f"{EUROSPORT_URL}/calcio/{leaguesRank[league_key]}/classifica.shtml"
+    try:
+        response = await async_http.get(url, priority=LIVE)
+        response.raise_for_status()
+
+        return await in_parse_pool(_parse_ranking, response.content)
+
+    except requests.RequestException as e:
+        return {'success': False, 'data': None, 'error': f'Request error: {str(e)}'}
+    except Exception as e:
+        return {'success': False, 'data': None, 'error': f'Parsing error: {str(e)}'}
+
+
+@flights.wrap(aliases=leaguesScorers)
+@last_good.wrap(EUROSPORT_HOST)
+@timed_scraper
+async def scrape_top_scorers(league_key: str, year_start: int, year_end: int) -> dict:
+    """
+    Coroutine version of scraping.scrape_top_scorers().
+    """
+    if league_key not in leaguesScorers:
+        return {
+            "success": False,
+            "data": None,
+            "error": f"League key '{league_key}' not found in leaguesRank dictionary."
+        }
+
+    url = f"{EUROSPORT_URL}/calcio/{leaguesScorers[league_key]}/{year_start}-{year_end}/standingperson.shtml"
+    try:
+        response = await async_http.get(url)
+        response.raise_for_status()
+
+        return await in_parse_pool(_parse_scorers, response.content)
+
+    except requests.RequestException as e:
+        return {
+            "success": False,
+            "data": None,
+            "error": f"Request error: {str(e)}"
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "data": None,
+            "error": f"Parsing error: {str(e)}"
+        }
+
+
+@flights.wrap(aliases=leaguesGiornate)
+@timed_scraper
+async def get_league_giornate(league_key, year_start, year_end):
+    """
+    Coroutine version of scraping.get_league_giornate(), returning the same JSON string.
+    """
+    if league_key not in leaguesGiornate:
+        return json.dumps({
+            "success": False,
+            "error": f"Chiave lega '{league_key}' non trovata nel dizionario.",
+            "data": None
+        })
+
+    try:
+        page = await get_season_page(f"{leaguesGiornate[league_key]}{year_start}-{year_end}")
+        giornate = await memo(page, "gamedays", _parse_giornate)
+    except requests.RequestException as e:
+        return json.dumps({
+            "success": False,
+            "error": f"Request error: {str(e)}",
+            "data": None
+        })
+
+    return json.dumps(giornate, ensure_ascii=False, separators=(",", ":"))
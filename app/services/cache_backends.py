@@ -0,0 +1,375 @@
+import abc
+import hashlib
+import json
+import os
+import socket
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from urllib.parse import unquote, urlparse
+
+
+# Shared tier of the response cache: empty or 'memory' (none), 'file' or 'redis'
+CACHE_BACKEND = os.environ.get("FOOTBALLAPI_CACHE_BACKEND", "")
+CACHE_PATH = os.environ.get("FOOTBALLAPI_CACHE_PATH", os.path.join(tempfile.gettempdir(), "footballapi-cache"))
+CACHE_URL = os.environ.get("FOOTBALLAPI_CACHE_URL", "redis://127.0.0.1:6379/0")
+CACHE_PREFIX = os.environ.get("FOOTBALLAPI_CACHE_PREFIX", "footballapi:")
+# Seconds an expired entry stays in the shared tier, served stale while a worker refreshes it
+CACHE_GRACE = float(os.environ.get("FOOTBALLAPI_CACHE_GRACE", 3600))
+CACHE_FILE_LIMIT = int(os.environ.get("FOOTBALLAPI_CACHE_FILE_LIMIT", 10000))
+
+# Payloads at least this large are stored zlib compressed
+COMPRESS_MIN_SIZE = 1024
+# Seconds a failing shared tier is skipped before being tried again
+RETRY_AFTER = 5.0
+
+_HEADER = struct.Struct(">d")  # wall-clock expiry
+_JSON, _ZLIB = b"j", b"z"
+
+
+def encode(value, expires_at: float) -> bytes:
+    """
+    Serializes a cached value: an 8 byte expiry, a format byte, then compact JSON,
+    zlib compressed from COMPRESS_MIN_SIZE bytes.
+
+    Raises:
+        TypeError: if the value is not JSON serializable
+    """
+    payload = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if len(payload) >= COMPRESS_MIN_SIZE:
+        return _HEADER.pack(expires_at) + _ZLIB + zlib.compress(payload, 6)
+    return _HEADER.pack(expires_at) + _JSON + payload
+
+
+def decode(data: bytes):
+    """
+    Returns:
+        tuple: (value, wall-clock expiry) of an encode() output
+    """
+    (expires_at,) = _HEADER.unpack_from(data)
+    flag, payload = data[_HEADER.size:_HEADER.size + 1], data[_HEADER.size + 1:]
+    if flag == _ZLIB:
+        payload = zlib.decompress(payload)
+    return json.loads(payload), expires_at
+
+
+class CacheBackend(abc.ABC):
+    """
+    Shared tier behind the in-process response cache, seen by every worker process.
+
+    get() and set() never raise: a failing backend counts the error, is skipped for
+    RETRY_AFTER seconds and the response cache keeps working from memory. Subclasses
+    implement _get(), _set() and _clear() on raw keys and encoded payloads.
+    """
+
+    name = "none"
+
+    def __init__(self, prefix: str = CACHE_PREFIX, grace: float = CACHE_GRACE):
+        self.prefix = prefix
+        self.grace = grace
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.errors = 0
+        self.last_error = None
+        self._retry_at = 0.0
+
+    def key(self, key) -> str:
+        # e.g. 'footballapi:["scorers","SerieA",2022,2023]'
+        return self.prefix + json.dumps(list(key) if isinstance(key, tuple) else key, separators=(",", ":"))
+
+    def get(self, key):
+        """
+        Returns:
+            tuple | None: (value, wall-clock expiry) or None when missing or unreachable
+        """
+        if time.monotonic() < self._retry_at:
+            return None
+        try:
+            data = self._get(self.key(key))
+            hit = decode(data) if data is not None else None
+        except Exception as e:
+            self._failed(e)
+            return None
+        if hit is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return hit
+
+    def set(self, key, value, ttl: float) -> bool:
+        """
+        Stores value for ttl seconds (plus the grace period). Values that are not JSON
+        serializable are left out.
+
+        Returns:
+            bool: whether the value was stored
+        """
+        if time.monotonic() < self._retry_at:
+            return False
+        expires_at = time.time() + ttl
+        try:
+            data = encode(value, expires_at)
+        except (TypeError, ValueError):
+            return False
+        try:
+            self._set(self.key(key), data, ttl + self.grace)
+        except Exception as e:
+            self._failed(e)
+            return False
+        self.writes += 1
+        return True
+
+    def clear(self):
+        try:
+            self._clear()
+        except Exception as e:
+            self._failed(e)
+
+    def _failed(self, error: Exception):
+        self.errors += 1
+        self.last_error = f"{type(error).__name__}: {error}"
+        self._retry_at = time.monotonic() + RETRY_AFTER
+
+    @abc.abstractmethod
+    def _get(self, key: str):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _set(self, key: str, data: bytes, retention: float):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _clear(self):
+        raise NotImplementedError
+
+    def stats(self) -> dict:
+        return {
+            "backend": self.name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "errors": self.errors,
+            "last_error": self.last_error,
+        }
+
+
+class FileBackend(CacheBackend):
+    """
+    Shared tier in a directory, one file per key, for the worker processes of one node.
+    A directory under /dev/shm keeps it in shared memory on Linux. Files are replaced
+    atomically, so readers never see a partial write. Each key prefix gets its own
+    subdirectory, so clear() and pruning never touch the entries of another prefix.
+    """
+
+    name = "file"
+
+    def __init__(self, path: str = CACHE_PATH, limit: int = CACHE_FILE_LIMIT, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+        self.directory = os.path.join(path, hashlib.blake2b(self.prefix.encode("utf-8"), digest_size=8).hexdigest())
+        self.limit = limit
+        self._writes_since_prune = 0
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest() + ".entry")
+
+    def _get(self, key: str):
+        path = self._file(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        (expires_at,) = _HEADER.unpack_from(data)
+        if expires_at + self.grace < time.time():
+            self._remove(path)
+            return None
+        return data
+
+    def _set(self, key: str, data: bytes, retention: float):
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as f:
+                f.write(data)
+            os.replace(temporary, self._file(key))
+        except BaseException:
+            self._remove(temporary)
+            raise
+        with self._lock:
+            self._writes_since_prune += 1
+            prune = self._writes_since_prune >= max(1, self.limit // 10)
+            if prune:
+                self._writes_since_prune = 0
+        if prune:
+            self._prune()
+
+    def _prune(self):
+        # drops entries past their grace period, then the least recently written beyond limit
+        now = time.time()
+        entries = []
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(".entry"):
+                continue
+            try:
+                with open(entry.path, "rb") as f:
+                    (expires_at,) = _HEADER.unpack(f.read(_HEADER.size))
+                modified = entry.stat().st_mtime
+            except (OSError, struct.error):
+                continue
+            if expires_at + self.grace < now:
+                self._remove(entry.path)
+            else:
+                entries.append((modified, entry.path))
+        entries.sort()
+        for _, path in entries[:max(0, len(entries) - self.limit)]:
+            self._remove(path)
+
+    def _clear(self):
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".entry"):
+                self._remove(entry.path)
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def stats(self) -> dict:
+        return {**super().stats(), "path": self.directory}
+
+
+class RedisError(Exception):
+    """
+    Error reply of a Redis server.
+    """
+
+
+class RedisBackend(CacheBackend):
+    """
+    Shared tier on a Redis server (or anything speaking its protocol), for worker processes
+    on several nodes. Speaks RESP directly over one socket per thread, so no client library
+    is needed. Entries expire on the server after their TTL plus the grace period.
+    """
+
+    name = "redis"
+
+    def __init__(self, url: str = CACHE_URL, timeout: float = 1.0, **kwargs):
+        super().__init__(**kwargs)
+        parsed = urlparse(url)
+        self.url = url
+        self.host = parsed.hostname or "127.0.0.1"
+        self.port = parsed.port or 6379
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # kept for the thread only once AUTH and SELECT succeeded, so a failed handshake is
+            # retried on a new socket instead of leaving an unauthenticated or db 0 connection
+            sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                connection = (sock, sock.makefile("rb"))
+                if self.password:
+                    self._send(connection, "AUTH", self.password)
+                if self.db:
+                    self._send(connection, "SELECT", self.db)
+            except BaseException:
+                sock.close()
+                raise
+            self._local.connection = connection
+        return connection
+
+    def _call(self, *args):
+        connection = self._connection()
+        try:
+            return self._send(connection, *args)
+        except OSError:
+            self._disconnect()
+            raise
+
+    def _send(self, connection, *args):
+        sock, reader = connection
+        command = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            if not isinstance(arg, bytes):
+                arg = str(arg).encode("utf-8")
+            command.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+        sock.sendall(b"".join(command))
+        return self._reply(reader)
+
+    def _reply(self, reader):
+        line = reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError("Connection closed by the Redis server")
+        kind, rest = line[:1], line[1:-2]
+        if kind == b"+":
+            return rest
+        if kind == b"-":
+            raise RedisError(rest.decode("utf-8", "replace"))
+        if kind == b":":
+            return int(rest)
+        if kind == b"$":
+            length = int(rest)
+            if length < 0:
+                return None
+            data = reader.read(length + 2)
+            if len(data) != length + 2:
+                raise ConnectionError("Connection closed by the Redis server")
+            return data[:-2]
+        if kind == b"*":
+            length = int(rest)
+            return None if length < 0 else [self._reply(reader) for _ in range(length)]
+        raise RedisError(f"Unexpected reply {line!r}")
+
+    def _disconnect(self):
+        connection = getattr(self._local, "connection", None)
+        self._local.connection = None
+        if connection is not None:
+            connection[0].close()
+
+    def _get(self, key: str):
+        return self._call("GET", key)
+
+    def _set(self, key: str, data: bytes, retention: float):
+        self._call("SET", key, data, "PX", max(1, int(retention * 1000)))
+
+    def _clear(self):
+        # only the keys of this prefix: the database may be shared with other applications
+        cursor = b"0"
+        while True:
+            cursor, keys = self._call("SCAN", cursor, "MATCH", self.prefix + "*", "COUNT", 500)
+            if keys:
+                self._call("DEL", *keys)
+            if cursor == b"0":
+                break
+
+    def stats(self) -> dict:
+        return {**super().stats(), "url": f"redis://{self.host}:{self.port}/{self.db}"}
+
+
+def backend_from_env():
+    """
+    Returns:
+        CacheBackend | None: the shared tier selected by FOOTBALLAPI_CACHE_BACKEND
+
+    Raises:
+        ValueError: for an unknown backend name
+    """
+    if CACHE_BACKEND in ("", "memory"):
+        return None
+    if CACHE_BACKEND == "file":
+        return FileBackend(CACHE_PATH)
+    if CACHE_BACKEND == "redis":
+        return RedisBackend(CACHE_URL)
+    raise ValueError(f"Unknown FOOTBALLAPI_CACHE_BACKEND '{CACHE_BACKEND}' (memory, file or redis)")
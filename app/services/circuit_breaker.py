@@ -0,0 +1,223 @@
+import functools
+import inspect
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import requests
+
+
+BREAKER_THRESHOLD = int(os.environ.get("FOOTBALLAPI_BREAKER_THRESHOLD", 5))
+BREAKER_RESET = float(os.environ.get("FOOTBALLAPI_BREAKER_RESET", 30))
+LAST_GOOD_SIZE = int(os.environ.get("FOOTBALLAPI_LAST_GOOD_SIZE", 512))
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpen(requests.RequestException):
+    """
+    Raised instead of contacting a host whose circuit is open; scrapers report it like any
+    other request error.
+    """
+
+
+class CircuitBreaker:
+    """
+    Breaker of one upstream host. After 'threshold' consecutive failures (network errors,
+    timeouts, 429/5xx answers) the circuit opens and requests fail immediately. Once
+    'reset_timeout' seconds have passed a single probe request is let through (half-open):
+    its success closes the circuit, its failure opens it again.
+    Time is read from clock (time.monotonic unless injected).
+    """
+
+    def __init__(self, host: str, threshold: int = 5, reset_timeout: float = 30, clock=time.monotonic):
+        self.host = host
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.trips = 0
+        self.rejected = 0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def before_request(self):
+        """
+        Raises:
+            CircuitOpen: if the host must not be contacted right now
+        """
+        with self._lock:
+            if self.state == CLOSED:
+                return
+            if self.state == OPEN and self.clock() - self.opened_at >= self.reset_timeout:
+                self.state = HALF_OPEN
+            if self.state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+            self.rejected += 1
+            raise CircuitOpen(f"Circuit open for {self.host}: upstream failing, retrying in at most {self.reset_timeout:g}s")
+
+    def record_success(self):
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.threshold:
+                if self.state != OPEN:
+                    self.trips += 1
+                self.state = OPEN
+                self.opened_at = self.clock()
+            self._probing = False
+
+    def cancel(self):
+        """
+        Releases the half-open probe slot of a request that was never sent.
+        """
+        with self._lock:
+            self._probing = False
+
+    def is_closed(self) -> bool:
+        with self._lock:
+            return self.state == CLOSED
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "state": self.state,
+                "failures": self.failures,
+                "trips": self.trips,
+                "rejected": self.rejected,
+                "open_for": round(self.clock() - self.opened_at, 3) if self.state != CLOSED else None,
+            }
+
+
+class HostBreakers:
+    """
+    One CircuitBreaker per upstream host, created on first use.
+    """
+
+    def __init__(self, threshold: int = 5, reset_timeout: float = 30, clock=time.monotonic):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def get(self, host: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = self._breakers[host] = CircuitBreaker(host, self.threshold, self.reset_timeout, self.clock)
+            return breaker
+
+    def is_closed(self, host: str) -> bool:
+        return self.get(host).is_closed()
+
+    def stats(self) -> dict:
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {host: breaker.stats() for host, breaker in breakers.items()}
+
+
+class LastKnownGood:
+    """
+    Bounded LRU of the last successful result of each scraper call, served (marked stale)
+    while the upstream host's circuit is not closed.
+    """
+
+    def __init__(self, breakers: HostBreakers, maxsize: int = 512, clock=time.monotonic):
+        self.breakers = breakers
+        self.maxsize = maxsize
+        self.clock = clock
+        self.served = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def wrap(self, host: str):
+        """
+        Decorator for a scraper returning {'success', 'data', 'error'} dicts: successes are
+        remembered per call arguments; a failure while the circuit of host is open or half-open
+        returns the remembered result instead, with a 'meta' object:
+        {'stale': True, 'age_seconds': float, 'last_error': str}.
+        Coroutine functions (the async engine) are wrapped alike.
+        """
+        def decorator(func):
+            signature = inspect.signature(func)
+
+            def key_of(args, kwargs):
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                return (func.__name__,) + tuple(bound.arguments.values())
+
+            if inspect.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    return self.resolve(host, key_of(args, kwargs), await func(*args, **kwargs))
+
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                return self.resolve(host, key_of(args, kwargs), func(*args, **kwargs))
+
+            return wrapper
+        return decorator
+
+    def resolve(self, host: str, key, result: dict) -> dict:
+        """
+        Remembers result under key if it is a success, otherwise returns the remembered
+        result (marked stale) when the circuit of host is not closed.
+        """
+        if result.get("success"):
+            self._remember(key, result)
+            return result
+        if self.breakers.is_closed(host):
+            return result
+        return self._fallback(key, result)
+
+    def _remember(self, key, result: dict):
+        with self._lock:
+            self._entries[key] = (result, self.clock())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _fallback(self, key, failure: dict) -> dict:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return failure
+            self.served += 1
+        result, stored_at = entry
+        return {
+            **result,
+            "meta": {
+                "stale": True,
+                "age_seconds": round(self.clock() - stored_at, 3),
+                "last_error": failure.get("error"),
+            },
+        }
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": len(self._entries), "maxsize": self.maxsize, "served": self.served}
+
+
+def is_stale(result) -> bool:
+    """
+    True for a last-known-good fallback, which must not be cached or stored as fresh.
+    """
+    return isinstance(result, dict) and bool((result.get("meta") or {}).get("stale"))
+
+
+breakers = HostBreakers(threshold=BREAKER_THRESHOLD, reset_timeout=BREAKER_RESET)
+last_good = LastKnownGood(breakers, maxsize=LAST_GOOD_SIZE)
@@ -0,0 +1,130 @@
+import os
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from app.services import metrics
+from app.services.circuit_breaker import CircuitOpen, breakers
+from app.services.upstream_scheduler import UpstreamBusy, upstream
+
+
+# Tunables, overridable through environment variables
+TIMEOUT = float(os.environ.get("FOOTBALLAPI_HTTP_TIMEOUT", 10))
+RETRIES = int(os.environ.get("FOOTBALLAPI_HTTP_RETRIES", 2))
+BACKOFF = float(os.environ.get("FOOTBALLAPI_HTTP_BACKOFF", 0.3))
+POOL_SIZE = int(os.environ.get("FOOTBALLAPI_HTTP_POOL_SIZE", 20))
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Answers counted as failures by the host circuit breaker (after retries)
+FAILURE_STATUSES = frozenset(RETRY_STATUSES)
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept-Language': 'it-IT,it;q=0.9,en;q=0.8',
+}
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def _build_session() -> requests.Session:
+    retry = Retry(
+        total=RETRIES,
+        connect=RETRIES,
+        read=RETRIES,
+        backoff_factor=BACKOFF,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(["GET"]),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    # One connection pool per host (Wikipedia, Eurosport), kept alive across API requests
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_SIZE, max_retries=retry)
+
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Returns the process-wide requests.Session, creating it on first use.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def get(url: str, params: dict = None, headers: dict = None, timeout: float = None,
+        priority: int = None) -> requests.Response:
+    """
+    Performs a GET through the shared keep-alive session, once the upstream scheduler
+    grants a slot for the URL's host.
+
+    Args:
+        url (str): Absolute URL to fetch
+        params (dict): Optional query string parameters
+        headers (dict): Optional headers, merged over DEFAULT_HEADERS
+        timeout (float): Timeout in seconds, defaults to TIMEOUT
+        priority (int): upstream_scheduler.LIVE, USER or BACKGROUND, defaults to the context priority
+
+    Returns:
+        requests.Response: the response (already retried on connection errors and 429/5xx)
+
+    Raises:
+        requests.RequestException: on network errors once the retries are exhausted,
+        UpstreamBusy when no slot is granted in time, or CircuitOpen while the host is failing
+    """
+    host = urlparse(url).hostname
+    breaker = breakers.get(host)
+    try:
+        breaker.before_request()
+    except CircuitOpen:
+        metrics.upstream_errors.inc(host, "circuit_open")
+        raise
+    try:
+        upstream.acquire(host, priority)
+    except UpstreamBusy:
+        breaker.cancel()
+        metrics.upstream_errors.inc(host, "busy")
+        raise
+
+    started = time.perf_counter()
+    try:
+        response = get_session().get(
+            url,
+            params=params,
+            headers=headers,
+            timeout=TIMEOUT if timeout is None else timeout,
+        )
+    except requests.RequestException as e:
+        breaker.record_failure()
+        metrics.upstream_errors.inc(host, _failure_cause(e))
+        raise
+    finally:
+        metrics.upstream_duration.observe(time.perf_counter() - started, host)
+
+    metrics.upstream_bytes.inc(host, amount=len(response.content))
+    if response.status_code in FAILURE_STATUSES:
+        breaker.record_failure()
+        metrics.upstream_errors.inc(host, f"http_{response.status_code}")
+    else:
+        breaker.record_success()
+    return response
+
+
+def _failure_cause(error: requests.RequestException) -> str:
+    if isinstance(error, requests.Timeout):
+        return "timeout"
+    if isinstance(error, requests.ConnectionError):
+        return "connection"
+    return "request"
@@ -0,0 +1,49 @@
+import heapq
+
+
+def _to_int(value) -> int:
+    try:
+        return int(str(value).strip())
+    except ValueError:
+        return 0
+
+
+def aggregate_scorers(seasons, limit: int = 20) -> list:
+    """
+    Merges per-season top scorer tables (as returned by scrape_top_scorers) into one leaderboard.
+
+    Args:
+        seasons (iterable): (league_key, year_start, year_end, rows) tuples, where rows is the
+            'data' list of a successful scrape_top_scorers call
+        limit (int): Number of players to keep
+
+    Returns:
+        list[dict]: [{
+            'Position': int,
+            'Player': str,
+            'Teams': list[str],
+            'Appearances': int,
+            'Goals': int,
+            'Seasons': int
+        }] ordered by goals, then by fewer appearances
+    """
+    totals = {}
+    for league_key, year_start, year_end, rows in seasons:
+        for row in rows:
+            player = row["Player"]
+            entry = totals.get(player)
+            if entry is None:
+                entry = totals[player] = {"Player": player, "Teams": [], "Appearances": 0, "Goals": 0, "Seasons": 0}
+            if row["Team"] not in entry["Teams"]:
+                entry["Teams"].append(row["Team"])
+            entry["Appearances"] += _to_int(row["Appearances"])
+            entry["Goals"] += _to_int(row["Goals"])
+            entry["Seasons"] += 1
+
+    # top-k selection without sorting the whole table
+    best = heapq.nsmallest(
+        limit,
+        totals.values(),
+        key=lambda e: (-e["Goals"], e["Appearances"], e["Player"]),
+    )
+    return [{"Position": i, **entry} for i, entry in enumerate(best, start=1)]
@@ -0,0 +1,161 @@
+import os
+import random
+import threading
+import time
+from datetime import datetime, timezone
+
+from app.services.circuit_breaker import is_stale
+from app.services.scraping import get_live_league_ranking
+from app.services.season_store import season_store
+
+
+def _env_list(name: str, default: str = "") -> list:
+    return [item.strip() for item in os.environ.get(name, default).split(",") if item.strip()]
+
+
+# Leagues kept warm (empty disables the refresher) and refresh cadence in seconds
+LIVE_LEAGUES = _env_list("FOOTBALLAPI_LIVE_LEAGUES")
+LIVE_INTERVAL = float(os.environ.get("FOOTBALLAPI_LIVE_INTERVAL", 300))
+LIVE_MATCHDAY_INTERVAL = float(os.environ.get("FOOTBALLAPI_LIVE_MATCHDAY_INTERVAL", 30))
+LIVE_JITTER = float(os.environ.get("FOOTBALLAPI_LIVE_JITTER", 0.1))
+# Weekdays (Monday = 0) on which the faster matchday cadence applies
+MATCHDAY_WEEKDAYS = {int(day) for day in _env_list("FOOTBALLAPI_MATCHDAY_WEEKDAYS", "5,6")}
+
+
+class LiveRankingRefresher:
+    """
+    Daemon thread periodically re-scraping get_live_league_ranking for a set of leagues
+    and keeping the last good standings in memory.
+    """
+
+    def __init__(self, leagues, interval: float = 300, matchday_interval: float = 30,
+                 jitter: float = 0.1, matchday_weekdays=(5, 6)):
+        self.leagues = list(leagues)
+        self.interval = interval
+        self.matchday_interval = matchday_interval
+        self.jitter = jitter
+        self.matchday_weekdays = set(matchday_weekdays)
+        self._state = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def is_matchday(self, now: datetime = None) -> bool:
+        now = now or datetime.now()
+        return now.weekday() in self.matchday_weekdays
+
+    def next_delay(self) -> float:
+        """
+        Seconds until the next refresh of a league, jittered so leagues do not refresh in lockstep.
+        """
+        base = self.matchday_interval if self.is_matchday() else self.interval
+        return base * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def refresh(self, league_key: str):
+        """
+        Scrapes one league and records either the new standings or the error.
+        """
+        try:
+            result = get_live_league_ranking(league_key)
+            if is_stale(result):
+                error = result["meta"]["last_error"]
+            else:
+                error = None if result["success"] else result["error"]
+        except Exception as e:
+            result, error = None, f"Internal error: {str(e)}"
+
+        with self._lock:
+            state = self._state.setdefault(league_key, {
+                "data": None,
+                "refreshed_at": None,
+                "refreshed_monotonic": None,
+                "last_error": None,
+                "last_error_at": None,
+            })
+            if error is None:
+                state["data"] = result["data"]
+                state["refreshed_at"] = datetime.now(timezone.utc).isoformat()
+                state["refreshed_monotonic"] = time.monotonic()
+                state["last_error"] = None
+            else:
+                state["last_error"] = error
+                state["last_error_at"] = datetime.now(timezone.utc).isoformat()
+
+    def get(self, league_key: str):
+        """
+        Returns the in-memory ranking for league_key, or None if it has never been refreshed successfully.
+
+        Returns:
+            dict | None: {
+                'success': True,
+                'data': list[dict],
+                'error': None,
+                'meta': {
+                    'age_seconds': float,
+                    'refreshed_at': str,
+                    'last_error': str | None,
+                    'last_error_at': str | None
+                }
+            }
+        """
+        with self._lock:
+            state = self._state.get(league_key)
+            if state is None or state["data"] is None:
+                return None
+            return {
+                "success": True,
+                "data": state["data"],
+                "error": None,
+                "meta": {
+                    "age_seconds": round(time.monotonic() - state["refreshed_monotonic"], 3),
+                    "refreshed_at": state["refreshed_at"],
+                    "last_error": state["last_error"],
+                    "last_error_at": state["last_error_at"],
+                }
+            }
+
+    def _run(self):
+        # every league is due immediately, then rescheduled independently
+        due = {league: time.monotonic() for league in self.leagues}
+        while not self._stop.is_set():
+            league = min(due, key=due.get)
+            wait = due[league] - time.monotonic()
+            if wait > 0 and self._stop.wait(wait):
+                break
+            self.refresh(league)
+            due[league] = time.monotonic() + self.next_delay()
+
+    def start(self):
+        if self._thread is not None or not self.leagues or season_store.offline:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="live-ranking-refresher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "running": self._thread is not None,
+                "leagues": {
+                    league: {
+                        "refreshed_at": state["refreshed_at"],
+                        "last_error": state["last_error"],
+                    }
+                    for league, state in self._state.items()
+                },
+            }
+
+
+live_rankings = LiveRankingRefresher(
+    LIVE_LEAGUES,
+    interval=LIVE_INTERVAL,
+    matchday_interval=LIVE_MATCHDAY_INTERVAL,
+    jitter=LIVE_JITTER,
+    matchday_weekdays=MATCHDAY_WEEKDAYS,
+)
@@ -0,0 +1,130 @@
+from collections import Counter
+
+
+def normalize_key(value: str) -> str:
+    return " ".join(value.split()).casefold()
+
+
+# Separators that never occur inside a team name, unlike the plain hyphen ('Saint-Étienne')
+SEPARATORS = (" - ", " – ", " — ", "–", "—")
+
+
+def _splits(match: str) -> list:
+    """
+    Returns the candidate (home, away) pairs of a match string: one per plain hyphen, or the
+    single split on a spaced hyphen or dash when the string has one.
+    """
+    for separator in SEPARATORS:
+        if separator in match:
+            home, _, away = match.partition(separator)
+            return [(home.strip(), away.strip())]
+    return [(match[:i].strip(), match[i + 1:].strip()) for i, char in enumerate(match) if char == "-"]
+
+
+def side_counts(giornate: list) -> Counter:
+    """
+    Counts every candidate team name of a season's match strings, for split_match().
+    """
+    return Counter(side for rows in giornate for match in rows for pair in _splits(match.get("match") or "")
+                   for side in pair if side)
+
+
+def split_match(match: str, counts: Counter = None) -> list:
+    """
+    Splits a 'Home-Away' match string into its teams, e.g. 'Inter-Milan' -> ['Inter', 'Milan'].
+
+    Team names may contain hyphens, and the page text keeps no space around the separator
+    ('Paris Saint-Germain-Lione'). With the side_counts() of the season, the split whose two
+    sides occur most often wins: a team name recurs in every match of the team, a fragment of
+    it ('Paris Saint', 'Germain-Lione') hardly ever. Without counts the first hyphen is used.
+    """
+    pairs = [pair for pair in _splits(match) if pair[0] and pair[1]]
+    if not pairs:
+        return [team.strip() for team in match.split("-", 1) if team.strip()]
+    if counts is None or len(pairs) == 1:
+        return list(pairs[0])
+    return list(max(pairs, key=lambda pair: (min(counts[pair[0]], counts[pair[1]]), counts[pair[0]] + counts[pair[1]])))
+
+
+class MatchIndex:
+    """
+    Per-season index over the matchdays returned by get_league_giornate.
+
+    Matches are flattened once, tagged with their 1-based matchday, and indexed by round,
+    by team and by date, so filtered queries never walk or serialize the whole season.
+    """
+
+    def __init__(self, giornate: list):
+        self.matches = []
+        self.by_round = {}
+        self.by_team = {}
+        self.by_date = {}
+
+        counts = side_counts(giornate)
+        for matchday, rows in enumerate(giornate, start=1):
+            for match in rows:
+                position = len(self.matches)
+                self.matches.append({"matchday": matchday, **match})
+                self.by_round.setdefault(matchday, []).append(position)
+                for team in split_match(match.get("match") or "", counts):
+                    self.by_team.setdefault(normalize_key(team), []).append(position)
+                if match.get("date"):
+                    self.by_date.setdefault(normalize_key(match["date"]), []).append(position)
+
+    @property
+    def rounds(self) -> int:
+        return max(self.by_round, default=0)
+
+    def _team_positions(self, team: str) -> set:
+        key = normalize_key(team)
+        if key in self.by_team:
+            return set(self.by_team[key])
+        # partial names ('verona' for 'Hellas Verona') scan the team keys, not the matches
+        return {position for name, positions in self.by_team.items() if key in name for position in positions}
+
+    def query(self, matchday: int = None, from_matchday: int = None, to_matchday: int = None,
+              team: str = None, date: str = None) -> list:
+        """
+        Returns the positions (in season order) of the matches satisfying every given filter.
+        """
+        selected = None
+
+        def narrow(positions):
+            nonlocal selected
+            selected = set(positions) if selected is None else selected & set(positions)
+
+        if matchday is not None:
+            narrow(self.by_round.get(matchday, ()))
+        if from_matchday is not None or to_matchday is not None:
+            low = from_matchday or 1
+            high = to_matchday or self.rounds
+            narrow(p for day in range(low, high + 1) for p in self.by_round.get(day, ()))
+        if team:
+            narrow(self._team_positions(team))
+        if date:
+            narrow(self.by_date.get(normalize_key(date), ()))
+
+        if selected is None:
+            return list(range(len(self.matches)))
+        return sorted(selected)
+
+    def page(self, positions: list, page: int = 1, per_page: int = 50) -> dict:
+        """
+        Returns:
+            dict: {
+                'matches': list[dict],
+                'page': int,
+                'per_page': int,
+                'total': int,
+                'pages': int
+            }
+        """
+        total = len(positions)
+        offset = (page - 1) * per_page
+        return {
+            "matches": [self.matches[p] for p in positions[offset:offset + per_page]],
+            "page": page,
+            "per_page": per_page,
+            "total": total,
+            "pages": (total + per_page - 1) // per_page,
+        }
@@ -0,0 +1,266 @@
+import bisect
+import functools
+import inspect
+import json
+import threading
+import time
+
+from flask.json.provider import DefaultJSONProvider
+
+
+# Latency buckets in seconds, from a cache hit to a slow upstream round trip
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Payload buckets in bytes
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+def _format_labels(names: tuple, values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """
+    Monotonic counter with labels, e.g. errors by host and cause. Its name ends in '_total'.
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: tuple = ()):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values, amount: float = 1):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            values = dict(self._values)
+        for label_values, value in sorted(values.items()):
+            yield f"{self.name}{_format_labels(self.labels, label_values)} {_format_value(value)}"
+
+
+class Histogram:
+    """
+    Cumulative histogram with fixed buckets and labels. observe() is a bisect and three
+    additions under a lock, cheap enough for every request.
+    """
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels: tuple = (), buckets: tuple = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = tuple(buckets)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values):
+        position = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                # per-bucket counts (the last one is +Inf), sum
+                series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][position] += 1
+            series[1] += value
+
+    def time(self, *label_values):
+        """
+        Context manager observing the duration of the enclosed block.
+        """
+        return _Timer(self, label_values)
+
+    def samples(self):
+        with self._lock:
+            series = {labels: (list(counts), total) for labels, (counts, total) in self._series.items()}
+        for label_values, (counts, total) in sorted(series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = 'le="' + _format_value(bound) + '"'
+                yield f"{self.name}_bucket{_format_labels(self.labels, label_values, le)} {cumulative}"
+            labels = _format_labels(self.labels, label_values)
+            yield f"{self.name}_sum{labels} {_format_value(total)}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class _Timer:
+    __slots__ = ("histogram", "label_values", "started")
+
+    def __init__(self, histogram: Histogram, label_values: tuple):
+        self.histogram = histogram
+        self.label_values = label_values
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.started, *self.label_values)
+        return False
+
+
+class Collected:
+    """
+    Gauge or counter read from an existing stats() method when /metrics is scraped,
+    so nothing is added to the hot path. collect() returns {label values tuple: number}.
+    """
+
+    def __init__(self, name: str, help: str, labels: tuple, collect, kind: str = "gauge"):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.collect = collect
+        self.kind = kind
+
+    def samples(self):
+        for label_values, value in sorted(self.collect().items()):
+            yield f"{self.name}{_format_labels(self.labels, label_values)} {_format_value(value)}"
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, help: str, labels: tuple = ()) -> Counter:
+        return self.register(Counter(name, help, labels))
+
+    def histogram(self, name: str, help: str, labels: tuple = (), buckets: tuple = LATENCY_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, help, labels, buckets))
+
+    def collected(self, name: str, help: str, labels: tuple, collect, kind: str = "gauge") -> Collected:
+        return self.register(Collected(name, help, labels, collect, kind))
+
+    def render(self) -> str:
+        """
+        Returns:
+            str: every metric in the Prometheus text exposition format (version 0.0.4)
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            try:
+                lines.extend(metric.samples())
+            except Exception:
+                continue  # a failing collector must not break the whole scrape
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+request_duration = registry.histogram(
+    "footballapi_request_duration_seconds", "Time spent handling an API request", ("route", "method", "status"))
+response_bytes = registry.histogram(
+    "footballapi_response_bytes", "Size of response bodies as sent (after compression)", ("route",), SIZE_BUCKETS)
+serialize_duration = registry.histogram(
+    "footballapi_serialize_duration_seconds", "Time spent serializing JSON responses")
+exceptions = registry.counter(
+    "footballapi_exceptions_total", "Unhandled exceptions by type", ("type",))
+
+upstream_duration = registry.histogram(
+    "footballapi_upstream_duration_seconds", "Upstream HTTP round trip time by host", ("host",))
+upstream_bytes = registry.counter(
+    "footballapi_upstream_bytes_total", "Bytes received from upstream hosts", ("host",))
+upstream_errors = registry.counter(
+    "footballapi_upstream_errors_total", "Failed upstream requests by host and cause", ("host", "cause"))
+
+parse_duration = registry.histogram(
+    "footballapi_parse_duration_seconds", "Time spent building BeautifulSoup trees by scraper", ("scraper",))
+scrape_duration = registry.histogram(
+    "footballapi_scrape_duration_seconds", "Time spent in scraping functions, cache lookups included", ("scraper",))
+scrape_errors = registry.counter(
+    "footballapi_scrape_errors_total", "Scraper failures by scraper and cause", ("scraper", "cause"))
+
+
+def error_cause(error) -> str:
+    """
+    Classifies a scraper error message: 'request', 'parsing', 'internal' or 'not_found'.
+    """
+    message = str(error)
+    if message.startswith("Request error"):
+        return "request"
+    if message.startswith("Parsing error"):
+        return "parsing"
+    if message.startswith("Internal error"):
+        return "internal"
+    return "not_found"
+
+
+def timed_scraper(func):
+    """
+    Records the duration of a scraping function and counts its failures by cause.
+    Works for result dicts, for lists of them (bulk scrapers such as get_wikipedia_intros, one
+    failure counted per failed item), for the JSON strings returned by get_league_giornate, and
+    for the coroutine functions of the async engine.
+    """
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            return _record_scrape(func.__name__, started, await func(*args, **kwargs))
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        return _record_scrape(func.__name__, started, func(*args, **kwargs))
+
+    return wrapper
+
+
+def _record_scrape(name: str, started: float, result):
+    scrape_duration.observe(time.perf_counter() - started, name)
+    if isinstance(result, dict):
+        if not result.get("success"):
+            scrape_errors.inc(name, error_cause(result.get("error")))
+    elif isinstance(result, list):
+        for item in result:
+            if isinstance(item, dict) and item.get("success") is False:
+                scrape_errors.inc(name, error_cause(item.get("error")))
+    elif isinstance(result, str) and not result.startswith("["):
+        # a JSON error object, e.g. {"success": false, "error": "Request error: ..."}
+        try:
+            error = json.loads(result).get("error")
+        except (ValueError, AttributeError):
+            error = None
+        scrape_errors.inc(name, error_cause(error))
+    return result
+
+
+class InstrumentedJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider timing the serialization of every jsonify() response.
+    """
+
+    def response(self, *args, **kwargs):
+        started = time.perf_counter()
+        response = super().response(*args, **kwargs)
+        serialize_duration.observe(time.perf_counter() - started)
+        return response
@@ -0,0 +1,200 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import unquote
+
+from bs4 import BeautifulSoup
+
+from app.services.parsing import SEASON_PAGE_SCRAPERS, parse
+
+
+REVISION_ID = re.compile(r'"wgRevisionId":\s*(\d+)')
+
+
+def revision_id(html: str):
+    """
+    Returns the MediaWiki revision id embedded in a rendered article, or None.
+    """
+    match = REVISION_ID.search(html)
+    return int(match.group(1)) if match else None
+
+
+def normalize_title(title: str) -> str:
+    """
+    Normalizes a Wikipedia page title so that equivalent spellings share a cache entry.
+
+    Args:
+        title (str): Page title as built from the leagues dictionary (e.g., 'Prem%27er-Liga_2023-2024')
+
+    Returns:
+        str: Decoded title with spaces replaced by underscores (e.g., "Prem'er-Liga_2023-2024")
+    """
+    return unquote(title).strip().replace(" ", "_")
+
+
+class CachedPage:
+    """
+    A downloaded Wikipedia page: the raw HTML, its BeautifulSoup tree and the HTTP validators
+    (ETag, Last-Modified, MediaWiki revision id) used to revalidate it.
+
+    The tree is built on first access and then shared by every scraper reading the page,
+    so scrapers must treat it as read-only. It only holds the tags SEASON_PAGE_SCRAPERS read
+    unless restricted parsing is disabled for one of them. Scraper outputs computed from the
+    tree are memoized on the page, so a revalidated page is never parsed again.
+    """
+
+    def __init__(self, title: str, html: str, etag: str = None, last_modified: str = None, revision: int = None):
+        self.title = title
+        self.html = html
+        self.etag = etag
+        self.last_modified = last_modified
+        self.revision = revision
+        self.fetched_at = time.monotonic()
+        self._soup = None
+        self._results = {}
+        self._lock = threading.Lock()
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        if self._soup is None:
+            with self._lock:
+                if self._soup is None:
+                    self._soup = parse(self.html, *SEASON_PAGE_SCRAPERS)
+        return self._soup
+
+    def memo(self, name: str, extract):
+        """
+        Returns extract(self.soup), computing it only the first time for a given name.
+        """
+        if name not in self._results:
+            self.store_memo(name, extract(self.soup))
+        return self._results[name]
+
+    def has_memo(self, name: str) -> bool:
+        return name in self._results
+
+    def store_memo(self, name: str, result):
+        with self._lock:
+            self._results.setdefault(name, result)
+
+    def is_fresh(self, ttl: float) -> bool:
+        return time.monotonic() - self.fetched_at < ttl
+
+    def conditional_headers(self) -> dict:
+        """
+        Returns:
+            dict: If-None-Match / If-Modified-Since headers built from the stored validators
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class PageCache:
+    """
+    Thread-safe, size-bounded LRU cache of CachedPage objects keyed by normalized page title.
+
+    Pages older than ttl are still returned by get(); callers revalidate them (see is_fresh).
+    A page whose revalidation failed is served as is for retry_after seconds before the next try.
+    """
+
+    def __init__(self, maxsize: int = 32, ttl: float = 300, retry_after: float = 30):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.retry_after = retry_after
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.revalidations = 0
+        self.not_modified = 0
+        self.revalidation_errors = 0
+        self._pages = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, title: str):
+        """
+        Returns the cached page for title (marking it as recently used), or None on a miss.
+        """
+        key = normalize_title(title)
+        with self._lock:
+            page = self._pages.get(key)
+            if page is None:
+                self.misses += 1
+                return None
+            self._pages.move_to_end(key)
+            self.hits += 1
+            return page
+
+    def peek(self, title: str):
+        """
+        Returns the cached page for title without counting a lookup, or None.
+        """
+        with self._lock:
+            return self._pages.get(normalize_title(title))
+
+    def put(self, title: str, html: str, etag: str = None, last_modified: str = None, revision: int = None) -> CachedPage:
+        """
+        Stores the HTML of a page, evicting the least recently used entries beyond maxsize.
+        The revision id is read from the HTML unless given.
+        """
+        key = normalize_title(title)
+        if revision is None:
+            revision = revision_id(html)
+        page = CachedPage(key, html, etag=etag, last_modified=last_modified, revision=revision)
+        with self._lock:
+            self._pages[key] = page
+            self._pages.move_to_end(key)
+            while len(self._pages) > self.maxsize:
+                self._pages.popitem(last=False)
+                self.evictions += 1
+        return page
+
+    def revalidated(self, page: CachedPage, modified: bool, etag: str = None, last_modified: str = None):
+        """
+        Records the outcome of a conditional request for a cached page.
+        An unmodified page is kept (with its memoized results) and becomes fresh again.
+        """
+        with self._lock:
+            self.revalidations += 1
+            if not modified:
+                self.not_modified += 1
+                page.fetched_at = time.monotonic()
+                page.etag = etag or page.etag
+                page.last_modified = last_modified or page.last_modified
+
+    def unreachable(self, page: CachedPage):
+        """
+        Records a failed revalidation: the stale page stays fresh for retry_after more seconds
+        (ttl at most), so an upstream outage is not hit again by every request for the page.
+        """
+        with self._lock:
+            self.revalidation_errors += 1
+            page.fetched_at = time.monotonic() - self.ttl + min(self.retry_after, self.ttl)
+
+    def clear(self):
+        with self._lock:
+            self._pages.clear()
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: {'size', 'maxsize', 'hits', 'misses', 'evictions', 'revalidations', 'not_modified',
+            'revalidation_errors', 'hit_ratio'}
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._pages),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "revalidations": self.revalidations,
+                "not_modified": self.not_modified,
+                "revalidation_errors": self.revalidation_errors,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
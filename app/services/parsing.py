@@ -0,0 +1,116 @@
+import os
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from app.services import metrics
+
+try:
+    import lxml  # noqa: F401
+    FAST_PARSER = "lxml"
+except ImportError:
+    FAST_PARSER = None
+
+
+# "auto" picks lxml when it is installed and falls back to the pure Python html.parser
+DEFAULT_PARSER = os.environ.get("FOOTBALLAPI_HTML_PARSER", "auto")
+RESTRICTED_PARSING = os.environ.get("FOOTBALLAPI_RESTRICTED_PARSING", "1") != "0"
+
+
+def _infobox_tag(name, attrs):
+    return name == "table" and attrs.get("class") in ("infobox sinottico", ["infobox", "sinottico"])
+
+
+def _teams_tag(name, attrs):
+    # the 'Squadre partecipanti' heading and the wikitables following it
+    if attrs.get("id") == "Squadre_partecipanti":
+        return True
+    classes = attrs.get("class") or []
+    if isinstance(classes, str):
+        classes = classes.split()
+    return name == "table" and "wikitable" in classes
+
+
+def _gamedays_tag(name, attrs):
+    # matchday tables and the h3 headings carrying their dates
+    return name == "h3" or (name == "table" and attrs.get("width") == "99%")
+
+
+def _ranking_tag(name, attrs):
+    return name == "table" and attrs.get("data-testid") == "table"
+
+
+def _scorers_tag(name, attrs):
+    classes = attrs.get("class") or []
+    if isinstance(classes, str):
+        classes = classes.split()
+    return name == "table" and "standing-table" in classes
+
+
+# Tags each scraper reads; the intro extract is a small fragment parsed whole
+RULES = {
+    "intro": None,
+    "infobox": _infobox_tag,
+    "teams": _teams_tag,
+    "gamedays": _gamedays_tag,
+    "ranking": _ranking_tag,
+    "scorers": _scorers_tag,
+}
+
+# Per-scraper parsing settings: 'parser' is a BeautifulSoup tree builder (or 'auto'),
+# 'restrict' limits the tree to the tags listed in RULES
+PARSE_CONFIG = {
+    scraper: {"parser": DEFAULT_PARSER, "restrict": RESTRICTED_PARSING and rule is not None}
+    for scraper, rule in RULES.items()
+}
+
+# Scrapers reading the shared Wikipedia season page (see PageCache)
+SEASON_PAGE_SCRAPERS = ("infobox", "teams", "gamedays")
+
+
+def configure(scraper: str, parser: str = None, restrict: bool = None):
+    """
+    Changes the parsing settings of a scraper at runtime.
+
+    Args:
+        scraper (str): Key of PARSE_CONFIG (e.g., 'teams')
+        parser (str): 'auto', 'lxml', 'html.parser' or any installed BeautifulSoup builder
+        restrict (bool): False to build the whole document tree, True to keep only the tags in RULES
+    """
+    config = PARSE_CONFIG[scraper]
+    if parser is not None:
+        config["parser"] = parser
+    if restrict is not None:
+        config["restrict"] = restrict and RULES[scraper] is not None
+
+
+def resolve_parser(parser: str) -> str:
+    if parser == "auto":
+        return FAST_PARSER or "html.parser"
+    return parser
+
+
+def strainer_for(*scrapers):
+    """
+    Returns a SoupStrainer keeping the union of the tags read by scrapers,
+    or None if any of them needs the whole document.
+    """
+    if not all(PARSE_CONFIG[scraper]["restrict"] for scraper in scrapers):
+        return None
+    rules = [RULES[scraper] for scraper in scrapers]
+    return SoupStrainer(lambda name, attrs: any(rule(name, attrs) for rule in rules))
+
+
+def parse(markup, *scrapers) -> BeautifulSoup:
+    """
+    Parses markup for one or more scrapers sharing the same document.
+
+    Args:
+        markup (str | bytes): HTML to parse
+        *scrapers (str): Keys of PARSE_CONFIG; the first one decides the parser
+
+    Returns:
+        BeautifulSoup: tree restricted to what the scrapers read, when every one of them allows it
+    """
+    parser = resolve_parser(PARSE_CONFIG[scrapers[0]]["parser"])
+    with metrics.parse_duration.time("+".join(scrapers)):
+        return BeautifulSoup(markup, parser, parse_only=strainer_for(*scrapers))
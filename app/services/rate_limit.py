@@ -0,0 +1,54 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: 'rate' tokens per second, holding at most 'capacity' tokens.
+    Time is read from clock (time.monotonic unless injected).
+    """
+
+    def __init__(self, rate: float, capacity: float = None, clock=time.monotonic):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def delay(self) -> float:
+        """
+        Takes a token if one is available and returns 0, otherwise returns the seconds to wait.
+        """
+        with self._lock:
+            self._refill(self.clock())
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self):
+        """
+        Blocks until a token is available and takes it.
+        """
+        while True:
+            wait = self.delay()
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+
+def parse_rates(spec: str) -> dict:
+    """
+    Parses 'host=rate,host=rate' (requests per second) into a dict.
+    """
+    rates = {}
+    for item in spec.split(","):
+        if item.strip():
+            host, rate = item.split("=", 1)
+            rates[host.strip()] = float(rate)
+    return rates
@@ -0,0 +1,353 @@
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+from app.services.circuit_breaker import is_stale
+from app.services.upstream_scheduler import BACKGROUND, upstream_priority
+
+
+# TTLs in seconds, overridable through environment variables
+RANKING_TTL = float(os.environ.get("FOOTBALLAPI_RANKING_TTL", 60))
+CURRENT_SEASON_TTL = float(os.environ.get("FOOTBALLAPI_CURRENT_SEASON_TTL", 3600))
+CURRENT_SEASON_INFO_TTL = float(os.environ.get("FOOTBALLAPI_CURRENT_SEASON_INFO_TTL", 6 * 3600))
+PAST_SEASON_TTL = float(os.environ.get("FOOTBALLAPI_PAST_SEASON_TTL", 30 * 24 * 3600))
+
+# Endpoints whose content for the running season changes only occasionally
+SLOW_CHANGING_ENDPOINTS = {"intro", "infobox", "teams"}
+
+# Endpoints cached as plain JSON, which the shared tier can hold; the others keep Python
+# objects (standings engines, analytics columns, match indexes) and stay per process
+SHARED_ENDPOINTS = {"intro", "infobox", "teams", "ranking", "scorers", "gamedays"}
+
+
+def season_is_over(year_end: int, today: date = None) -> bool:
+    """
+    A season is considered closed once the 30th of June of its end year has passed.
+    """
+    today = today or date.today()
+    return today > date(year_end, 6, 30)
+
+
+def ttl_for(endpoint: str, year_start: int = None, year_end: int = None) -> float:
+    """
+    Chooses how long a cached response stays fresh.
+
+    Args:
+        endpoint (str): Route name (e.g., 'ranking', 'scorers', 'gamedays')
+        year_start (int): Season start year, None for season-less endpoints
+        year_end (int): Season end year, None for season-less endpoints
+
+    Returns:
+        float: TTL in seconds; past seasons never change and get PAST_SEASON_TTL,
+        the live ranking gets RANKING_TTL
+    """
+    if endpoint == "ranking" or year_end is None:
+        return RANKING_TTL
+    if season_is_over(year_end):
+        return PAST_SEASON_TTL
+    if endpoint in SLOW_CHANGING_ENDPOINTS:
+        return CURRENT_SEASON_INFO_TTL
+    return CURRENT_SEASON_TTL
+
+
+def is_success(value) -> bool:
+    """
+    Default cacheability check: scraper error dicts ({'success': False, ...}) and stale
+    last-known-good fallbacks are never cached.
+    """
+    return not (isinstance(value, dict) and value.get("success") is False) and not is_stale(value)
+
+
+def is_shareable(key) -> bool:
+    """
+    Default check of which keys go to the shared tier: those of SHARED_ENDPOINTS.
+    """
+    return isinstance(key, tuple) and bool(key) and key[0] in SHARED_ENDPOINTS
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at")
+
+    def __init__(self, value, ttl: float, now: float):
+        self.value = value
+        self.expires_at = now + ttl
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache of scraper results with per-entry TTL and stale-while-revalidate.
+
+    A fresh entry is returned as is. An expired entry is still returned immediately while a
+    background worker recomputes it; only a missing entry makes the caller wait on upstream.
+
+    With a backend (see cache_backends), the LRU is the first tier in front of a cache shared
+    by every worker process: a key missing or expired in memory is looked up there, and every
+    computed value is written to both, so a page scraped by one worker serves them all.
+
+    Expiry is read from clock (time.monotonic unless injected).
+    """
+
+    def __init__(self, maxsize: int = 1024, refresh_workers: int = 4, backend=None, shareable=is_shareable,
+                 clock=time.monotonic):
+        self.maxsize = maxsize
+        self.clock = clock
+        self.backend = backend
+        self.shareable = shareable
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.shared_hits = 0
+        self.refresh_errors = 0
+        self._entries = OrderedDict()
+        self._refreshing = set()
+        self._tasks = set()  # refreshes running on the event loop of the async engine
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=refresh_workers, thread_name_prefix="cache-refresh")
+
+    def get(self, key, ttl: float, compute, cacheable=is_success):
+        """
+        Returns the cached value for key, computing it on a miss.
+
+        Args:
+            key (hashable): Cache key, e.g. ('scorers', 'SerieA', 2022, 2023)
+            ttl (float): Seconds the computed value stays fresh
+            compute (callable): Zero-argument function producing the value
+            cacheable (callable): Predicate deciding whether a computed value may be stored
+
+        Returns:
+            The cached, stale or freshly computed value
+        """
+        if self._needs_shared(key):
+            self._load_shared(key)
+        entry, refresh = self._lookup(key)
+        if refresh:
+            self._executor.submit(self._refresh, key, ttl, compute, cacheable)
+        if entry is not None:
+            return entry.value
+
+        value = compute()
+        if cacheable(value):
+            self.set(key, value, ttl)
+        return value
+
+    async def get_async(self, key, ttl: float, compute, cacheable=is_success):
+        """
+        get() for the async engine: compute is a zero-argument coroutine function, and an
+        expired entry is refreshed by a task on the running event loop. The shared tier is
+        accessed from a worker thread.
+        """
+        if self._needs_shared(key):
+            await asyncio.to_thread(self._load_shared, key)
+        entry, refresh = self._lookup(key)
+        if refresh:
+            task = asyncio.ensure_future(self._refresh_async(key, ttl, compute, cacheable))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        if entry is not None:
+            return entry.value
+
+        value = await compute()
+        if cacheable(value):
+            await self._set_async(key, value, ttl)
+        return value
+
+    def _needs_shared(self, key) -> bool:
+        # the shared tier is read only for keys missing or expired in memory
+        if self.backend is None or not self.shareable(key):
+            return False
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is None or entry.expires_at <= self.clock()
+
+    def _load_shared(self, key):
+        """
+        Copies the shared entry of key into memory, unless the local one expires later.
+        """
+        hit = self.backend.get(key)
+        if hit is None:
+            return
+        value, expires_at = hit
+        loaded = _Entry(value, expires_at - time.time(), self.clock())  # wall clock to monotonic
+        with self._lock:
+            current = self._entries.get(key)
+            if current is None or loaded.expires_at > current.expires_at:
+                self._insert(key, loaded)
+                self.shared_hits += 1
+
+    def _lookup(self, key):
+        """
+        Returns:
+            tuple: the entry of key (None on a miss) and whether the caller must start its
+            refresh, which is the case for the first caller finding it expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None, False
+            self._entries.move_to_end(key)
+            if entry.expires_at > self.clock():
+                self.hits += 1
+                return entry, False
+            self.stale_hits += 1
+            if key in self._refreshing:
+                return entry, False
+            self._refreshing.add(key)
+            return entry, True
+
+    def get_many(self, keys: list, ttls: list, compute_many, cacheable=is_success) -> list:
+        """
+        Batched get: every missing key is computed by a single compute_many call, and expired
+        entries are served while one background call refreshes them together.
+
+        Args:
+            keys (list): Cache keys
+            ttls (list): TTL of each key
+            compute_many (callable): Function mapping a list of keys to the list of their values
+            cacheable (callable): Predicate deciding whether a computed value may be stored
+
+        Returns:
+            list: the value of each key, in order
+        """
+        for key in keys:
+            if self._needs_shared(key):
+                self._load_shared(key)
+
+        values = [None] * len(keys)
+        missing, stale = [], []
+        with self._lock:
+            now = self.clock()
+            for position, key in enumerate(keys):
+                entry = self._entries.get(key)
+                if entry is None:
+                    self.misses += 1
+                    missing.append(position)
+                    continue
+                self._entries.move_to_end(key)
+                values[position] = entry.value
+                if entry.expires_at > now:
+                    self.hits += 1
+                else:
+                    self.stale_hits += 1
+                    if key not in self._refreshing:
+                        self._refreshing.add(key)
+                        stale.append(position)
+            if stale:
+                self._executor.submit(
+                    self._refresh_many, [keys[p] for p in stale], [ttls[p] for p in stale], compute_many, cacheable
+                )
+
+        if missing:
+            computed = compute_many([keys[p] for p in missing])
+            for position, value in zip(missing, computed):
+                values[position] = value
+                if cacheable(value):
+                    self.set(keys[position], value, ttls[position])
+        return values
+
+    def peek(self, key):
+        """
+        Returns the cached value for key (even if expired) without counting a lookup, or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return None if entry is None else entry.value
+
+    def _refresh(self, key, ttl, compute, cacheable):
+        try:
+            with upstream_priority(BACKGROUND):
+                value = compute()
+            if cacheable(value):
+                self.set(key, value, ttl)
+            else:
+                # keep serving the last good value
+                self.refresh_errors += 1
+        except Exception:
+            self.refresh_errors += 1
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    async def _refresh_async(self, key, ttl, compute, cacheable):
+        try:
+            with upstream_priority(BACKGROUND):
+                value = await compute()
+            if cacheable(value):
+                await self._set_async(key, value, ttl)
+            else:
+                self.refresh_errors += 1
+        except Exception:
+            self.refresh_errors += 1
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _refresh_many(self, keys, ttls, compute_many, cacheable):
+        try:
+            with upstream_priority(BACKGROUND):
+                values = compute_many(keys)
+            for key, value, ttl in zip(keys, values, ttls):
+                if cacheable(value):
+                    self.set(key, value, ttl)
+                else:
+                    self.refresh_errors += 1
+        except Exception:
+            self.refresh_errors += len(keys)
+        finally:
+            with self._lock:
+                self._refreshing.difference_update(keys)
+
+    def set(self, key, value, ttl: float):
+        """
+        Stores value in memory and, for shareable keys, in the shared tier.
+        """
+        with self._lock:
+            self._insert(key, _Entry(value, ttl, self.clock()))
+        if self.backend is not None and self.shareable(key):
+            self.backend.set(key, value, ttl)
+
+    async def _set_async(self, key, value, ttl: float):
+        with self._lock:
+            self._insert(key, _Entry(value, ttl, self.clock()))
+        if self.backend is not None and self.shareable(key):
+            await asyncio.to_thread(self.backend.set, key, value, ttl)
+
+    def _insert(self, key, entry: _Entry):
+        # callers hold self._lock
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """
+        Empties the in-memory tier and the entries of this cache in the shared tier.
+        """
+        with self._lock:
+            self._entries.clear()
+        if self.backend is not None:
+            self.backend.clear()
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: {'size', 'maxsize', 'hits', 'stale_hits', 'misses', 'shared_hits', 'refresh_errors',
+            'hit_ratio', 'shared'}, 'shared' being the stats of the backend or None
+        """
+        with self._lock:
+            lookups = self.hits + self.stale_hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "shared_hits": self.shared_hits,
+                "refresh_errors": self.refresh_errors,
+                "hit_ratio": (self.hits + self.stale_hits) / lookups if lookups else 0.0,
+                "shared": self.backend.stats() if self.backend is not None else None,
+            }
@@ -0,0 +1,114 @@
+import gzip
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+# Bodies smaller than this are sent uncompressed
+MIN_COMPRESS_SIZE = int(os.environ.get("FOOTBALLAPI_MIN_COMPRESS_SIZE", 512))
+ENCODED_CACHE_SIZE = int(os.environ.get("FOOTBALLAPI_ENCODED_CACHE_SIZE", 512))
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=5)
+    return gzip.compress(body, compresslevel=6, mtime=0)
+
+
+class ResponseEncoder:
+    """
+    Adds strong ETags and gzip/brotli content negotiation to JSON responses.
+
+    Compressed bodies are cached by content hash, so a payload served from the response cache
+    is compressed once no matter how many clients poll it.
+    """
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self.not_modified = 0
+        self.compressed = 0
+        self.compressed_hits = 0
+        self._bodies = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def encodings(self) -> list:
+        # server preference order, used to break ties between equally accepted encodings
+        return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+    def _compressed(self, digest: str, body: bytes, encoding: str) -> bytes:
+        key = (digest, encoding)
+        with self._lock:
+            cached = self._bodies.get(key)
+            if cached is not None:
+                self._bodies.move_to_end(key)
+                self.compressed_hits += 1
+                return cached
+
+        compressed = _compress(body, encoding)
+        with self._lock:
+            self.compressed += 1
+            self._bodies[key] = compressed
+            while len(self._bodies) > self.maxsize:
+                self._bodies.popitem(last=False)
+        return compressed
+
+    def apply(self, request, response):
+        """
+        Rewrites a successful JSON response in place: sets its ETag, answers a matching
+        If-None-Match with 304 and compresses the body when the client accepts it.
+
+        Args:
+            request (flask.Request): Incoming request
+            response (flask.Response): Response produced by the view
+
+        Returns:
+            flask.Response: the same response object
+        """
+        if (request.method not in ("GET", "HEAD") or response.status_code != 200
+                or response.mimetype != "application/json" or response.direct_passthrough
+                or "Content-Encoding" in response.headers):
+            return response
+
+        body = response.get_data()
+        digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+        encoding = None
+        if len(body) >= MIN_COMPRESS_SIZE:
+            encoding = request.accept_encodings.best_match(self.encodings)
+
+        # each representation gets its own strong ETag; any of them validates the content
+        etag = f"{digest}-{encoding}" if encoding else digest
+        response.vary.add("Accept-Encoding")
+        response.set_etag(etag)
+
+        if any(request.if_none_match.contains_weak(tag) for tag in [digest] + [f"{digest}-{e}" for e in self.encodings]):
+            with self._lock:
+                self.not_modified += 1
+            response.status_code = 304
+            response.set_data(b"")
+            response.headers.pop("Content-Length", None)
+            return response
+
+        if encoding:
+            response.set_data(self._compressed(digest, body, encoding))
+            response.headers["Content-Encoding"] = encoding
+        return response
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "encodings": self.encodings,
+                "not_modified": self.not_modified,
+                "compressed": self.compressed,
+                "compressed_hits": self.compressed_hits,
+                "cached_bodies": len(self._bodies),
+            }
+
+
+response_encoder = ResponseEncoder(maxsize=ENCODED_CACHE_SIZE)
@@ -1,7 +1,17 @@
+import os
 import requests
-from bs4 import BeautifulSoup
 import html 
 import json
+from urllib.parse import urlparse
+
+from app.services import http_client
+from app.services.circuit_breaker import last_good
+from app.services.metrics import timed_scraper
+from app.services.parsing import parse
+from app.services.page_cache import PageCache, normalize_title, revision_id
+from app.services.singleflight import SingleFlight
+from app.services.upstream_scheduler import LIVE
+from app.services.wiki_sections import LEAD, SectionFetcher, SectionMissing
 
 
 leagues = {
@@ -33,8 +43,122 @@ leagues = {
 }
 
 
+# Upstream base URLs, overridable to point the scrapers at a stand-in server (see benchmarks/loadtest.py)
+WIKIPEDIA_URL = os.environ.get("FOOTBALLAPI_WIKIPEDIA_URL", "https://it.wikipedia.org").rstrip("/")
+EUROSPORT_URL = os.environ.get("FOOTBALLAPI_EUROSPORT_URL", "https://www.eurosport.it").rstrip("/")
+WIKIPEDIA_HOST = urlparse(WIKIPEDIA_URL).hostname
+EUROSPORT_HOST = urlparse(EUROSPORT_URL).hostname
+
+# Wikipedia season pages shared by get_infobox_it, get_league_teams and get_league_giornate
+season_pages = PageCache(
+    maxsize=int(os.environ.get("FOOTBALLAPI_PAGE_CACHE_SIZE", 32)),
+    ttl=float(os.environ.get("FOOTBALLAPI_PAGE_TTL", 300)),
+    retry_after=float(os.environ.get("FOOTBALLAPI_PAGE_RETRY_AFTER", 30)),
+)
+
+# Concurrent identical scrapes (and page downloads) share a single upstream fetch
+scrapes = SingleFlight()
+
+# 'sections' fetches only the article sections a scraper reads through the parse API,
+# 'page' always downloads whole articles
+WIKI_FETCH = os.environ.get("FOOTBALLAPI_WIKI_FETCH", "sections")
+
+season_sections = SectionFetcher(
+    PageCache(maxsize=int(os.environ.get("FOOTBALLAPI_SECTION_CACHE_SIZE", 128)), ttl=season_pages.ttl),
+    scrapes,
+    api_url=f"{WIKIPEDIA_URL}/w/api.php",
+    ttl=season_pages.ttl,
+)
+
+# Titles per MediaWiki extracts request: the API returns at most 20 intro extracts per call
+INTRO_BATCH_SIZE = int(os.environ.get("FOOTBALLAPI_INTRO_BATCH_SIZE", 20))
+
+
+def get_season_page(page_title: str):
+    """
+    Returns the it.wikipedia.org page for a season, downloading it only on a cache miss.
+    A cached page older than the cache TTL is revalidated with a conditional request.
+
+    Args:
+        page_title (str): Page title (e.g., 'Serie_A_2023-2024')
+
+    Returns:
+        CachedPage: object exposing the raw 'html', the parsed 'soup' and memoized results
+
+    Raises:
+        requests.RequestException: if the page cannot be downloaded and no copy is cached
+    """
+    page = season_pages.get(page_title)
+    if page is None or not page.is_fresh(season_pages.ttl):
+        page = scrapes.do(("page", normalize_title(page_title)), lambda: _download_season_page(page_title, page))
+    return page
+
+
+def season_extract(page_title: str, anchor, name: str, extract) -> dict:
+    """
+    Runs a scraper extract on one section of a season page (the lead when anchor is LEAD),
+    fetched alone through the parse API. Falls back to the full page when the section is
+    missing, cannot be fetched or does not hold what the scraper looks for, and reuses a
+    fresh full page when one is already cached.
+
+    Args:
+        page_title (str): Page title (e.g., 'Serie_A_2023-2024')
+        anchor (str): Heading anchor of the section, or LEAD
+        name (str): Memo name of the result (e.g., 'teams')
+        extract (callable): Function turning a soup into a result dict
+
+    Returns:
+        dict: the result of extract
+
+    Raises:
+        requests.RequestException: if neither the section nor the page can be downloaded
+    """
+    cached = season_pages.peek(page_title)
+    if WIKI_FETCH == "sections" and (cached is None or not cached.is_fresh(season_pages.ttl)):
+        try:
+            result = season_sections.section(page_title, anchor).memo(name, extract)
+            if result["success"]:
+                return result
+        except (SectionMissing, requests.RequestException):
+            pass
+        season_sections.record_fallback()
+    return get_season_page(page_title).memo(name, extract)
+
+
+def _download_season_page(page_title: str, cached=None):
+    url = f"{WIKIPEDIA_URL}/wiki/{page_title}"
+    try:
+        response = http_client.get(url, headers=cached.conditional_headers() if cached else None)
+        if response.status_code != 304:
+            response.raise_for_status()
+    except requests.RequestException:
+        if cached is None:
+            raise
+        season_pages.unreachable(cached)
+        return cached  # serve the previous copy while Wikipedia is unreachable
+
+    return _store_season_page(page_title, response, cached)
+
+
+def _store_season_page(page_title: str, response, cached=None):
+    """
+    Puts a downloaded (or revalidated) season page in the page cache and returns it.
+    """
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if cached is not None:
+        # 304, or a new download of the very same revision: keep the already parsed page
+        unchanged = response.status_code == 304 or (
+            cached.revision is not None and revision_id(response.text) == cached.revision
+        )
+        season_pages.revalidated(cached, modified=not unchanged, etag=etag, last_modified=last_modified)
+        if unchanged:
+            return cached
+
+    return season_pages.put(page_title, response.text, etag=etag, last_modified=last_modified)
 
 
+@scrapes.wrap(aliases=leagues)
 def get_wikipedia_intro_en(league_key: str, year_start: int, year_end: int) -> dict:
     """
     Fetches the lead section of the Italian Wikipedia page for a given league season.
@@ -55,73 +179,145 @@ def get_wikipedia_intro_en(league_key: str, year_start: int, year_end: int) -> d
             'error': str | None
         }
     """
-    if league_key not in leagues:
-        return {
+    return get_wikipedia_intros([(league_key, year_start, year_end)])[0]
+
+
+@timed_scraper
+def get_wikipedia_intros(seasons: list) -> list:
+    """
+    Fetches the lead sections of many league seasons, packing up to INTRO_BATCH_SIZE titles
+    into each MediaWiki API request (titles=A|B|C).
+
+    Args:
+        seasons (list): (league_key, year_start, year_end) tuples
+
+    Returns:
+        list: one get_wikipedia_intro_en result dict per season, in the same order
+    """
+    results, titles = _intro_titles(seasons)
+    batch = list(titles)
+    for offset in range(0, len(batch), INTRO_BATCH_SIZE):
+        chunk = batch[offset:offset + INTRO_BATCH_SIZE]
+        for page_title, result in _fetch_intros(chunk).items():
+            for position in titles[page_title]:
+                results[position] = last_good.resolve(WIKIPEDIA_HOST, ("intro",) + tuple(seasons[position]), result)
+    return results
+
+
+def _intro_titles(seasons: list):
+    """
+    Returns:
+        tuple: the results list (filled in for unknown leagues only) and a dict mapping each
+        page title to the positions of the seasons asking for it
+    """
+    results = [None] * len(seasons)
+    titles = {}  # page title -> positions of the seasons asking for it
+    for position, (league_key, year_start, year_end) in enumerate(seasons):
+        if league_key not in leagues:
+            results[position] = {
+                "success": False,
+                "data": None,
+                "error": f"League key '{league_key}' not found in dictionary."
+            }
+            continue
+        base_title = leagues[league_key].rstrip("_")  # rimuove eventuale underscore finale
+        # the API takes real titles, not URL-quoted ones (e.g. Prem'er-Liga)
+        titles.setdefault(normalize_title(f"{base_title}_{year_start}-{year_end}"), []).append(position)
+    return results, titles
+
+
+def _fetch_intros(page_titles: list) -> dict:
+    """
+    One extracts API request (following 'continue') for up to INTRO_BATCH_SIZE titles.
+
+    Returns:
+        dict: page title -> result dict
+    """
+    url = f"{WIKIPEDIA_URL}/w/api.php"
+    params = _intro_params(page_titles)
+
+    try:
+        pages, normalized = {}, {}
+        while True:
+            response = http_client.get(url, params=params)
+            response.raise_for_status()
+            data = response.json()
+
+            _merge_intro_pages(data, pages, normalized)
+            if "continue" not in data:
+                break
+            params = {**params, **data["continue"]}
+
+    except requests.RequestException as e:
+        return dict.fromkeys(page_titles, {
             "success": False,
             "data": None,
-            "error": f"League key '{league_key}' not found in dictionary."
-        }
+            "error": f"Request error: {str(e)}"
+        })
+    except Exception as e:
+        return dict.fromkeys(page_titles, {
+            "success": False,
+            "data": None,
+            "error": f"Internal error: {str(e)}"
+        })
 
-    base_title = leagues[league_key].rstrip("_")  # rimuove eventuale underscore finale
-    page_title = f"{base_title}_{year_start}-{year_end}"
+    return _intro_results(page_titles, pages, normalized)
 
-    url = "https://it.wikipedia.org/w/api.php"
-    params = {
+
+def _intro_params(page_titles: list) -> dict:
+    return {
         "action": "query",
         "prop": "extracts",
         "exintro": True,
         "explaintext": False,
-        "titles": page_title,
+        "exlimit": "max",
+        "titles": "|".join(page_titles),
         "format": "json"
     }
 
-    try:
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
 
-        pages = data.get("query", {}).get("pages", {})
-        if not pages:
-            return {
+def _merge_intro_pages(data: dict, pages: dict, normalized: dict):
+    # one page of extracts API results; 'continue' answers may repeat pages without their extract
+    query = data.get("query", {})
+    normalized.update({n["from"]: n["to"] for n in query.get("normalized", [])})
+    for page in query.get("pages", {}).values():
+        merged = pages.setdefault(page.get("title"), page)
+        if "extract" in page:
+            merged["extract"] = page["extract"]
+
+
+def _intro_results(page_titles: list, pages: dict, normalized: dict) -> dict:
+    """
+    Returns:
+        dict: page title -> result dict, built from the merged extracts API pages
+    """
+    results = {}
+    for page_title in page_titles:
+        page = pages.get(normalized.get(page_title)) or pages.get(page_title.replace("_", " ")) or pages.get(page_title)
+        if page is None:
+            results[page_title] = {
                 "success": False,
                 "data": None,
                 "error": "No pages found in the response."
             }
-
-        page = next(iter(pages.values()))
-        if "missing" in page:
-            return {
+        elif "missing" in page or "invalid" in page:
+            results[page_title] = {
                 "success": False,
                 "data": None,
                 "error": f"The page '{page_title}' does not exist on it.wikipedia.org."
             }
-
-        html_extract = page.get("extract", "")
-        soup = BeautifulSoup(html_extract, "html.parser")
-        plain_text = soup.get_text()
-
-        return {
-            "success": True,
-            "data": {
-                "title": page.get("title"),
-                "html": html_extract,
-                "text": plain_text
-            },
-            "error": None
-        }
-
-    except requests.RequestException as e:
-        return {
-            "success": False,
-            "data": None,
-            "error": f"Request error: {str(e)}"
-        }
-    except Exception as e:
-        return {
-            "success": False,
-            "data": None,
-            "error": f"Internal error: {str(e)}"
-        }
+        else:
+            html_extract = page.get("extract", "")
+            results[page_title] = {
+                "success": True,
+                "data": {
+                    "title": page.get("title"),
+                    "html": html_extract,
+                    "text": parse(html_extract, "intro").get_text()
+                },
+                "error": None
+            }
+    return results
 
 
 # Example usage:
@@ -135,6 +331,46 @@ def get_wikipedia_intro_en(league_key: str, year_start: int, year_end: int) -> d
 
 
 
+def _parse_infobox(soup) -> dict:
+    """
+    Extracts the 'infobox sinottico' rows of a season page, grouped by section.
+    """
+    infobox = soup.find("table", class_="infobox sinottico")
+
+    if not infobox:
+        return {
+            "success": False,
+            "data": None,
+            "error": "Infobox not found in the page."
+        }
+
+    rows = infobox.find_all("tr")
+    result = {}
+    current_section = None
+
+    for row in rows:
+        if row.find("th", colspan="2"):
+            section = row.get_text(strip=True)
+            current_section = section
+            result[current_section] = {}
+        elif row.find("th") and row.find("td"):
+            key = row.find("th").get_text(strip=True)
+            value = row.find("td").get_text(" ", strip=True)
+            if current_section:
+                result[current_section][key] = value
+            else:
+                result[key] = value
+
+    return {
+        "success": True,
+        "data": result,
+        "error": None
+    }
+
+
+@scrapes.wrap(aliases=leagues)
+@last_good.wrap(WIKIPEDIA_HOST)
+@timed_scraper
 def get_infobox_it(league_key: str, year_start: int, year_end: int) -> dict:
     """
     Scrapes the infobox from the Italian Wikipedia page for a given league season.
@@ -160,44 +396,9 @@ def get_infobox_it(league_key: str, year_start: int, year_end: int) -> dict:
 
     base_title = leagues[league_key].rstrip("_")  # rimuove underscore finale
     page_title = f"{base_title}_{year_start}-{year_end}"
-    url = f"https://it.wikipedia.org/wiki/{page_title}"
 
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-
-        soup = BeautifulSoup(response.text, "html.parser")
-        infobox = soup.find("table", class_="infobox sinottico")
-
-        if not infobox:
-            return {
-                "success": False,
-                "data": None,
-                "error": "Infobox not found in the page."
-            }
-
-        rows = infobox.find_all("tr")
-        result = {}
-        current_section = None
-
-        for row in rows:
-            if row.find("th", colspan="2"):
-                section = row.get_text(strip=True)
-                current_section = section
-                result[current_section] = {}
-            elif row.find("th") and row.find("td"):
-                key = row.find("th").get_text(strip=True)
-                value = row.find("td").get_text(" ", strip=True)
-                if current_section:
-                    result[current_section][key] = value
-                else:
-                    result[key] = value
-
-        return {
-            "success": True,
-            "data": result,
-            "error": None
-        }
+        return season_extract(page_title, LEAD, "infobox", _parse_infobox)
 
     except requests.RequestException as e:
         return {
@@ -221,6 +422,47 @@ def get_infobox_it(league_key: str, year_start: int, year_end: int) -> dict:
 #else:
   #  print("Error:", data["error"])
 
+def _parse_teams(soup) -> dict:
+    """
+    Extracts the table following the 'Squadre partecipanti' heading of a season page.
+    """
+    header = soup.find(id="Squadre_partecipanti")
+    if not header:
+        return {
+            "success": False,
+            "data": None,
+            "error": "Section 'Squadre partecipanti' not found."
+        }
+
+    table = header.find_next("table", class_="wikitable")
+    if not table:
+        return {
+            "success": False,
+            "data": None,
+            "error": "Table not found under 'Squadre partecipanti' section."
+        }
+
+    rows = table.find_all("tr")
+    headers = [th.get_text(strip=True) for th in rows[0].find_all("th")]
+    data = []
+
+    for row in rows[1:]:
+        cols = row.find_all(["td", "th"])
+        if len(cols) != len(headers):
+            continue
+        entry = {headers[i]: cols[i].get_text(" ", strip=True) for i in range(len(headers))}
+        data.append(entry)
+
+    return {
+        "success": True,
+        "data": data,
+        "error": None
+    }
+
+
+@scrapes.wrap(aliases=leagues)
+@last_good.wrap(WIKIPEDIA_HOST)
+@timed_scraper
 def get_league_teams(league_key: str, year_start: int, year_end: int) -> dict:
     """
     Scrapes the table of participating teams from the Italian Wikipedia page for a given league season.
@@ -246,46 +488,9 @@ def get_league_teams(league_key: str, year_start: int, year_end: int) -> dict:
 
     base_title = leagues[league_key].rstrip("_")
     page_title = f"{base_title}_{year_start}-{year_end}"
-    url = f"https://it.wikipedia.org/wiki/{page_title}"
 
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        header = soup.find(id="Squadre_partecipanti")
-        if not header:
-            return {
-                "success": False,
-                "data": None,
-                "error": "Section 'Squadre partecipanti' not found."
-            }
-
-        table = header.find_next("table", class_="wikitable")
-        if not table:
-            return {
-                "success": False,
-                "data": None,
-                "error": "Table not found under 'Squadre partecipanti' section."
-            }
-
-        rows = table.find_all("tr")
-        headers = [th.get_text(strip=True) for th in rows[0].find_all("th")]
-        data = []
-
-        for row in rows[1:]:
-            cols = row.find_all(["td", "th"])
-            if len(cols) != len(headers):
-                continue
-            entry = {headers[i]: cols[i].get_text(" ", strip=True) for i in range(len(headers))}
-            data.append(entry)
-
-        return {
-            "success": True,
-            "data": data,
-            "error": None
-        }
+        return season_extract(page_title, "Squadre_partecipanti", "teams", _parse_teams)
 
     except requests.RequestException as e:
         return {
@@ -304,34 +509,74 @@ def get_league_teams(league_key: str, year_start: int, year_end: int) -> dict:
 
 
 
-def get_live_league_ranking(league_key: str) -> dict:
-    import requests
-    from bs4 import BeautifulSoup
-
-    leaguesRank = {
-        "SerieA": "serie-a",
-        "PremierLeague": "Premier-League",
-        "Bundesliga": "Bundesliga",
-        "Ligue1": "Ligue-1",
-        "Eredivisie": "Eredivisie",
-        "PrimeiraLiga": "superliga",
-        "SuperLig": "campionato-turco",
-        "ScottishPremiership": "campionato-scozzese",
-        "RussianLiga": "campionato-russo",
-        "SuperLeague": "campionato-svizzero",
-        "italy": "serie-a",
-        "england": "Premier-League",
-        "germany": "Bundesliga",
-        "france": "Ligue-1",
-        "netherlands": "Eredivisie",
-        "holland": "Eredivisie",
-        "portugal": "superliga",
-        "turkey": "campionato-turco",
-        "scotland": "campionato-scozzese",
-        "russia": "campionato-russo",
-        "swiss": "campionato-svizzero",
+# Eurosport paths of the leagues with a live ranking
+leaguesRank = {
+    "SerieA": "serie-a",
+    "PremierLeague": "Premier-League",
+    "Bundesliga": "Bundesliga",
+    "Ligue1": "Ligue-1",
+    "Eredivisie": "Eredivisie",
+    "PrimeiraLiga": "superliga",
+    "SuperLig": "campionato-turco",
+    "ScottishPremiership": "campionato-scozzese",
+    "RussianLiga": "campionato-russo",
+    "SuperLeague": "campionato-svizzero",
+    "italy": "serie-a",
+    "england": "Premier-League",
+    "germany": "Bundesliga",
+    "france": "Ligue-1",
+    "netherlands": "Eredivisie",
+    "holland": "Eredivisie",
+    "portugal": "superliga",
+    "turkey": "campionato-turco",
+    "scotland": "campionato-scozzese",
+    "russia": "campionato-russo",
+    "swiss": "campionato-svizzero",
+}
+
+
+def _parse_ranking(content) -> dict:
+    """
+    Extracts the standings table of a Eurosport 'classifica.shtml' page.
+    """
+    soup = parse(content, "ranking")
+    table = soup.find('table', {'data-testid': 'table'})
+
+    if not table:
+        return {"success": False, "data": None, "error": "Table not found on page."}
+
+    standings = []
+    for row in table.find('tbody').find_all('tr', {'data-testid': 'table-row-data'}):
+        cols = row.find_all('td')
+        if len(cols) < 10:
+            continue  # skip malformed rows
+
+        team_data = {
+            "Rank": cols[1].get_text(strip=True),
+            "Team": cols[3].get_text(strip=True),   # Wins
+            "Match": cols[5].get_text(strip=True),   # Losses
+            "Win": cols[6].get_text(strip=True),  # Goals For
+            "Draw": cols[7].get_text(strip=True),  # Goals Against
+            "Loss": cols[8].get_text(strip=True),  # Goal Difference
+            "goals scored": cols[9].get_text(strip=True), # Points
+            "goals conceded": cols[10].get_text(strip=True), # Points
+            "Goals +/-": cols[11].get_text(strip=True), # Points
+            "Points": cols[12].get_text(strip=True), # Points
+        }
+
+        standings.append(team_data)
+
+    return {
+        'success': True,
+        'data': standings,
+        'error': None
     }
 
+
+@scrapes.wrap(aliases=leaguesRank)
+@last_good.wrap(EUROSPORT_HOST)
+@timed_scraper
+def get_live_league_ranking(league_key: str) -> dict:
     if league_key not in leaguesRank:
         return {
             "success": False,
@@ -340,48 +585,13 @@ def get_live_league_ranking(league_key: str) -> dict:
         }
 
     path = leaguesRank[league_key]
-    url = f"https://www.eurosport.it/calcio/{path}/classifica.shtml"
-
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
+    url = f"{EUROSPORT_URL}/calcio/{path}/classifica.shtml"
 
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = http_client.get(url, priority=LIVE)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.content, 'html.parser')
-        table = soup.find('table', {'data-testid': 'table'})
-
-        if not table:
-            return {"success": False, "data": None, "error": "Table not found on page."}
-
-        standings = []
-        for row in table.find('tbody').find_all('tr', {'data-testid': 'table-row-data'}):
-            cols = row.find_all('td')
-            if len(cols) < 10:
-                continue  # skip malformed rows
-
-            team_data = {
-                "Rank": cols[1].get_text(strip=True),
-                "Team": cols[3].get_text(strip=True),   # Wins
-                "Match": cols[5].get_text(strip=True),   # Losses
-                "Win": cols[6].get_text(strip=True),  # Goals For
-                "Draw": cols[7].get_text(strip=True),  # Goals Against
-                "Loss": cols[8].get_text(strip=True),  # Goal Difference
-                "goals scored": cols[9].get_text(strip=True), # Points
-                "goals conceded": cols[10].get_text(strip=True), # Points
-                "Goals +/-": cols[11].get_text(strip=True), # Points
-                "Points": cols[12].get_text(strip=True), # Points
-            }
-
-            standings.append(team_data)
-
-        return {
-            'success': True,
-            'data': standings,
-            'error': None
-        }
+        return _parse_ranking(response.content)
 
     except requests.RequestException as e:
         return {'success': False, 'data': None, 'error': f'Request error: {str(e)}'}
@@ -391,86 +601,94 @@ def get_live_league_ranking(league_key: str) -> dict:
 
 
 
-def scrape_top_scorers(league_key: str, year_start: int, year_end: int) -> dict:
-    import requests
-    from bs4 import BeautifulSoup
-    import html
-
-    leaguesRank = {
-        "SerieA": "serie-a",
-        "PremierLeague": "Premier-League",
-        "Bundesliga": "Bundesliga",
-        "Ligue1": "Ligue-1",
-        "Eredivisie": "Eredivisie",
-        "PrimeiraLiga": "superliga",
-        "ScottishPremiership": "campionato-scozzese",
-        "RussianLiga": "campionato-russo",
-        "SuperLeague": "campionato-svizzero",
-        "italy": "serie-a",
-        "england": "Premier-League",
-        "germany": "Bundesliga",
-        "france": "Ligue-1",
-        "netherlands": "Eredivisie",
-        "holland": "Eredivisie",
-        "portugal": "superliga",
-        "scotland": "campionato-scozzese",
-        "russia": "campionato-russo",
-        "swiss": "campionato-svizzero",
+# Eurosport paths of the leagues with a top scorers table
+leaguesScorers = {
+    "SerieA": "serie-a",
+    "PremierLeague": "Premier-League",
+    "Bundesliga": "Bundesliga",
+    "Ligue1": "Ligue-1",
+    "Eredivisie": "Eredivisie",
+    "PrimeiraLiga": "superliga",
+    "ScottishPremiership": "campionato-scozzese",
+    "RussianLiga": "campionato-russo",
+    "SuperLeague": "campionato-svizzero",
+    "italy": "serie-a",
+    "england": "Premier-League",
+    "germany": "Bundesliga",
+    "france": "Ligue-1",
+    "netherlands": "Eredivisie",
+    "holland": "Eredivisie",
+    "portugal": "superliga",
+    "scotland": "campionato-scozzese",
+    "russia": "campionato-russo",
+    "swiss": "campionato-svizzero",
+}
+
+
+def _parse_scorers(content) -> dict:
+    """
+    Extracts the top scorers table of a Eurosport 'standingperson.shtml' page.
+    """
+    soup = parse(content, "scorers")
+    table = soup.find('table', class_='standing-table')
+
+    if not table:
+        return {
+            "success": False,
+            "data": None,
+            "error": "Top scorers table not found."
+        }
+
+    top_scorers = []
+    for row in table.find_all('tr')[1:]:
+        cols = row.find_all('td')
+        if len(cols) >= 5:
+            position = cols[0].get_text(strip=True)
+            cell = cols[1]
+            team_span = cell.find('span', class_='team-name')
+            if team_span:
+                team_span.decompose()
+
+            player = html.unescape(cell.get_text(strip=True))
+
+            team = html.unescape(cols[2].get_text(strip=True))
+            appearances = cols[3].get_text(strip=True)
+            goals = cols[4].get_text(strip=True)
+
+            top_scorers.append({
+                "Position": position,
+                "Player": player,
+                "Team": team,
+                "Appearances": appearances,
+                "Goals": goals
+            })
+
+    return {
+        "success": True,
+        "data": top_scorers,
+        "error": None
     }
 
-    if league_key not in leaguesRank:
+
+@scrapes.wrap(aliases=leaguesScorers)
+@last_good.wrap(EUROSPORT_HOST)
+@timed_scraper
+def scrape_top_scorers(league_key: str, year_start: int, year_end: int) -> dict:
+    if league_key not in leaguesScorers:
         return {
             "success": False,
             "data": None,
             "error": f"League key '{league_key}' not found in leaguesRank dictionary."
         }
 
-    league_path = leaguesRank[league_key]
-    url = f"https://www.eurosport.it/calcio/{league_path}/{year_start}-{year_end}/standingperson.shtml"
+    league_path = leaguesScorers[league_key]
+    url = f"{EUROSPORT_URL}/calcio/{league_path}/{year_start}-{year_end}/standingperson.shtml"
 
     try:
-        response = requests.get(url, timeout=10)
+        response = http_client.get(url)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.content, 'html.parser')
-        table = soup.find('table', class_='standing-table')
-
-        if not table:
-            return {
-                "success": False,
-                "data": None,
-                "error": "Top scorers table not found."
-            }
-
-        top_scorers = []
-        for row in table.find_all('tr')[1:]:
-            cols = row.find_all('td')
-            if len(cols) >= 5:
-                position = cols[0].get_text(strip=True)
-                cell = cols[1]
-                team_span = cell.find('span', class_='team-name')
-                if team_span:
-                    team_span.decompose()
-
-                player = html.unescape(cell.get_text(strip=True))
-
-                team = html.unescape(cols[2].get_text(strip=True))
-                appearances = cols[3].get_text(strip=True)
-                goals = cols[4].get_text(strip=True)
-
-                top_scorers.append({
-                    "Position": position,
-                    "Player": player,
-                    "Team": team,
-                    "Appearances": appearances,
-                    "Goals": goals
-                })
-
-        return {
-            "success": True,
-            "data": top_scorers,
-            "error": None
-        }
+        return _parse_scorers(response.content)
 
     except requests.RequestException as e:
         return {
@@ -488,34 +706,81 @@ def scrape_top_scorers(league_key: str, year_start: int, year_end: int) -> dict:
 
 
 
-def get_league_giornate(league_key, year_start, year_end):
-    leagues = {
-        "SerieA": "Serie_A_",
-        "SerieB": "Serie_B_",
-        "PremierLeague": "Premier_League_",
-        "Bundesliga": "Bundesliga_",
-        "Ligue1": "Ligue_1_",
-        "italy": "Serie_A_",
-        "england": "Premier_League_",
-        "germany": "Bundesliga_",
-        "france": "Ligue_1_",
-    }
+leaguesGiornate = {
+    "SerieA": "Serie_A_",
+    "SerieB": "Serie_B_",
+    "PremierLeague": "Premier_League_",
+    "Bundesliga": "Bundesliga_",
+    "Ligue1": "Ligue_1_",
+    "italy": "Serie_A_",
+    "england": "Premier_League_",
+    "germany": "Bundesliga_",
+    "france": "Ligue_1_",
+}
 
-    if league_key not in leagues:
+
+@scrapes.wrap(aliases=leaguesGiornate)
+@timed_scraper
+def get_league_giornate(league_key, year_start, year_end):
+    if league_key not in leaguesGiornate:
         return json.dumps({
             "success": False,
             "error": f"Chiave lega '{league_key}' non trovata nel dizionario.",
             "data": None
         })
 
-    path = leagues[league_key]
-    url = f"https://it.wikipedia.org/wiki/{path}{year_start}-{year_end}#Tabellone"
-    headers = {'User-Agent': 'Mozilla/5.0'}
-    response = requests.get(url, headers=headers)
-    soup = BeautifulSoup(response.content, "html.parser")
+    path = leaguesGiornate[league_key]
+    try:
+        giornate = get_season_page(f"{path}{year_start}-{year_end}").memo("gamedays", _parse_giornate)
+    except requests.RequestException as e:
+        return json.dumps({
+            "success": False,
+            "error": f"Request error: {str(e)}",
+            "data": None
+        })
+
+    return json.dumps(giornate, ensure_ascii=False, separators=(",", ":"))
+
+
+def stream_league_giornate(league_key, year_start, year_end):
+    """
+    Yields the matchdays of a season one at a time (each a list of match dicts), extracting
+    each table only when the consumer asks for it. Memoized matchdays are replayed as is.
+
+    Raises:
+        KeyError: if league_key is not in leaguesGiornate
+        requests.RequestException: if the season page cannot be downloaded
+    """
+    page = get_season_page(f"{leaguesGiornate[league_key]}{year_start}-{year_end}")
+    if page.has_memo("gamedays"):
+        yield from page.memo("gamedays", _parse_giornate)
+        return
 
     giornate = []
+    for rows in _iter_giornate(page.soup):
+        giornate.append(rows)
+        yield rows
+    page.store_memo("gamedays", giornate)
+
+
+def prefetch_giornate(league_key, year_start, year_end):
+    """
+    Downloads a season page into the page cache ahead of stream_league_giornate, ignoring errors.
+    """
+    try:
+        get_season_page(f"{leaguesGiornate[league_key]}{year_start}-{year_end}")
+    except (KeyError, requests.RequestException):
+        pass
 
+
+def _parse_giornate(soup) -> list:
+    """
+    Extracts the matchdays of a season page as a list of lists of match dicts.
+    """
+    return list(_iter_giornate(soup))
+
+
+def _iter_giornate(soup):
     for table in soup.find_all("table", {"width": "99%"}):
         rows = []
         date = ""
@@ -557,6 +822,4 @@ def get_league_giornate(league_key, year_start, year_end):
                     }
                     rows.append(match)
 
-        giornate.append(rows)
-
-    return json.dumps(giornate, ensure_ascii=False, indent=4)
\ No newline at end of file
+        yield rows
\ No newline at end of file
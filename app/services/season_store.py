@@ -0,0 +1,213 @@
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from app.services.scraping import leagues
+
+
+# SQLite file holding scraped seasons (empty disables the store) and offline switch
+STORE_PATH = os.environ.get("FOOTBALLAPI_STORE_PATH", "")
+OFFLINE = os.environ.get("FOOTBALLAPI_OFFLINE", "0") == "1"
+
+# Endpoints whose parsed output is persisted, keyed by league and season
+STORED_ENDPOINTS = {"intro", "infobox", "teams", "scorers", "gamedays"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS seasons (
+    endpoint TEXT NOT NULL,
+    league TEXT NOT NULL,
+    year_start INTEGER NOT NULL,
+    year_end INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    PRIMARY KEY (endpoint, league, year_start, year_end)
+)
+"""
+
+
+def canonical_league(league_key: str) -> str:
+    """
+    Maps aliases to one name, so 'SerieA' and 'italy' share stored seasons (e.g., 'Serie_A').
+    """
+    return leagues.get(league_key, league_key).rstrip("_")
+
+
+class SeasonStore:
+    """
+    Embedded SQLite store of parsed scraper outputs, surviving process restarts.
+
+    Connections are per thread; the database runs in WAL mode so readers never block the writer.
+    """
+
+    def __init__(self, path: str, offline: bool = False):
+        self.path = path
+        self.offline = offline
+        self.reads = 0
+        self.writes = 0
+        self._local = threading.local()
+        if self.enabled:
+            self._connection().execute(_SCHEMA)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def get(self, endpoint: str, league_key: str, year_start: int, year_end: int):
+        """
+        Returns:
+            tuple | None: (value, stored_at) or None when the season is not stored
+        """
+        if not self.enabled:
+            return None
+        row = self._connection().execute(
+            "SELECT payload, stored_at FROM seasons"
+            " WHERE endpoint = ? AND league = ? AND year_start = ? AND year_end = ?",
+            (endpoint, canonical_league(league_key), year_start, year_end),
+        ).fetchone()
+        if row is None:
+            return None
+        self.reads += 1
+        return json.loads(row[0]), row[1]
+
+    def put(self, endpoint: str, league_key: str, year_start: int, year_end: int, value):
+        if not self.enabled:
+            return
+        self._connection().execute(
+            "INSERT OR REPLACE INTO seasons VALUES (?, ?, ?, ?, ?, ?)",
+            (endpoint, canonical_league(league_key), year_start, year_end,
+             json.dumps(value, ensure_ascii=False, separators=(",", ":")), time.time()),
+        )
+        self.writes += 1
+
+    def load_or_scrape(self, endpoint: str, scraper, args: tuple, ttl: float, cacheable):
+        """
+        Answers from the store when the stored season is younger than ttl, otherwise scrapes
+        and persists the result. If the scrape fails, an older stored copy is returned instead.
+        In offline mode only the store is consulted.
+
+        Args:
+            endpoint (str): Route name (e.g., 'teams')
+            scraper (callable): Scraping function taking *args
+            args (tuple): (league,) or (league, start, end)
+            ttl (float): Maximum age in seconds of a stored copy served without scraping
+            cacheable (callable): Predicate telling whether a scraped value is a success
+        """
+        stored = endpoint in STORED_ENDPOINTS and len(args) == 3
+        if stored:
+            hit = self.get(endpoint, *args)
+            if hit is not None and (self.offline or time.time() - hit[1] < ttl):
+                return hit[0]
+        else:
+            hit = None
+
+        if self.offline:
+            return {
+                "success": False,
+                "data": None,
+                "error": "Offline mode: this data is not available in the local store."
+            }
+
+        value = scraper(*args)
+        if stored and cacheable(value):
+            self.put(endpoint, *args, value)
+        elif hit is not None and not cacheable(value):
+            return hit[0]
+        return value
+
+    async def load_or_scrape_async(self, endpoint: str, scraper, args: tuple, ttl: float, cacheable):
+        """
+        load_or_scrape() for the async engine: scraper is a coroutine function, and the
+        SQLite reads and writes run in the default executor.
+        """
+        if not self.enabled and not self.offline:
+            return await scraper(*args)
+
+        stored = endpoint in STORED_ENDPOINTS and len(args) == 3
+        hit = await asyncio.to_thread(self.get, endpoint, *args) if stored else None
+        if hit is not None and (self.offline or time.time() - hit[1] < ttl):
+            return hit[0]
+
+        if self.offline:
+            return {
+                "success": False,
+                "data": None,
+                "error": "Offline mode: this data is not available in the local store."
+            }
+
+        value = await scraper(*args)
+        if stored and cacheable(value):
+            await asyncio.to_thread(self.put, endpoint, *args, value)
+        elif hit is not None and not cacheable(value):
+            return hit[0]
+        return value
+
+    def load_or_scrape_many(self, endpoint: str, bulk_scraper, seasons: list, ttls: list, cacheable) -> list:
+        """
+        Batched load_or_scrape: seasons missing from the store (or too old) are scraped
+        with a single bulk_scraper call.
+
+        Args:
+            endpoint (str): Route name (e.g., 'intro')
+            bulk_scraper (callable): Function mapping a list of (league, start, end) to a list of results
+            seasons (list): (league, start, end) tuples
+            ttls (list): Maximum age in seconds of a stored copy, per season
+            cacheable (callable): Predicate telling whether a scraped value is a success
+
+        Returns:
+            list: the value of each season, in order
+        """
+        values = [None] * len(seasons)
+        hits, scrape = {}, []
+        for position, (season, ttl) in enumerate(zip(seasons, ttls)):
+            hit = self.get(endpoint, *season) if endpoint in STORED_ENDPOINTS else None
+            if hit is not None and (self.offline or time.time() - hit[1] < ttl):
+                values[position] = hit[0]
+                continue
+            if self.offline:
+                values[position] = {
+                    "success": False,
+                    "data": None,
+                    "error": "Offline mode: this data is not available in the local store."
+                }
+                continue
+            hits[position] = hit
+            scrape.append(position)
+
+        if scrape:
+            for position, value in zip(scrape, bulk_scraper([seasons[p] for p in scrape])):
+                hit = hits[position]
+                if cacheable(value):
+                    if endpoint in STORED_ENDPOINTS:
+                        self.put(endpoint, *seasons[position], value)
+                elif hit is not None:
+                    value = hit[0]
+                values[position] = value
+        return values
+
+    def stats(self) -> dict:
+        if not self.enabled:
+            return {"enabled": False, "offline": self.offline}
+        rows = self._connection().execute("SELECT COUNT(*) FROM seasons").fetchone()[0]
+        return {
+            "enabled": True,
+            "offline": self.offline,
+            "path": self.path,
+            "seasons": rows,
+            "reads": self.reads,
+            "writes": self.writes,
+        }
+
+
+season_store = SeasonStore(STORE_PATH, offline=OFFLINE)
@@ -0,0 +1,160 @@
+import asyncio
+import functools
+import inspect
+import threading
+
+
+def _wrap_key(func, signature, aliases, args, kwargs) -> tuple:
+    # the bound arguments, with the first one (the league key) replaced by its alias target
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    values = list(bound.arguments.values())
+    if aliases is not None and values and isinstance(values[0], str) and values[0] in aliases:
+        values[0] = ("alias", aliases[values[0]])  # never equal to a raw, unknown key
+    return (func.__name__,) + tuple(values)
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls sharing a key: the first caller runs the function,
+    callers arriving while it is in flight wait and receive the same result (or exception).
+    """
+
+    def __init__(self):
+        self.executed = 0
+        self.shared = 0
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn):
+        """
+        Runs fn() once per key among concurrent callers.
+
+        Args:
+            key (hashable): Identity of the call, e.g. ('get_live_league_ranking', 'SerieA')
+            fn (callable): Zero-argument function to execute
+
+        Returns:
+            The value returned by fn, shared by every coalesced caller
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def wrap(self, func=None, *, aliases: dict = None):
+        """
+        Decorator coalescing calls to func whose arguments, once bound to its signature, are equal.
+
+        Args:
+            aliases (dict): Optional mapping of the first argument to its target, e.g. the
+                leagues dictionary, so that 'SerieA' and 'italy' share one call
+        """
+        if func is None:
+            return functools.partial(self.wrap, aliases=aliases)
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _wrap_key(func, signature, aliases, args, kwargs)
+            return self.do(key, lambda: func(*args, **kwargs))
+
+        return wrapper
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: {'executed': int, 'shared': int, 'in_flight': int}
+        """
+        with self._lock:
+            return {
+                "executed": self.executed,
+                "shared": self.shared,
+                "in_flight": len(self._calls),
+            }
+
+
+class AsyncSingleFlight:
+    """
+    SingleFlight for coroutines running on one event loop: the first caller starts a task,
+    callers arriving while it is in flight await the same task. A caller being cancelled
+    does not cancel the shared task.
+    """
+
+    def __init__(self):
+        self.executed = 0
+        self.shared = 0
+        self._calls = {}
+
+    async def do(self, key, fn):
+        """
+        Awaits fn() once per key among concurrent callers.
+
+        Args:
+            key (hashable): Identity of the call
+            fn (callable): Zero-argument coroutine function
+
+        Returns:
+            The value returned by fn, shared by every coalesced caller
+        """
+        task = self._calls.get(key)
+        if task is None:
+            self.executed += 1
+            task = self._calls[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda done: self._calls.pop(key, None) if self._calls.get(key) is done else None)
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def wrap(self, func=None, *, aliases: dict = None):
+        """
+        Decorator coalescing calls to the coroutine function func with equal bound arguments,
+        aliases as in SingleFlight.wrap().
+        """
+        if func is None:
+            return functools.partial(self.wrap, aliases=aliases)
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = _wrap_key(func, signature, aliases, args, kwargs)
+            return await self.do(key, lambda: func(*args, **kwargs))
+
+        return wrapper
+
+    def stats(self) -> dict:
+        return {
+            "executed": self.executed,
+            "shared": self.shared,
+            "in_flight": len(self._calls),
+        }
@@ -0,0 +1,113 @@
+import re
+
+import numpy as np
+
+from app.services.match_index import side_counts, split_match
+
+
+SCORE = re.compile(r"^\s*(\d+)\s*[-–]\s*(\d+)\s*$")
+
+# Rows of the per-team statistics matrix
+PLAYED, WON, DRAWN, LOST, GOALS_FOR, GOALS_AGAINST = range(6)
+
+
+def parse_result(match: dict, counts=None):
+    """
+    Returns (home, away, home_goals, away_goals) for a played match of get_league_giornate,
+    or None for fixtures without a final score. counts are the side_counts() of the season.
+    """
+    teams = split_match(match.get("match") or "", counts)
+    score = SCORE.match(match.get("score") or "")
+    if len(teams) != 2 or not score:
+        return None
+    return teams[0], teams[1], int(score.group(1)), int(score.group(2))
+
+
+class StandingsEngine:
+    """
+    League tables computed from the results of get_league_giornate.
+
+    Team statistics live in a (6, teams) integer matrix updated one matchday at a time with
+    vectorized scatter-adds; a copy is kept after each matchday, so the table after any
+    matchday is read from its snapshot without recomputation.
+    """
+
+    def __init__(self, giornate: list):
+        counts = side_counts(giornate)
+        results = [[r for r in (parse_result(match, counts) for match in rows) if r] for rows in giornate]
+        names = set()
+        for rows in giornate:
+            for match in rows:
+                names.update(split_match(match.get("match") or "", counts))
+        self.teams = sorted(names)
+        self._index = {team: i for i, team in enumerate(self.teams)}
+        self._stats = np.zeros((6, len(self.teams)), dtype=np.int32)
+        self.snapshots = [self._stats.copy()]
+        for rows in results:
+            self.apply_matchday(rows)
+
+    @property
+    def rounds(self) -> int:
+        return len(self.snapshots) - 1
+
+    def apply_matchday(self, results: list):
+        """
+        Adds one matchday of (home, away, home_goals, away_goals) results and snapshots the table.
+        """
+        if results:
+            home = np.array([self._index[r[0]] for r in results])
+            away = np.array([self._index[r[1]] for r in results])
+            home_goals = np.array([r[2] for r in results])
+            away_goals = np.array([r[3] for r in results])
+            home_won = home_goals > away_goals
+            away_won = home_goals < away_goals
+            drawn = ~(home_won | away_won)
+
+            stats = self._stats
+            np.add.at(stats[PLAYED], home, 1)
+            np.add.at(stats[PLAYED], away, 1)
+            np.add.at(stats[WON], home, home_won)
+            np.add.at(stats[WON], away, away_won)
+            np.add.at(stats[LOST], home, away_won)
+            np.add.at(stats[LOST], away, home_won)
+            np.add.at(stats[DRAWN], home, drawn)
+            np.add.at(stats[DRAWN], away, drawn)
+            np.add.at(stats[GOALS_FOR], home, home_goals)
+            np.add.at(stats[GOALS_FOR], away, away_goals)
+            np.add.at(stats[GOALS_AGAINST], home, away_goals)
+            np.add.at(stats[GOALS_AGAINST], away, home_goals)
+        self.snapshots.append(self._stats.copy())
+
+    def table(self, matchday: int = None) -> list:
+        """
+        Returns the league table after a matchday (default: the last one), ordered by points,
+        goal difference, goals scored and team name.
+
+        Returns:
+            list[dict]: rows with the same keys as get_live_league_ranking, as integers
+        """
+        stats = self.snapshots[self.rounds if matchday is None else matchday]
+        points = 3 * stats[WON] + stats[DRAWN]
+        difference = stats[GOALS_FOR] - stats[GOALS_AGAINST]
+        # lexsort keys go from least to most significant
+        order = np.lexsort((
+            np.arange(len(self.teams)),
+            -stats[GOALS_FOR],
+            -difference,
+            -points,
+        ))
+        return [
+            {
+                "Rank": rank,
+                "Team": self.teams[i],
+                "Match": int(stats[PLAYED, i]),
+                "Win": int(stats[WON, i]),
+                "Draw": int(stats[DRAWN, i]),
+                "Loss": int(stats[LOST, i]),
+                "goals scored": int(stats[GOALS_FOR, i]),
+                "goals conceded": int(stats[GOALS_AGAINST, i]),
+                "Goals +/-": int(difference[i]),
+                "Points": int(points[i]),
+            }
+            for rank, i in enumerate(order, start=1)
+        ]
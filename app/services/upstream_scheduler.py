@@ -0,0 +1,207 @@
+import asyncio
+import contextlib
+import contextvars
+import heapq
+import itertools
+import os
+import threading
+import time
+
+import requests
+
+from app.services.rate_limit import TokenBucket, parse_rates
+
+
+# Priority classes, lower is served first
+LIVE = 0
+USER = 1
+BACKGROUND = 2
+PRIORITY_NAMES = {LIVE: "live", USER: "user", BACKGROUND: "background"}
+
+UPSTREAM_RATES = os.environ.get("FOOTBALLAPI_UPSTREAM_RATES", "it.wikipedia.org=10,www.eurosport.it=5")
+UPSTREAM_BURST = float(os.environ.get("FOOTBALLAPI_UPSTREAM_BURST", 5))
+UPSTREAM_MAX_WAIT = float(os.environ.get("FOOTBALLAPI_UPSTREAM_MAX_WAIT", 30))
+
+# How often a coroutine queued behind others checks whether its turn came (seconds)
+ASYNC_POLL_INTERVAL = 0.05
+
+# Priority of upstream requests issued by the current thread/context, unless given explicitly
+current_priority = contextvars.ContextVar("upstream_priority", default=USER)
+
+
+@contextlib.contextmanager
+def upstream_priority(priority: int):
+    """
+    Runs the enclosed scrapes with the given priority class, e.g. BACKGROUND for crawls.
+    """
+    token = current_priority.set(priority)
+    try:
+        yield
+    finally:
+        current_priority.reset(token)
+
+
+class UpstreamBusy(requests.RequestException):
+    """
+    Raised when a request waited longer than max_wait for its turn; scrapers report it
+    like any other request error.
+    """
+
+
+class _HostQueue:
+    def __init__(self, bucket: TokenBucket):
+        self.bucket = bucket
+        self.waiting = []
+        self.condition = threading.Condition()
+        self.granted = {name: 0 for name in PRIORITY_NAMES.values()}
+        self.wait_total = {name: 0.0 for name in PRIORITY_NAMES.values()}
+        self.wait_max = {name: 0.0 for name in PRIORITY_NAMES.values()}
+        self.rejected = 0
+
+
+class UpstreamScheduler:
+    """
+    Central gate for upstream requests: one token bucket per host, and a priority queue in front
+    of it so that live ranking requests overtake user-facing historical requests, which in turn
+    overtake background crawls. Hosts without a configured rate are not limited.
+    Time is read from clock (time.monotonic unless injected).
+    """
+
+    def __init__(self, rates: dict, burst: float = 5, max_wait: float = 30, clock=time.monotonic):
+        self.burst = burst
+        self.max_wait = max_wait
+        self.clock = clock
+        self._hosts = {}
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self.configure(rates)
+
+    def configure(self, rates: dict):
+        """
+        Sets the requests-per-second limit of each host, e.g. {'it.wikipedia.org': 10}.
+        """
+        with self._lock:
+            for host, rate in rates.items():
+                self._hosts[host] = _HostQueue(TokenBucket(rate, self.burst, clock=self.clock))
+
+    def acquire(self, host: str, priority: int = None):
+        """
+        Blocks until a request to host may be sent.
+
+        Args:
+            host (str): Upstream host name (e.g., 'www.eurosport.it')
+            priority (int): LIVE, USER or BACKGROUND; defaults to the context priority
+
+        Raises:
+            UpstreamBusy: if the turn did not come within max_wait seconds
+        """
+        queue = self._hosts.get(host)
+        if queue is None:
+            return
+        priority = current_priority.get() if priority is None else priority
+        name = PRIORITY_NAMES[priority]
+        ticket = (priority, next(self._sequence))
+        started = self.clock()
+        deadline = started + self.max_wait
+
+        with queue.condition:
+            heapq.heappush(queue.waiting, ticket)
+            try:
+                while True:
+                    wait = None
+                    if queue.waiting[0] == ticket:
+                        wait = queue.bucket.delay()
+                        if wait <= 0:
+                            break
+                    remaining = deadline - self.clock()
+                    if remaining <= 0:
+                        queue.rejected += 1
+                        raise UpstreamBusy(f"Upstream {host} busy: no request slot within {self.max_wait:g}s")
+                    queue.condition.wait(remaining if wait is None else min(wait, remaining))
+            finally:
+                queue.waiting.remove(ticket)
+                heapq.heapify(queue.waiting)
+                queue.condition.notify_all()
+
+            self._granted(queue, name, self.clock() - started)
+
+    async def acquire_async(self, host: str, priority: int = None):
+        """
+        Coroutine version of acquire() for the async engine, sharing the same queues and
+        buckets: the turn is awaited with asyncio.sleep instead of blocking a thread.
+
+        Raises:
+            UpstreamBusy: if the turn did not come within max_wait seconds
+        """
+        queue = self._hosts.get(host)
+        if queue is None:
+            return
+        priority = current_priority.get() if priority is None else priority
+        name = PRIORITY_NAMES[priority]
+        ticket = (priority, next(self._sequence))
+        started = self.clock()
+        deadline = started + self.max_wait
+
+        with queue.condition:
+            heapq.heappush(queue.waiting, ticket)
+        try:
+            while True:
+                with queue.condition:
+                    wait = None
+                    if queue.waiting[0] == ticket:
+                        wait = queue.bucket.delay()
+                        if wait <= 0:
+                            break
+                remaining = deadline - self.clock()
+                if remaining <= 0:
+                    with queue.condition:
+                        queue.rejected += 1
+                    raise UpstreamBusy(f"Upstream {host} busy: no request slot within {self.max_wait:g}s")
+                await asyncio.sleep(min(ASYNC_POLL_INTERVAL if wait is None else wait, remaining))
+        finally:
+            with queue.condition:
+                queue.waiting.remove(ticket)
+                heapq.heapify(queue.waiting)
+                queue.condition.notify_all()
+
+        with queue.condition:
+            self._granted(queue, name, self.clock() - started)
+
+    @staticmethod
+    def _granted(queue: _HostQueue, name: str, waited: float):
+        # called with queue.condition held
+        queue.granted[name] += 1
+        queue.wait_total[name] += waited
+        queue.wait_max[name] = max(queue.wait_max[name], waited)
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: per host, the current queue depth by priority and the granted count,
+            mean and max wait (seconds) by priority
+        """
+        with self._lock:
+            hosts = dict(self._hosts)
+        result = {}
+        for host, queue in hosts.items():
+            with queue.condition:
+                depth = {name: 0 for name in PRIORITY_NAMES.values()}
+                for priority, _ in queue.waiting:
+                    depth[PRIORITY_NAMES[priority]] += 1
+                result[host] = {
+                    "rate": queue.bucket.rate,
+                    "queue_depth": depth,
+                    "rejected": queue.rejected,
+                    "priorities": {
+                        name: {
+                            "granted": queue.granted[name],
+                            "mean_wait": queue.wait_total[name] / queue.granted[name] if queue.granted[name] else 0.0,
+                            "max_wait": queue.wait_max[name],
+                        }
+                        for name in PRIORITY_NAMES.values()
+                    },
+                }
+        return result
+
+
+upstream = UpstreamScheduler(parse_rates(UPSTREAM_RATES), burst=UPSTREAM_BURST, max_wait=UPSTREAM_MAX_WAIT)
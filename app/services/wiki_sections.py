@@ -0,0 +1,228 @@
+import threading
+import time
+from collections import OrderedDict
+
+from app.services import http_client
+from app.services.page_cache import CachedPage, PageCache, normalize_title
+from app.services.singleflight import SingleFlight
+
+
+API_URL = "https://it.wikipedia.org/w/api.php"
+
+# Section 0 is the lead of an article, which holds the infobox
+LEAD = None
+
+
+class SectionMissing(LookupError):
+    """
+    Raised when the parse API does not know the page or the page has no such section.
+    """
+
+
+class SectionIndex:
+    """
+    Section numbers of one revision of a page, keyed by heading anchor (e.g., 'Squadre_partecipanti').
+    """
+
+    def __init__(self, title: str, revision: int, anchors: dict):
+        self.title = title
+        self.revision = revision
+        self.anchors = anchors
+        self.fetched_at = time.monotonic()
+
+    def is_fresh(self, ttl: float) -> bool:
+        return time.monotonic() - self.fetched_at < ttl
+
+    def number(self, anchor: str = LEAD) -> int:
+        if anchor is LEAD:
+            return 0
+        if anchor not in self.anchors:
+            raise SectionMissing(f"Section '{anchor}' not found in '{self.title}'.")
+        return self.anchors[anchor]
+
+
+def section_key(index: SectionIndex, number: int) -> str:
+    # page cache key of a section, e.g. 'Serie_A_2023-2024#2'
+    return f"{index.title}#{number}"
+
+
+def parse_reply(data: dict) -> dict:
+    """
+    Returns the 'parse' object of a parse API reply.
+
+    Raises:
+        SectionMissing: if the API answered with an error (e.g., missingtitle, nosuchsection)
+    """
+    if "error" in data:
+        raise SectionMissing(data["error"].get("info") or data["error"].get("code"))
+    return data.get("parse", {})
+
+
+class SectionFetcher:
+    """
+    Fetches single sections of Wikipedia articles through the MediaWiki parse API
+    (action=parse&section=N) instead of the whole rendered article.
+
+    The section index of each page is looked up once and cached for 'ttl' seconds; sections are
+    requested by revision id, so a cached section stays valid as long as the index reports the
+    same revision. Fetched sections are CachedPage objects, memoizing scraper results like
+    full pages do.
+
+    The *_params / store_* / cached_* methods let the async engine (async_scraping.py) fetch
+    through its own HTTP client while sharing these caches.
+    """
+
+    def __init__(self, pages: PageCache, flights: SingleFlight, api_url: str = API_URL,
+                 ttl: float = 300, maxsize: int = 128):
+        self.pages = pages
+        self.api_url = api_url
+        self.flights = flights
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.index_fetches = 0
+        self.section_fetches = 0
+        self.section_bytes = 0
+        self.fallbacks = 0
+        self._indexes = OrderedDict()
+        self._lock = threading.Lock()
+
+    def index(self, page_title: str) -> SectionIndex:
+        """
+        Returns the section index of a page, fetching it when missing or older than ttl.
+
+        Raises:
+            SectionMissing: if the page does not exist
+            requests.RequestException: on network errors
+        """
+        title = normalize_title(page_title)
+        index = self.cached_index(title)
+        if index is None:
+            index = self.flights.do(("sections", title), lambda: self._fetch_index(title))
+        return index
+
+    def cached_index(self, title: str):
+        """
+        Returns the fresh cached index of a normalized title, or None.
+        """
+        with self._lock:
+            index = self._indexes.get(title)
+            if index is not None:
+                self._indexes.move_to_end(title)
+        return index if index is not None and index.is_fresh(self.ttl) else None
+
+    def _fetch_index(self, title: str) -> SectionIndex:
+        return self.store_index(title, self._query(self.index_params(title)))
+
+    def index_params(self, title: str) -> dict:
+        return self.query_params({
+            "action": "parse",
+            "page": title,
+            "prop": "sections|revid",
+            "redirects": 1,
+        })
+
+    def store_index(self, title: str, data: dict) -> SectionIndex:
+        """
+        Builds the index of a page from a parse API reply and caches it. Sections transcluded
+        from templates (index 'T-1', 'T-2'...) cannot be requested by number and are left out.
+        """
+        self.index_fetches += 1
+        index = SectionIndex(
+            title,
+            data.get("revid"),
+            {
+                section["anchor"]: int(section["index"])
+                for section in data.get("sections", [])
+                if str(section.get("index", "")).isdigit()
+            },
+        )
+        with self._lock:
+            self._indexes[title] = index
+            self._indexes.move_to_end(title)
+            while len(self._indexes) > self.maxsize:
+                self._indexes.popitem(last=False)
+        return index
+
+    def section(self, page_title: str, anchor: str = LEAD) -> CachedPage:
+        """
+        Returns one section of a page (the lead when anchor is LEAD) as a CachedPage.
+
+        Args:
+            page_title (str): Page title (e.g., 'Serie_A_2023-2024')
+            anchor (str): Heading anchor of the section (e.g., 'Squadre_partecipanti')
+
+        Raises:
+            SectionMissing: if the page or the section does not exist
+            requests.RequestException: on network errors
+        """
+        index = self.index(page_title)
+        number = index.number(anchor)
+        page = self.cached_section(index, number)
+        if page is not None:
+            return page
+        return self.flights.do(
+            ("section", section_key(index, number), index.revision), lambda: self._fetch_section(index, number)
+        )
+
+    def cached_section(self, index: SectionIndex, number: int):
+        """
+        Returns the cached section of the indexed revision, or None.
+        """
+        page = self.pages.get(section_key(index, number))
+        return page if page is not None and page.revision == index.revision else None
+
+    def _fetch_section(self, index: SectionIndex, number: int) -> CachedPage:
+        return self.store_section(index, number, self._query(self.section_params(index, number)))
+
+    def section_params(self, index: SectionIndex, number: int) -> dict:
+        params = {"action": "parse", "prop": "text", "section": number,
+                  "disableeditsection": 1, "disablelimitreport": 1}
+        if index.revision:
+            params["oldid"] = index.revision
+        else:
+            params["page"] = index.title
+        return self.query_params(params)
+
+    def store_section(self, index: SectionIndex, number: int, data: dict) -> CachedPage:
+        """
+        Caches the section HTML of a parse API reply as a CachedPage.
+        """
+        html = data.get("text", "")
+        self.section_fetches += 1
+        self.section_bytes += len(html)
+        return self.pages.put(section_key(index, number), html, revision=index.revision)
+
+    def clear(self):
+        with self._lock:
+            self._indexes.clear()
+        self.pages.clear()
+
+    def _query(self, params: dict) -> dict:
+        response = http_client.get(self.api_url, params=params)
+        response.raise_for_status()
+        return parse_reply(response.json())
+
+    @staticmethod
+    def query_params(params: dict) -> dict:
+        return {**params, "format": "json", "formatversion": 2}
+
+    def record_fallback(self):
+        with self._lock:
+            self.fallbacks += 1
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: index and section fetch counts, bytes of section HTML received, fallbacks
+            to the full page and the cached sections
+        """
+        with self._lock:
+            indexes = len(self._indexes)
+        return {
+            "indexes": indexes,
+            "index_fetches": self.index_fetches,
+            "section_fetches": self.section_fetches,
+            "section_bytes": self.section_bytes,
+            "fallbacks": self.fallbacks,
+            "pages": self.pages.stats(),
+        }
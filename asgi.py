@@ -0,0 +1,9 @@
+from app.asgi import create_asgi_app
+
+# ASGI entry point, e.g. `uvicorn asgi:app --workers 4` (install httpx for non-blocking upstream requests)
+app = create_asgi_app()
+
+if __name__ == '__main__':
+    import uvicorn
+
+    uvicorn.run(app, host="127.0.0.1", port=5000)
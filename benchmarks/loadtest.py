@@ -0,0 +1,317 @@
+"""
+Load test of the API against a local stand-in for Wikipedia and Eurosport.
+
+A fake upstream serves the benchmark snapshots (see benchmarks/snapshots.py; the pages are
+synthetic) with configurable latency and error injection, the scrapers are pointed at it through
+FOOTBALLAPI_WIKIPEDIA_URL / FOOTBALLAPI_EUROSPORT_URL, and the Flask app of main.py is served
+by a threaded werkzeug server and driven at increasing concurrency. Throughput and
+p50/p95/p99 latency are reported per /api route and concurrency level.
+
+Usage:
+    python -m benchmarks.loadtest --concurrency 1,8,32 --duration 10 --latency 200 --error-rate 0.02
+
+Any FOOTBALLAPI_* variable set in the environment (cache sizes, TTLs, pool size, fetch mode...)
+applies to the app under test, so caching and pooling changes can be compared run against run.
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import requests
+
+from benchmarks.snapshots import SNAPSHOT_DIR
+
+LEAGUES = ["SerieA", "Bundesliga"]
+
+# route -> (weight, query template); {league}, {start} and {end} are filled per request
+MIX = {
+    "/api/ranking": (3, "league={league}"),
+    "/api/scorers": (2, "league={league}&start={start}&end={end}"),
+    "/api/teams": (2, "league={league}&start={start}&end={end}"),
+    "/api/infobox": (1, "league={league}&start={start}&end={end}"),
+    "/api/intro": (1, "league={league}&start={start}&end={end}"),
+    "/api/gamedays": (2, "league={league}&start={start}&end={end}"),
+    "/api/standings": (1, "league={league}&start={start}&end={end}"),
+}
+
+
+def _snapshot(name: str) -> bytes:
+    with open(os.path.join(SNAPSHOT_DIR, name), "rb") as f:
+        return f.read()
+
+
+class FakeUpstream(ThreadingHTTPServer):
+    """
+    Threaded HTTP server standing in for it.wikipedia.org and www.eurosport.it. Every season
+    page is answered with a snapshot, so each league/season is a distinct URL for the caches
+    while the parsing work stays realistic.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 slow_rate: float = 0.0, slow_latency: float = 15.0):
+        super().__init__(("127.0.0.1", 0), _UpstreamHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.slow_rate = slow_rate
+        self.slow_latency = slow_latency
+        self.requests = 0
+        self.errors = 0
+        self.redirects = {}  # path -> location answered with a 301, like a renamed Wikipedia page
+        self._lock = threading.Lock()
+        self.pages = {
+            "serie_a": _snapshot("wikipedia_serie_a_2022-2023.html"),
+            "bundesliga": _snapshot("wikipedia_bundesliga_2023-2024.html"),
+            "ranking": _snapshot("eurosport_classifica_serie-a.html"),
+            "scorers": _snapshot("eurosport_standingperson_serie-a_2022-2023.html"),
+        }
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def delay(self) -> float:
+        if self.slow_rate and random.random() < self.slow_rate:
+            return self.slow_latency
+        return max(0.0, random.gauss(self.latency, self.jitter)) if self.jitter else self.latency
+
+    def article(self, title: str) -> bytes:
+        return self.pages["bundesliga" if "Bundesliga" in title else "serie_a"]
+
+    def answer(self, path: str, query: dict):
+        """
+        Returns:
+            tuple: (status, content type, body)
+        """
+        if path.startswith("/wiki/"):
+            return 200, "text/html; charset=UTF-8", self.article(unquote(path[len("/wiki/"):]))
+        if path.endswith("/classifica.shtml"):
+            return 200, "text/html; charset=UTF-8", self.pages["ranking"]
+        if path.endswith("/standingperson.shtml"):
+            return 200, "text/html; charset=UTF-8", self.pages["scorers"]
+        if path == "/w/api.php":
+            return 200, "application/json", json.dumps(self.api(query)).encode()
+        return 404, "text/plain", b"not found"
+
+    def api(self, query: dict) -> dict:
+        action = query.get("action", [""])[0]
+        if action == "query":
+            titles = query.get("titles", [""])[0].split("|")
+            return {"query": {"pages": {
+                str(number): {"title": title.replace("_", " "), "extract": f"<p><b>{title.replace('_', ' ')}</b> è una stagione.</p>"}
+                for number, title in enumerate(titles, start=1)
+            }}}
+        # action=parse: the section index of a page, or one section (by page or by revision id)
+        if "oldid" in query:
+            marker = f'"wgRevisionId":{query["oldid"][0]}}}'.encode()
+            title = "Bundesliga" if marker in self.pages["bundesliga"] else "Serie_A"
+        else:
+            title = query.get("page", [""])[0]
+        page = self.article(title).decode()
+        sections = page.split("<h2")
+        if "sections" in query.get("prop", [""])[0]:
+            revision = int(page.split('"wgRevisionId":', 1)[1].split("}", 1)[0])
+            return {"parse": {"title": title, "revid": revision, "sections": [
+                {"index": str(number), "anchor": part.split('id="', 1)[1].split('"', 1)[0]}
+                for number, part in enumerate(sections[1:], start=1)
+            ]}}
+        number = int(query.get("section", ["0"])[0])
+        return {"parse": {"title": title, "text": sections[0] if number == 0 else "<h2" + sections[number]}}
+
+
+class _UpstreamHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        with server._lock:
+            server.requests += 1
+        time.sleep(server.delay())
+
+        url = urlsplit(self.path)
+        location = server.redirects.get(url.path)
+        if server.error_rate and random.random() < server.error_rate:
+            with server._lock:
+                server.errors += 1
+            status, content_type, body = 503, "text/plain", b"injected error"
+        elif location is not None:
+            status, content_type, body = 301, "text/plain", b"moved"
+        else:
+            status, content_type, body = server.answer(url.path, parse_qs(url.query))
+
+        self.send_response(status)
+        if status == 301:
+            self.send_header("Location", location)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    # nearest rank
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))]
+
+
+def response_ok(response) -> bool:
+    """
+    A request succeeds when it answers 200 with a body that is not a scraper error, since the
+    API reports upstream failures as {'success': false, ...} with a 200 status.
+    """
+    if response.status_code != 200:
+        return False
+    try:
+        body = response.json()
+    except ValueError:
+        return False
+    return not (isinstance(body, dict) and body.get("success") is False)
+
+
+def run_level(base_url: str, concurrency: int, duration: float, seasons: list) -> dict:
+    """
+    Drives the API with 'concurrency' clients for 'duration' seconds.
+
+    Returns:
+        dict: route -> list of (latency seconds, ok)
+    """
+    routes = list(MIX)
+    weights = [MIX[route][0] for route in routes]
+    samples = defaultdict(list)
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+
+    def client(seed: int):
+        rng = random.Random(seed)
+        session = requests.Session()
+        local = defaultdict(list)
+        while time.monotonic() < deadline:
+            route = rng.choices(routes, weights)[0]
+            start, end = rng.choice(seasons)
+            query = MIX[route][1].format(league=rng.choice(LEAGUES), start=start, end=end)
+            started = time.perf_counter()
+            try:
+                response = session.get(f"{base_url}{route}?{query}", timeout=60)
+                ok = response_ok(response)
+            except requests.RequestException:
+                ok = False
+            local[route].append((time.perf_counter() - started, ok))
+        with lock:
+            for route, values in local.items():
+                samples[route].extend(values)
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return samples
+
+
+def summarize(samples: dict, duration: float) -> list:
+    rows = []
+    for route in sorted(samples):
+        values = samples[route]
+        latencies = sorted(latency for latency, _ in values)
+        rows.append({
+            "route": route,
+            "requests": len(values),
+            "errors": sum(1 for _, ok in values if not ok),
+            "rps": round(len(values) / duration, 1),
+            "mean_ms": round(statistics.fmean(latencies) * 1000, 1),
+            "p50_ms": round(percentile(latencies, 0.50) * 1000, 1),
+            "p95_ms": round(percentile(latencies, 0.95) * 1000, 1),
+            "p99_ms": round(percentile(latencies, 0.99) * 1000, 1),
+        })
+    return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--concurrency", default="1,4,16,32", help="comma separated client counts (default: 1,4,16,32)")
+    parser.add_argument("--duration", type=float, default=10, help="seconds per concurrency level (default: 10)")
+    parser.add_argument("--seasons", type=int, default=5,
+                        help="distinct seasons requested, fewer means more cache hits (default: 5)")
+    parser.add_argument("--latency", type=float, default=150, help="upstream latency in ms (default: 150)")
+    parser.add_argument("--jitter", type=float, default=50, help="standard deviation of the upstream latency in ms (default: 50)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of upstream requests answered 503")
+    parser.add_argument("--slow-rate", type=float, default=0.0, help="fraction of upstream requests delayed by --slow-latency")
+    parser.add_argument("--slow-latency", type=float, default=15000, help="delay of slow upstream requests in ms (default: 15000)")
+    parser.add_argument("--shared-cache", choices=("file", "redis"),
+                        help="put the shared response cache tier in front of the scrapers; 'redis' starts "
+                             "benchmarks/redis_standin.py")
+    parser.add_argument("--json", help="write the per-level results to this file")
+    args = parser.parse_args(argv)
+
+    upstream = FakeUpstream(args.latency / 1000, args.jitter / 1000, args.error_rate,
+                            args.slow_rate, args.slow_latency / 1000)
+    threading.Thread(target=upstream.serve_forever, daemon=True).start()
+
+    # two host names for the same server, so that each upstream keeps its own breaker and queue
+    os.environ["FOOTBALLAPI_WIKIPEDIA_URL"] = upstream.url
+    os.environ["FOOTBALLAPI_EUROSPORT_URL"] = upstream.url.replace("127.0.0.1", "localhost")
+    os.environ.setdefault("FOOTBALLAPI_UPSTREAM_RATES", "")
+    os.environ.setdefault("FOOTBALLAPI_STORE_PATH", "")
+    os.environ.setdefault("FOOTBALLAPI_LIVE_LEAGUES", "")
+    if args.shared_cache:
+        os.environ["FOOTBALLAPI_CACHE_BACKEND"] = args.shared_cache
+        os.environ.setdefault("FOOTBALLAPI_CACHE_PATH", tempfile.mkdtemp(prefix="footballapi-cache-"))
+    if args.shared_cache == "redis":
+        from benchmarks.redis_standin import RedisStandIn
+
+        redis = RedisStandIn()
+        threading.Thread(target=redis.serve_forever, daemon=True).start()
+        os.environ["FOOTBALLAPI_CACHE_URL"] = redis.url
+
+    from werkzeug.serving import make_server
+    from main import app
+
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    seasons = [(year, year + 1) for year in range(2022 - args.seasons + 1, 2023)]
+    results = []
+    print(f"{'clients':>7}  {'route':<16}{'requests':>9}{'errors':>8}{'req/s':>8}{'mean ms':>9}"
+          f"{'p50 ms':>8}{'p95 ms':>8}{'p99 ms':>8}")
+    for concurrency in [int(c) for c in args.concurrency.split(",") if c]:
+        served_before, errors_before = upstream.requests, upstream.errors
+        rows = summarize(run_level(base_url, concurrency, args.duration, seasons), args.duration)
+        for row in rows:
+            print(f"{concurrency:>7}  {row['route']:<16}{row['requests']:>9}{row['errors']:>8}{row['rps']:>8}"
+                  f"{row['mean_ms']:>9}{row['p50_ms']:>8}{row['p95_ms']:>8}{row['p99_ms']:>8}")
+        total = sum(row["requests"] for row in rows)
+        upstream_requests, upstream_errors = upstream.requests - served_before, upstream.errors - errors_before
+        print(f"{concurrency:>7}  {'all':<16}{total:>9}{sum(row['errors'] for row in rows):>8}"
+              f"{round(total / args.duration, 1):>8}   upstream requests: {upstream_requests}"
+              f" ({upstream_errors} injected errors)\n")
+        results.append({"concurrency": concurrency, "routes": rows,
+                        "upstream_requests": upstream_requests, "upstream_errors": upstream_errors})
+
+    server.shutdown()
+    upstream.shutdown()
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=1)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
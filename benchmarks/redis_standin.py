@@ -0,0 +1,170 @@
+"""
+In-memory stand-in for a Redis server, speaking enough of its protocol (RESP) for the shared
+response cache: GET, SET (EX/PX/NX), DEL, EXISTS, SCAN, FLUSHDB, PING, SELECT and AUTH.
+
+It lets FOOTBALLAPI_CACHE_BACKEND=redis be tried with several worker processes without
+installing Redis. Keys expire like in Redis; nothing is persisted.
+
+Usage:
+    python -m benchmarks.redis_standin --port 6379
+    FOOTBALLAPI_CACHE_BACKEND=redis FOOTBALLAPI_CACHE_URL=redis://127.0.0.1:6379/0 gunicorn -w 4 main:app
+"""
+import argparse
+import fnmatch
+import socketserver
+import sys
+import threading
+import time
+
+
+# Databases selectable with SELECT, as in a default Redis configuration
+DATABASES = 16
+
+
+class RespError(Exception):
+    pass
+
+
+class RedisStandIn(socketserver.ThreadingTCPServer):
+    """
+    Threaded RESP server on host:port (port 0 picks a free one). Counts the commands served.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, password: str = None):
+        super().__init__((host, port), RespHandler)
+        self.password = password
+        self.databases = {}  # db -> {key: (value, expires_at or None)}
+        self.commands = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"redis://127.0.0.1:{self.server_address[1]}/0"
+
+    def execute(self, db: int, command: list):
+        name, args = command[0].upper(), command[1:]
+        with self.lock:
+            self.commands += 1
+            data = self.databases.setdefault(db, {})
+            now = time.monotonic()
+            for key in [key for key, (_, expires_at) in data.items() if expires_at is not None and expires_at <= now]:
+                del data[key]
+
+            if name == b"PING":
+                return args[0] if args else "PONG"
+            if name == b"GET":
+                item = data.get(args[0])
+                return None if item is None else item[0]
+            if name == b"SET":
+                return self._set(data, args, now)
+            if name == b"DEL":
+                return sum(data.pop(key, None) is not None for key in args)
+            if name == b"EXISTS":
+                return sum(key in data for key in args)
+            if name == b"SCAN":
+                return self._scan(data, args)
+            if name == b"FLUSHDB":
+                data.clear()
+                return "OK"
+        raise RespError(f"ERR unknown command '{name.decode('latin-1')}'")
+
+    @staticmethod
+    def _set(data: dict, args: list, now: float):
+        key, value, options = args[0], args[1], [arg.upper() for arg in args[2:]]
+        expires_at = None
+        if b"EX" in options:
+            expires_at = now + int(options[options.index(b"EX") + 1])
+        if b"PX" in options:
+            expires_at = now + int(options[options.index(b"PX") + 1]) / 1000
+        if b"NX" in options and key in data:
+            return None
+        data[key] = (value, expires_at)
+        return "OK"
+
+    @staticmethod
+    def _scan(data: dict, args: list):
+        # returns every match in one page, which any client looping on the cursor accepts
+        pattern = b"*"
+        if b"MATCH" in [arg.upper() for arg in args]:
+            pattern = args[[arg.upper() for arg in args].index(b"MATCH") + 1]
+        keys = [key for key in data if fnmatch.fnmatchcase(key.decode("latin-1"), pattern.decode("latin-1"))]
+        return [b"0", keys]
+
+
+class RespHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        db, authenticated = 0, self.server.password is None
+        while True:
+            try:
+                command = self._read_command()
+            except (ConnectionError, ValueError):
+                return
+            if command is None:
+                return
+            name = command[0].upper()
+            try:
+                if name == b"AUTH":
+                    authenticated = command[-1].decode("utf-8") == self.server.password
+                    reply = "OK" if authenticated else RespError("WRONGPASS invalid password")
+                elif not authenticated:
+                    reply = RespError("NOAUTH Authentication required.")
+                elif name == b"SELECT":
+                    if not 0 <= int(command[1]) < DATABASES:
+                        raise RespError("ERR DB index is out of range")
+                    db, reply = int(command[1]), "OK"
+                else:
+                    reply = self.server.execute(db, command)
+            except RespError as e:
+                reply = e
+            except (IndexError, ValueError):
+                reply = RespError(f"ERR wrong arguments for '{name.decode('latin-1')}' command")
+            self.wfile.write(encode(reply))
+
+    def _read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        if not line.startswith(b"*"):
+            return line.split()  # inline command, e.g. from telnet
+        command = []
+        for _ in range(int(line[1:])):
+            length = int(self.rfile.readline()[1:])
+            command.append(self.rfile.read(length + 2)[:-2])
+        return command
+
+
+def encode(reply) -> bytes:
+    if reply is None:
+        return b"$-1\r\n"
+    if isinstance(reply, RespError):
+        return b"-%s\r\n" % str(reply).encode("utf-8")
+    if isinstance(reply, str):
+        return b"+%s\r\n" % reply.encode("utf-8")
+    if isinstance(reply, int):
+        return b":%d\r\n" % reply
+    if isinstance(reply, bytes):
+        return b"$%d\r\n%s\r\n" % (len(reply), reply)
+    return b"*%d\r\n" % len(reply) + b"".join(encode(item) for item in reply)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6379)
+    parser.add_argument("--password", help="require AUTH with this password")
+    args = parser.parse_args(argv)
+
+    server = RedisStandIn(args.host, args.port, args.password)
+    print(f"Listening on {args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,218 @@
+"""
+Offline scraper benchmarks: parse throughput, memory and output equality on saved snapshots.
+
+Every upstream request is answered from benchmarks/snapshots (see benchmarks/snapshots.py;
+the pages are synthetic), so the numbers only measure this code: no network, no rate limits,
+and page caches are cleared before each call so every call parses its page again.
+
+Usage:
+    python -m benchmarks.run                    # all scrapers, compared with benchmarks/expected
+    python -m benchmarks.run --repeat 50 --parser html.parser
+    python -m benchmarks.run --json before.json  # keep the numbers to compare two branches
+    python -m benchmarks.run --record            # rewrite the expected outputs after a deliberate change
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from requests.adapters import BaseAdapter
+from requests.models import Response
+
+from benchmarks.snapshots import SNAPSHOT_DIR
+
+EXPECTED_DIR = os.path.join(os.path.dirname(__file__), "expected")
+
+# URL path -> snapshot file
+ROUTES = {
+    "/wiki/Serie_A_2022-2023": "wikipedia_serie_a_2022-2023.html",
+    "/wiki/Bundesliga_2023-2024": "wikipedia_bundesliga_2023-2024.html",
+    "/calcio/serie-a/classifica.shtml": "eurosport_classifica_serie-a.html",
+    "/calcio/serie-a/2022-2023/standingperson.shtml": "eurosport_standingperson_serie-a_2022-2023.html",
+}
+
+# name -> (scraper, arguments, snapshot parsed by the call)
+CASES = {
+    "infobox_serie_a": ("get_infobox_it", ("SerieA", 2022, 2023), "/wiki/Serie_A_2022-2023"),
+    "infobox_bundesliga": ("get_infobox_it", ("Bundesliga", 2023, 2024), "/wiki/Bundesliga_2023-2024"),
+    "teams_serie_a": ("get_league_teams", ("SerieA", 2022, 2023), "/wiki/Serie_A_2022-2023"),
+    "teams_bundesliga": ("get_league_teams", ("Bundesliga", 2023, 2024), "/wiki/Bundesliga_2023-2024"),
+    "ranking_serie_a": ("get_live_league_ranking", ("SerieA",), "/calcio/serie-a/classifica.shtml"),
+    "scorers_serie_a": ("scrape_top_scorers", ("SerieA", 2022, 2023), "/calcio/serie-a/2022-2023/standingperson.shtml"),
+    "gamedays_serie_a": ("get_league_giornate", ("SerieA", 2022, 2023), "/wiki/Serie_A_2022-2023"),
+    "gamedays_bundesliga": ("get_league_giornate", ("Bundesliga", 2023, 2024), "/wiki/Bundesliga_2023-2024"),
+}
+
+
+def load_snapshot(path: str) -> bytes:
+    with open(os.path.join(SNAPSHOT_DIR, ROUTES[path]), "rb") as f:
+        return f.read()
+
+
+class SnapshotAdapter(BaseAdapter):
+    """
+    requests transport answering from the snapshots: article URLs get the saved page, parse API
+    calls (action=parse) get the section index or a section cut from it; anything else is a 404.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.requests = 0
+
+    def send(self, request, **kwargs):
+        self.requests += 1
+        url = urlsplit(request.url)
+        response = Response()
+        response.url = request.url
+        response.request = request
+        response.status_code = 200
+        response.encoding = "utf-8"
+
+        if url.path == "/w/api.php":
+            response._content = json.dumps(self._parse_api(parse_qs(url.query))).encode()
+            response.headers["Content-Type"] = "application/json"
+        elif unquote(url.path) in ROUTES:
+            response._content = load_snapshot(unquote(url.path))
+            response.headers["Content-Type"] = "text/html; charset=UTF-8"
+        else:
+            response.status_code = 404
+            response._content = b""
+        return response
+
+    def _parse_api(self, query: dict) -> dict:
+        if "oldid" in query:
+            # sections are requested by revision id
+            marker = f'"wgRevisionId":{query["oldid"][0]}}}'.encode()
+            path = next((p for p in ROUTES if p.startswith("/wiki/") and marker in load_snapshot(p)), None)
+        else:
+            path = "/wiki/" + query["page"][0]
+        title = path[len("/wiki/"):] if path else None
+        if path not in ROUTES:
+            return {"error": {"code": "missingtitle", "info": "The page you specified doesn't exist."}}
+
+        page = load_snapshot(path).decode()
+        sections = page.split("<h2")
+        if "sections" in query.get("prop", [""])[0]:
+            anchors = [part.split('id="', 1)[1].split('"', 1)[0] for part in sections[1:]]
+            revision = int(page.split('"wgRevisionId":', 1)[1].split("}", 1)[0])
+            return {"parse": {"title": title, "revid": revision, "sections": [
+                {"index": str(number), "anchor": anchor} for number, anchor in enumerate(anchors, start=1)
+            ]}}
+        number = int(query["section"][0])
+        return {"parse": {"title": title, "text": sections[0] if number == 0 else "<h2" + sections[number]}}
+
+    def close(self):
+        pass
+
+
+def normalize(result):
+    # get_league_giornate returns a JSON string, the other scrapers dicts
+    return json.loads(result) if isinstance(result, str) else json.loads(json.dumps(result))
+
+
+def run_case(name: str, scraper, args: tuple, size: int, repeat: int, reset) -> dict:
+    reset()
+    scraper(*args)  # warm-up: imports, strainers, interned strings
+
+    timings = []
+    for _ in range(repeat):
+        reset()
+        started = time.perf_counter()
+        result = scraper(*args)
+        timings.append(time.perf_counter() - started)
+
+    reset()
+    tracemalloc.start()
+    scraper(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    mean = statistics.fmean(timings)
+    return {
+        "case": name,
+        "calls": repeat,
+        "mean_ms": round(mean * 1000, 3),
+        "median_ms": round(statistics.median(timings) * 1000, 3),
+        "min_ms": round(min(timings) * 1000, 3),
+        "calls_per_s": round(1 / mean, 1) if mean else None,
+        "mb_per_s": round(size / mean / 1e6, 2) if mean else None,
+        "peak_kib": round(peak / 1024, 1),
+        "result": normalize(result),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="timed calls per case (default: 20)")
+    parser.add_argument("--cases", default=",".join(CASES), help="comma separated cases (default: all)")
+    parser.add_argument("--parser", help="FOOTBALLAPI_HTML_PARSER for this run (auto, lxml, html.parser, html5lib)")
+    parser.add_argument("--fetch", choices=["page", "sections"], default="page",
+                        help="FOOTBALLAPI_WIKI_FETCH for this run (default: page)")
+    parser.add_argument("--json", help="write the measurements to this file")
+    parser.add_argument("--record", action="store_true", help="store the outputs as the new expected results")
+    args = parser.parse_args(argv)
+
+    unknown = [c for c in args.cases.split(",") if c and c not in CASES]
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(unknown)}")
+
+    # configuration is read at import time: no rate limits, no store, no background refresh
+    os.environ["FOOTBALLAPI_UPSTREAM_RATES"] = ""
+    os.environ["FOOTBALLAPI_STORE_PATH"] = ""
+    os.environ["FOOTBALLAPI_LIVE_LEAGUES"] = ""
+    os.environ["FOOTBALLAPI_WIKI_FETCH"] = args.fetch
+    if args.parser:
+        os.environ["FOOTBALLAPI_HTML_PARSER"] = args.parser
+
+    from app.services import http_client, scraping
+
+    adapter = SnapshotAdapter()
+    session = http_client.get_session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    def reset():
+        scraping.season_pages.clear()
+        scraping.season_sections.pages.clear()
+
+    rows, failures = [], 0
+    for name in [c for c in args.cases.split(",") if c]:
+        function, call_args, path = CASES[name]
+        row = run_case(name, getattr(scraping, function), call_args, len(load_snapshot(path)), args.repeat, reset)
+
+        expected_path = os.path.join(EXPECTED_DIR, f"{name}.json")
+        if args.record:
+            os.makedirs(EXPECTED_DIR, exist_ok=True)
+            with open(expected_path, "w", encoding="utf-8") as f:
+                json.dump(row["result"], f, ensure_ascii=False, indent=1, sort_keys=True)
+                f.write("\n")
+            row["output"] = "recorded"
+        elif not os.path.exists(expected_path):
+            row["output"] = "no expected output"
+        else:
+            with open(expected_path, encoding="utf-8") as f:
+                row["output"] = "equal" if json.load(f) == row["result"] else "DIFFERENT"
+        failures += row["output"] == "DIFFERENT"
+        rows.append(row)
+
+    header = f"{'case':<22}{'mean ms':>10}{'median ms':>11}{'min ms':>9}{'calls/s':>10}{'MB/s':>8}{'peak KiB':>10}  output"
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        print(f"{row['case']:<22}{row['mean_ms']:>10}{row['median_ms']:>11}{row['min_ms']:>9}"
+              f"{row['calls_per_s']:>10}{row['mb_per_s']:>8}{row['peak_kib']:>10}  {row['output']}")
+    print(f"\nparser: {os.environ.get('FOOTBALLAPI_HTML_PARSER', 'auto')}, fetch: {args.fetch}, "
+          f"upstream requests served from snapshots: {adapter.requests}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump([{k: v for k, v in row.items() if k != "result"} for row in rows], f, indent=1)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,173 @@
+"""
+Generates the HTML snapshots used by the benchmark suite.
+
+The snapshots are synthetic: they reproduce the markup the scrapers read on it.wikipedia.org
+season articles (infobox sinottico, 'Squadre partecipanti' wikitable, one 99%-wide table per
+matchday under an h3 heading, plus navigation boxes, references and prose of realistic size)
+and on Eurosport 'classifica.shtml' / 'standingperson.shtml' pages. Team and player names are
+made up; the content is generated from a fixed seed so that the files are reproducible.
+
+Usage:
+    python -m benchmarks.snapshots    # rewrites benchmarks/snapshots/*.html
+"""
+import html
+import os
+import random
+
+SNAPSHOT_DIR = os.path.join(os.path.dirname(__file__), "snapshots")
+
+CITIES = ["Milano", "Torino", "Roma", "Napoli", "Firenze", "Bologna", "Genova", "Verona", "Bergamo", "Udine",
+          "Lecce", "Salerno", "Empoli", "Monza", "Cremona", "Sassuolo", "La Spezia", "Frosinone", "Cagliari",
+          "Venezia"]
+
+
+def _schedule(teams: list) -> list:
+    """
+    Double round robin (circle method): a list of matchdays, each a list of (home, away).
+    """
+    rotation = list(teams)
+    rounds = []
+    for _ in range(len(teams) - 1):
+        half = len(rotation) // 2
+        rounds.append(list(zip(rotation[:half], reversed(rotation[half:]))))
+        rotation.insert(1, rotation.pop())
+    return rounds + [[(away, home) for home, away in matchday] for matchday in rounds]
+
+
+def _filler(rng: random.Random, count: int) -> str:
+    # prose, references and navboxes: markup the restricted parser has to skip
+    parts = []
+    for i in range(count):
+        parts.append(
+            f'<div class="navbox"><p>Paragrafo {i} con <a href="/wiki/Voce_{i}" title="Voce {i}">collegamento</a>, '
+            f'<i>corsivo</i> e una nota<sup class="reference"><a href="#cite_note-{i}">[{i}]</a></sup>. '
+            f'{" ".join(rng.choice(["stagione", "campionato", "girone", "squadra", "rete", "classifica"]) for _ in range(12))}.</p>'
+            f'<ul><li><a href="/wiki/A{i}">A</a></li><li><a href="/wiki/B{i}">B</a></li></ul></div>'
+        )
+    return "\n".join(parts)
+
+
+def wikipedia_season_page(title: str, teams: int, played_rounds: int, seed: int) -> str:
+    """
+    A season article with 'teams' clubs, the full double round robin calendar and results
+    for the first 'played_rounds' matchdays (later matches show their kick-off time).
+    """
+    rng = random.Random(seed)
+    names = [f"{CITIES[i % len(CITIES)]} FC {i}" for i in range(teams)]
+    winner = rng.choice(names)
+
+    parts = [
+        f'<!DOCTYPE html><html><head><title>{title.replace("_", " ")} - Wikipedia</title>'
+        f'<script>RLCONF={{"wgPageName":"{title}","wgRevisionId":{seed * 1000 + 17}}};</script></head>'
+        '<body><div id="content"><div class="mw-parser-output">',
+        f'<table class="infobox sinottico"><tr><th colspan="2">{title.replace("_", " ")}</th></tr>'
+        '<tr><th>Competizione</th><td>Campionato</td></tr><tr><th>Sport</th><td><a href="/wiki/Calcio">Calcio</a></td></tr>'
+        f'<tr><th>Edizione</th><td>{seed}ª</td></tr><tr><th>Organizzatore</th><td>Lega</td></tr>'
+        f'<tr><th>Date</th><td>dal 20 agosto 2022<br/>al 4 giugno 2023</td></tr><tr><th>Luogo</th><td>Italia</td></tr>'
+        f'<tr><th>Partecipanti</th><td>{teams}</td></tr><tr><th colspan="2">Risultati</th></tr>'
+        f'<tr><th>Vincitore</th><td><a href="#">{winner}</a> <small>(3º titolo)</small></td></tr>'
+        f'<tr><th>Retrocessioni</th><td>{names[-1]}<br/>{names[-2]}<br/>{names[-3]}</td></tr>'
+        f'<tr><th colspan="2">Statistiche</th></tr><tr><th>Incontri disputati</th><td>{played_rounds * teams // 2}</td></tr>'
+        '</table>',
+        f'<p>La <b>{title.replace("_", " ")}</b> è la stagione del campionato.</p>',
+        _filler(rng, 120),
+        '<h2><span class="mw-headline" id="Squadre_partecipanti">Squadre partecipanti</span></h2>'
+        '<table class="wikitable sortable"><tr><th>Squadra</th><th>Città</th><th>Stadio</th><th>Capienza</th></tr>',
+    ]
+    for name in names:
+        parts.append(
+            f'<tr><td><a href="/wiki/{name.replace(" ", "_")}">{name}</a></td><td>{name.split(" FC")[0]}</td>'
+            f'<td>Stadio {html.escape(name)}</td><td>{rng.randint(9, 80) * 1000}</td></tr>'
+        )
+    parts.append('</table>')
+    parts.append(_filler(rng, 80))
+    parts.append('<h2><span class="mw-headline" id="Calendario">Calendario</span></h2>')
+
+    for number, matchday in enumerate(_schedule(names), start=1):
+        day = f"{(number * 7) % 28 + 1}/{(number // 4 + 8) % 12 + 1}"
+        parts.append(f'<h3><span class="mw-headline" id="{number}ª_giornata">{number}ª giornata</span></h3>')
+        parts.append(f'<table width="99%" class="wikitable"><tr><th colspan="3">{number}ª giornata</th></tr>')
+        for home, away in matchday:
+            if number <= played_rounds:
+                result = f"{rng.choice([0, 0, 1, 1, 1, 2, 2, 3, 4])}-{rng.choice([0, 0, 1, 1, 2, 2, 3])}"
+                parts.append(f'<tr><td>{day}</td><td>{home}-{away}</td><td>{result}</td></tr>')
+            else:
+                parts.append(f'<tr><td>{day}</td><td>{home}-{away}</td><td>{rng.choice(["15:00", "18:00", "20:45"])}</td></tr>')
+        parts.append('</table>')
+
+    parts.append('<h2><span class="mw-headline" id="Note">Note</span></h2>')
+    parts.append(_filler(rng, 300))
+    parts.append('</div></div></body></html>')
+    return "\n".join(parts)
+
+
+def eurosport_ranking_page(teams: int, seed: int) -> str:
+    """
+    A Eurosport 'classifica.shtml' standings table.
+    """
+    rng = random.Random(seed)
+    names = [f"{CITIES[i % len(CITIES)]} FC {i}" for i in range(teams)]
+    rng.shuffle(names)
+    rows = []
+    for rank, name in enumerate(names, start=1):
+        win, draw = rng.randint(5, 25), rng.randint(3, 12)
+        loss = 38 - win - draw
+        scored, conceded = rng.randint(25, 85), rng.randint(20, 70)
+        cells = ["", rank, f'<img src="/logo/{rank}.png"/>', name, "", 38, win, draw, loss, scored, conceded,
+                 scored - conceded, 3 * win + draw, "VVPSN"]
+        rows.append('<tr data-testid="table-row-data">' + "".join(f"<td>{cell}</td>" for cell in cells) + "</tr>")
+    return (
+        '<!DOCTYPE html><html><head><title>Classifica</title></head><body>'
+        + _filler(rng, 60)
+        + '<table data-testid="table"><thead><tr><th></th><th>#</th><th></th><th>Squadra</th><th></th><th>G</th>'
+        '<th>V</th><th>N</th><th>P</th><th>GF</th><th>GS</th><th>DR</th><th>PT</th><th>Forma</th></tr></thead><tbody>'
+        + "\n".join(rows)
+        + "</tbody></table>"
+        + _filler(rng, 60)
+        + "</body></html>"
+    )
+
+
+def eurosport_scorers_page(players: int, seed: int) -> str:
+    """
+    A Eurosport 'standingperson.shtml' top scorers table.
+    """
+    rng = random.Random(seed)
+    rows = ["<tr><th>Pos</th><th>Giocatore</th><th>Squadra</th><th>Pres</th><th>Gol</th></tr>"]
+    goals = 30
+    for position in range(1, players + 1):
+        goals = max(1, goals - rng.choice([0, 0, 1]))
+        team = f"{CITIES[rng.randrange(len(CITIES))]} FC {rng.randrange(20)}"
+        player = f"Giocatore {position} D&#39;Angelo" if position % 7 == 0 else f"Giocatore {position}"
+        rows.append(
+            f'<tr><td>{position}</td><td>{player}<span class="team-name">{team}</span></td>'
+            f'<td>{team}</td><td>{rng.randint(goals, 38)}</td><td>{goals}</td></tr>'
+        )
+    return (
+        '<!DOCTYPE html><html><head><title>Marcatori</title></head><body>'
+        + _filler(rng, 40)
+        + '<table class="standing-table">' + "\n".join(rows) + "</table>"
+        + _filler(rng, 40)
+        + "</body></html>"
+    )
+
+
+SNAPSHOTS = {
+    "wikipedia_serie_a_2022-2023.html": lambda: wikipedia_season_page("Serie_A_2022-2023", 20, 38, seed=91),
+    "wikipedia_bundesliga_2023-2024.html": lambda: wikipedia_season_page("Bundesliga_2023-2024", 18, 21, seed=61),
+    "eurosport_classifica_serie-a.html": lambda: eurosport_ranking_page(20, seed=7),
+    "eurosport_standingperson_serie-a_2022-2023.html": lambda: eurosport_scorers_page(60, seed=8),
+}
+
+
+def write_snapshots(directory: str = SNAPSHOT_DIR):
+    os.makedirs(directory, exist_ok=True)
+    for name, build in SNAPSHOTS.items():
+        with open(os.path.join(directory, name), "w", encoding="utf-8") as f:
+            f.write(build())
+
+
+if __name__ == '__main__':
+    write_snapshots()
+    for name in SNAPSHOTS:
+        print(name, os.path.getsize(os.path.join(SNAPSHOT_DIR, name)), "bytes")
@@ -0,0 +1,168 @@
+"""
+Warms the persistent season store by crawling a grid of leagues x seasons x endpoints.
+
+Usage:
+    FOOTBALLAPI_STORE_PATH=seasons.sqlite3 python crawl.py --leagues SerieA,PremierLeague --start 2015 --end 2024
+
+Seasons already stored and still fresh are skipped, so an interrupted crawl resumes where it stopped.
+"""
+import argparse
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.routes import ENDPOINTS
+from app.services.rate_limit import parse_rates
+from app.services.response_cache import ttl_for
+from app.services.scraping import leagues, leaguesGiornate, leaguesScorers
+from app.services.season_store import SeasonStore, season_store
+from app.services.upstream_scheduler import BACKGROUND, upstream, upstream_priority
+
+CRAWLED_ENDPOINTS = ["intro", "infobox", "teams", "gamedays", "scorers"]
+
+# League dictionary of each endpoint's scraper: a league missing from it can never be stored
+ENDPOINT_LEAGUES = {
+    "intro": leagues,
+    "infobox": leagues,
+    "teams": leagues,
+    "gamedays": leaguesGiornate,
+    "scorers": leaguesScorers,
+}
+
+DEFAULT_RATES = "it.wikipedia.org=5,www.eurosport.it=2"
+
+
+def default_leagues() -> list:
+    # first key of each league, skipping the country aliases
+    seen, keys = set(), []
+    for key, prefix in leagues.items():
+        if prefix not in seen:
+            seen.add(prefix)
+            keys.append(key)
+    return keys
+
+
+def build_jobs(league_keys: list, start: int, end: int, endpoints: list) -> list:
+    """
+    Returns the (endpoint, league, start, end) jobs of a crawl, ordered by league, then season,
+    then endpoint: the endpoints of a season share one Wikipedia page. A league is crawled only
+    for the endpoints whose scraper supports it.
+    """
+    return [
+        (endpoint, league, year, year + 1)
+        for league in league_keys
+        for year in range(start, end)
+        for endpoint in endpoints
+        if league in ENDPOINT_LEAGUES[endpoint]
+    ]
+
+
+class Progress:
+    def __init__(self, total: int, every: float = 2.0):
+        self.total = total
+        self.every = every
+        self.counts = {"ok": 0, "skipped": 0, "failed": 0}
+        self.started = time.monotonic()
+        self._reported = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, outcome: str, job=None, error: str = None):
+        with self._lock:
+            self.counts[outcome] += 1
+            if error:
+                print(f"  failed {job}: {error}", file=sys.stderr)
+            now = time.monotonic()
+            if now - self._reported >= self.every or self.done == self.total:
+                self._reported = now
+                self.report(now)
+
+    @property
+    def done(self) -> int:
+        return sum(self.counts.values())
+
+    def report(self, now: float):
+        elapsed = now - self.started
+        rate = self.done / elapsed if elapsed else 0.0
+        print(
+            f"[{self.done}/{self.total}] ok={self.counts['ok']} skipped={self.counts['skipped']} "
+            f"failed={self.counts['failed']} ({rate:.1f} jobs/s)",
+            file=sys.stderr,
+        )
+
+
+def crawl(store: SeasonStore, jobs: list, workers: int, force: bool = False) -> dict:
+    """
+    Runs (endpoint, league, start, end) jobs on a bounded pool, writing results into store.
+    Upstream requests are issued with BACKGROUND priority, behind any user-facing request.
+
+    Returns:
+        dict: {'ok': int, 'skipped': int, 'failed': int}
+    """
+    progress = Progress(len(jobs))
+
+    def run(job):
+        endpoint, league, start, end = job
+        scraper, _, cacheable = ENDPOINTS[endpoint]
+        ttl = ttl_for(endpoint, start, end)
+        stored = store.get(endpoint, league, start, end)
+        if stored is not None and not force and time.time() - stored[1] < ttl:
+            progress.add("skipped")
+            return
+
+        try:
+            with upstream_priority(BACKGROUND):
+                value = scraper(league, start, end)
+        except Exception as e:
+            progress.add("failed", job, f"Internal error: {str(e)}")
+            return
+        if cacheable(value):
+            store.put(endpoint, league, start, end, value)
+            progress.add("ok")
+        else:
+            error = value.get("error") if isinstance(value, dict) else value
+            progress.add("failed", job, str(error)[:200])
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="crawl") as pool:
+        list(pool.map(run, jobs))
+    return progress.counts
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--leagues", default=",".join(default_leagues()),
+                        help="comma separated league keys (default: every league)")
+    parser.add_argument("--start", type=int, required=True, help="start year of the first season")
+    parser.add_argument("--end", type=int, required=True, help="end year of the last season")
+    parser.add_argument("--endpoints", default=",".join(CRAWLED_ENDPOINTS),
+                        help=f"comma separated endpoints (default: {','.join(CRAWLED_ENDPOINTS)})")
+    parser.add_argument("--workers", type=int, default=4, help="concurrent scrapes (default: 4)")
+    parser.add_argument("--rates", default=DEFAULT_RATES,
+                        help=f"requests per second per host (default: {DEFAULT_RATES})")
+    parser.add_argument("--store", help="SQLite store path (default: FOOTBALLAPI_STORE_PATH)")
+    parser.add_argument("--force", action="store_true", help="re-scrape seasons that are already fresh")
+    args = parser.parse_args(argv)
+
+    store = SeasonStore(args.store) if args.store else season_store
+    if not store.enabled:
+        parser.error("no store configured: pass --store or set FOOTBALLAPI_STORE_PATH")
+
+    endpoints = [e for e in args.endpoints.split(",") if e]
+    unknown = [e for e in endpoints if e not in CRAWLED_ENDPOINTS]
+    if unknown:
+        parser.error(f"unknown endpoints: {', '.join(unknown)}")
+
+    league_keys = [league for league in args.leagues.split(",") if league]
+    for endpoint in endpoints:
+        unsupported = [league for league in league_keys if league not in ENDPOINT_LEAGUES[endpoint]]
+        if unsupported:
+            print(f"{endpoint}: skipping unsupported leagues {', '.join(unsupported)}", file=sys.stderr)
+
+    jobs = build_jobs(league_keys, args.start, args.end, endpoints)
+    upstream.configure(parse_rates(args.rates))
+    counts = crawl(store, jobs, args.workers, args.force)
+    return 1 if counts["failed"] and not counts["ok"] and not counts["skipped"] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,35 @@
+import os
+import threading
+
+import pytest
+
+from benchmarks.loadtest import FakeUpstream
+
+# Tests never reach Wikipedia or Eurosport: the scrapers read their base URLs when app is
+# first imported, so the stand-in upstream is started before that
+upstream_server = FakeUpstream()
+threading.Thread(target=upstream_server.serve_forever, daemon=True).start()
+os.environ["FOOTBALLAPI_WIKIPEDIA_URL"] = upstream_server.url
+os.environ["FOOTBALLAPI_EUROSPORT_URL"] = upstream_server.url.replace("127.0.0.1", "localhost")
+
+from app import create_app  # noqa: E402
+from tests.fixtures import clear_caches  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def app():
+    return create_app()
+
+
+@pytest.fixture
+def client(app):
+    clear_caches()
+    yield app.test_client()
+    clear_caches()
+
+
+@pytest.fixture
+def upstream():
+    upstream_server.redirects.clear()
+    yield upstream_server
+    upstream_server.redirects.clear()
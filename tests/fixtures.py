@@ -0,0 +1,48 @@
+from app.routes import response_cache
+from app.services import scraping
+
+
+# A Ligue 1 season as get_league_giornate returns it: the page text keeps no space around
+# the separator, and two team names contain a hyphen
+LIGUE1 = [
+    [
+        {"date": "6 ago.", "match": "Paris Saint-Germain-Lione", "score": "2-1", "match_time": None},
+        {"date": "6 ago.", "match": "Saint-Étienne-Marsiglia", "score": "0-0", "match_time": None},
+    ],
+    [
+        {"date": "13 ago.", "match": "Lione-Saint-Étienne", "score": "1-3", "match_time": None},
+        {"date": "13 ago.", "match": "Marsiglia-Paris Saint-Germain", "score": "1-1", "match_time": None},
+    ],
+    [
+        {"date": "20 ago.", "match": "Paris Saint-Germain-Saint-Étienne", "score": "4-0", "match_time": None},
+        {"date": "20 ago.", "match": "Lione-Marsiglia", "score": "2-2", "match_time": None},
+    ],
+    [
+        {"date": "27 ago.", "match": "Lione-Paris Saint-Germain", "score": "-", "match_time": "21:00"},
+        {"date": "27 ago.", "match": "Marsiglia-Saint-Étienne", "score": "-", "match_time": "17:00"},
+    ],
+]
+
+
+class FakeClock:
+    """
+    Monotonic clock advanced by hand, injected as the 'clock' of rate limits and breakers.
+    """
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+def clear_caches():
+    """
+    Empties the response cache and the page and section caches, so the next request scrapes.
+    """
+    response_cache.clear()
+    scraping.season_pages.clear()
+    scraping.season_sections.clear()
@@ -0,0 +1,136 @@
+import asyncio
+import json
+
+import pytest
+
+from app.asgi import AsyncAPI
+from app.services import async_http
+from tests.fixtures import clear_caches
+
+
+@pytest.fixture(scope="module")
+def asgi(app):
+    return AsyncAPI(app, wsgi_workers=4)
+
+
+def asgi_request(asgi, path: str, query: str = "", method: str = "GET", headers: dict = None, body: bytes = b""):
+    """
+    Sends one request through the ASGI app on a fresh event loop.
+
+    Returns:
+        tuple: (status, headers dict, body bytes)
+    """
+    scope = {
+        "type": "http", "method": method, "path": path, "query_string": query.encode(), "root_path": "",
+        "headers": [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()],
+        "http_version": "1.1", "scheme": "http", "server": ("127.0.0.1", 5000), "client": ("127.0.0.1", 4000),
+    }
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0) if messages else {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    async def call():
+        try:
+            await asgi(scope, receive, send)
+        finally:
+            await async_http.aclose()
+
+    asyncio.run(call())
+    head = sent[0]
+    return (
+        head["status"],
+        {name.decode(): value.decode() for name, value in head["headers"]},
+        b"".join(message.get("body", b"") for message in sent[1:]),
+    )
+
+
+def both_engines(asgi, client, path: str, query: str = ""):
+    """
+    Answers the same request with the async engine, then with Flask, each from empty caches.
+    """
+    headers = {"Accept-Encoding": "identity"}
+    clear_caches()
+    status, _, body = asgi_request(asgi, path, query, headers=headers)
+    clear_caches()
+    response = client.get(f"{path}?{query}", headers=headers)
+    return (status, body), (response.status_code, response.data)
+
+
+def test_redirected_season_page_is_followed_by_both_engines(asgi, client, upstream):
+    upstream.redirects["/wiki/Serie_A_2021-2022"] = "/wiki/Serie_A_2022-2023"
+
+    async_answer, flask_answer = both_engines(asgi, client, "/api/gamedays", "league=SerieA&start=2021&end=2022")
+
+    assert async_answer == flask_answer
+    assert async_answer[0] == 200 and json.loads(async_answer[1])
+
+
+@pytest.mark.parametrize("path, query", [
+    ("/api/intro", "league=SerieA&start=2022&end=2023"),
+    ("/api/infobox", "league=SerieA&start=2022&end=2023"),
+    ("/api/teams", "league=Bundesliga&start=2023&end=2024"),
+    ("/api/scorers", "league=SerieA&start=2022&end=2023"),
+    ("/api/ranking", "league=SerieA"),
+    ("/api/gamedays", "league=SerieA&start=2022&end=2023"),
+    ("/api/infobox", "league=SerieA&start=2022&end=x"),
+    ("/api/ranking", ""),
+    ("/api/teams", "league=Narnia&start=2022&end=2023"),
+    ("/api/gamedays", "league=Narnia&start=2022&end=2023"),
+])
+def test_async_routes_answer_like_flask(asgi, client, path, query):
+    async_answer, flask_answer = both_engines(asgi, client, path, query)
+
+    assert async_answer == flask_answer
+
+
+def test_validation_errors_get_a_400(asgi, client):
+    (status, body), _ = both_engines(asgi, client, "/api/infobox", "league=SerieA&start=2022&end=x")
+
+    assert status == 400 and json.loads(body)["success"] is False
+
+
+@pytest.fixture
+def passed_through(asgi, monkeypatch):
+    calls = []
+    call_wsgi = asgi._call_wsgi
+
+    async def spy(scope, receive, send):
+        calls.append(scope["path"])
+        await call_wsgi(scope, receive, send)
+
+    monkeypatch.setattr(asgi, "_call_wsgi", spy)
+    return calls
+
+
+@pytest.mark.parametrize("path, query", [
+    ("/api/standings", "league=Narnia&start=2022&end=2023"),
+    ("/api/gamedays", "league=SerieA&start=2022&end=2023&matchday=3"),
+    ("/api/gamedays", "league=SerieA&start=2022&end=2023&format=ndjson"),
+    ("/api/infobox", "league=SerieA&start=x&end=2023"),
+    ("/api/missing", ""),
+])
+def test_other_requests_are_passed_to_flask(asgi, client, passed_through, path, query):
+    async_answer, flask_answer = both_engines(asgi, client, path, query)
+
+    assert passed_through == [path]
+    assert async_answer == flask_answer
+
+
+def test_post_requests_are_passed_to_flask_with_their_body(asgi, passed_through):
+    body = json.dumps({"items": [{"endpoint": "teams", "league": "SerieA", "start": 2022}]}).encode()
+
+    status, _, answer = asgi_request(asgi, "/api/batch", method="POST", headers={"Content-Type": "application/json"}, body=body)
+
+    assert passed_through == ["/api/batch"]
+    assert status == 200 and json.loads(answer)["data"][0]["success"] is False
+
+
+def test_handled_routes_stay_on_the_event_loop(asgi, client, passed_through):
+    both_engines(asgi, client, "/api/teams", "league=SerieA&start=2022&end=2023")
+
+    assert passed_through == []
@@ -0,0 +1,91 @@
+import asyncio
+
+import httpx
+import pytest
+import requests
+
+from app.services import async_http
+from app.services.circuit_breaker import CircuitOpen, HostBreakers
+from tests.fixtures import FakeClock
+
+URL = "http://upstream.test/wiki/Serie_A_2022-2023"
+
+
+class Upstream:
+    """
+    httpx mock transport answering with the given statuses (or raising the given errors) in turn,
+    then with the last one.
+    """
+
+    def __init__(self, *statuses):
+        self.statuses = list(statuses)
+        self.requests = 0
+
+    def __call__(self, request):
+        self.requests += 1
+        status = self.statuses.pop(0) if len(self.statuses) > 1 else self.statuses[0]
+        if isinstance(status, Exception):
+            raise status
+        return httpx.Response(status, text="page")
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(async_http, "breakers", HostBreakers(threshold=2, reset_timeout=30, clock=clock))
+    monkeypatch.setattr(async_http, "BACKOFF", 0)
+    return clock
+
+
+def fetch(upstream: Upstream):
+    async def get():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(upstream)) as client:
+            async_http._clients[asyncio.get_running_loop()] = client
+            try:
+                return await async_http.get(URL)
+            finally:
+                async_http._clients.pop(asyncio.get_running_loop(), None)
+
+    return asyncio.run(get())
+
+
+def test_retryable_statuses_are_retried(clock):
+    upstream = Upstream(503, 429, 200)
+
+    response = fetch(upstream)
+
+    assert response.status_code == 200 and response.text == "page"
+    assert upstream.requests == 3
+    assert async_http.breakers.get("upstream.test").state == "closed"
+
+
+def test_retries_are_bounded(clock, monkeypatch):
+    monkeypatch.setattr(async_http, "RETRIES", 1)
+    upstream = Upstream(503)
+
+    assert fetch(upstream).status_code == 503
+    assert upstream.requests == 2
+
+
+def test_connection_errors_are_retried_then_raised_as_requests_errors(clock):
+    upstream = Upstream(httpx.ConnectError("refused"))
+
+    with pytest.raises(requests.ConnectionError):
+        fetch(upstream)
+    assert upstream.requests == 1 + async_http.RETRIES
+
+
+def test_breaker_opens_after_failures_and_probes_after_the_reset(clock, monkeypatch):
+    monkeypatch.setattr(async_http, "RETRIES", 0)
+    upstream = Upstream(500)
+
+    fetch(upstream)
+    fetch(upstream)
+    with pytest.raises(CircuitOpen):
+        fetch(upstream)
+    assert upstream.requests == 2
+
+    clock.advance(30)
+    upstream.statuses = [200]
+    assert fetch(upstream).status_code == 200
+    assert async_http.breakers.get("upstream.test").state == "closed"
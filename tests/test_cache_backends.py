@@ -0,0 +1,90 @@
+import threading
+
+import pytest
+
+from app.services.cache_backends import CacheBackend, FileBackend, RedisBackend, RedisError
+from benchmarks.redis_standin import RedisStandIn
+
+
+def test_backend_missing_a_method_cannot_be_instantiated():
+    class Partial(CacheBackend):
+        def _get(self, key):
+            return None
+
+        def _set(self, key, data, retention):
+            pass
+
+    with pytest.raises(TypeError):
+        Partial()
+
+
+def test_file_backend_round_trip(tmp_path):
+    backend = FileBackend(str(tmp_path), prefix="test:")
+    other = FileBackend(str(tmp_path), prefix="other:")
+    value = {"success": True, "data": ["x" * 2000]}  # large enough to be compressed
+
+    assert backend.get(("scorers", "SerieA", 2022, 2023)) is None
+    assert backend.set(("scorers", "SerieA", 2022, 2023), value, 60)
+    assert other.set(("scorers", "SerieA", 2022, 2023), {"success": True, "data": []}, 60)
+    hit, _ = backend.get(("scorers", "SerieA", 2022, 2023))
+    assert hit == value
+
+    backend.clear()
+    assert backend.get(("scorers", "SerieA", 2022, 2023)) is None
+    assert other.get(("scorers", "SerieA", 2022, 2023)) is not None
+    assert backend.stats()["hits"] == 1 and backend.stats()["misses"] == 2
+
+
+@pytest.fixture
+def redis_server():
+    server = RedisStandIn()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_redis_backend_round_trip_and_clear_of_its_prefix(redis_server):
+    backend = RedisBackend(redis_server.url, prefix="test:")
+    other = RedisBackend(redis_server.url, prefix="other:")
+
+    assert backend.set(("teams", "SerieA", 2022, 2023), {"success": True, "data": [1, 2]}, 60)
+    assert other.set(("teams", "SerieA", 2022, 2023), {"success": True, "data": [3]}, 60)
+    hit, _ = backend.get(("teams", "SerieA", 2022, 2023))
+    assert hit == {"success": True, "data": [1, 2]}
+
+    backend.clear()
+    assert backend.get(("teams", "SerieA", 2022, 2023)) is None
+    assert other.get(("teams", "SerieA", 2022, 2023)) is not None
+
+
+@pytest.mark.parametrize("url", ["redis://:wrong@127.0.0.1:{port}/0", "redis://:secret@127.0.0.1:{port}/99"])
+def test_failed_handshake_is_not_kept(url):
+    server = RedisStandIn(password="secret")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        backend = RedisBackend(url.format(port=server.server_address[1]))
+
+        with pytest.raises(RedisError):
+            backend._call("GET", "key")
+        assert getattr(backend._local, "connection", None) is None
+        with pytest.raises(RedisError):
+            backend._call("SET", "key", "value")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert server.databases.get(0, {}) == {}
+
+
+def test_unreachable_backend_is_skipped_without_raising(redis_server):
+    url = redis_server.url
+    redis_server.shutdown()
+    redis_server.server_close()
+    backend = RedisBackend(url, timeout=0.2)
+
+    assert backend.get(("teams", "SerieA", 2022, 2023)) is None
+    assert not backend.set(("teams", "SerieA", 2022, 2023), {"success": True}, 60)
+    assert backend.errors == 1  # the set is skipped during RETRY_AFTER
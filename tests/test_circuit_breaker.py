@@ -0,0 +1,167 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.services.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpen,
+    HostBreakers,
+    LastKnownGood,
+    is_stale,
+)
+from tests.fixtures import FakeClock
+
+FAILURE = {"success": False, "data": None, "error": "Request error: 503"}
+
+
+def test_breaker_cycles_closed_open_half_open_closed():
+    clock = FakeClock()
+    breaker = CircuitBreaker("www.eurosport.it", threshold=3, reset_timeout=30, clock=clock)
+
+    for _ in range(3):
+        breaker.before_request()
+        breaker.record_failure()
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpen):
+        breaker.before_request()
+
+    clock.advance(29.9)
+    with pytest.raises(CircuitOpen):
+        breaker.before_request()
+
+    clock.advance(0.1)
+    breaker.before_request()  # the probe
+    assert breaker.state == HALF_OPEN
+    with pytest.raises(CircuitOpen):
+        breaker.before_request()  # a single probe at a time
+
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    breaker.before_request()
+    assert breaker.stats() == {"state": CLOSED, "failures": 0, "trips": 1, "rejected": 3, "open_for": None}
+
+
+def test_failed_probe_reopens_the_circuit():
+    clock = FakeClock()
+    breaker = CircuitBreaker("host", threshold=2, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    breaker.record_failure()
+
+    clock.advance(10)
+    breaker.before_request()
+    breaker.record_failure()
+
+    assert breaker.state == OPEN
+    assert breaker.trips == 2
+    with pytest.raises(CircuitOpen):
+        breaker.before_request()
+    clock.advance(10)
+    breaker.before_request()
+
+
+def test_success_resets_the_failure_count():
+    breaker = CircuitBreaker("host", threshold=3, clock=FakeClock())
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+
+    assert breaker.state == CLOSED
+
+
+def test_cancel_releases_the_probe():
+    clock = FakeClock()
+    breaker = CircuitBreaker("host", threshold=1, reset_timeout=5, clock=clock)
+    breaker.record_failure()
+    clock.advance(5)
+
+    breaker.before_request()
+    breaker.cancel()  # e.g. UpstreamBusy before sending
+    breaker.before_request()
+
+
+def test_only_one_of_many_threads_gets_the_probe():
+    clock = FakeClock()
+    breaker = CircuitBreaker("host", threshold=1, reset_timeout=5, clock=clock)
+    breaker.record_failure()
+    clock.advance(5)
+
+    allowed = []
+    start = threading.Barrier(8)
+
+    def request():
+        start.wait(5)
+        try:
+            breaker.before_request()
+            allowed.append(1)
+        except CircuitOpen:
+            pass
+
+    threads = [threading.Thread(target=request) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert allowed == [1]
+
+
+def make_last_good(clock):
+    breakers = HostBreakers(threshold=1, reset_timeout=30, clock=clock)
+    return breakers, LastKnownGood(breakers, clock=clock)
+
+
+def test_last_good_serves_a_stale_copy_while_the_circuit_is_open():
+    clock = FakeClock()
+    breakers, last_good = make_last_good(clock)
+    results = [{"success": True, "data": ["Inter"], "error": None}]
+
+    @last_good.wrap("www.eurosport.it")
+    def scrape(league_key):
+        return results[-1]
+
+    assert scrape("SerieA") == results[0]
+
+    results.append(FAILURE)
+    assert scrape("SerieA") == FAILURE  # circuit still closed: the error is returned
+
+    breakers.get("www.eurosport.it").record_failure()
+    clock.advance(12.5)
+    stale = scrape("SerieA")
+    assert stale["data"] == ["Inter"]
+    assert stale["meta"] == {"stale": True, "age_seconds": 12.5, "last_error": FAILURE["error"]}
+    assert is_stale(stale)
+    assert scrape("PremierLeague") == FAILURE  # nothing remembered for these arguments
+    assert last_good.stats()["served"] == 1
+
+
+def test_last_good_wraps_coroutines():
+    clock = FakeClock()
+    breakers, last_good = make_last_good(clock)
+    results = [{"success": True, "data": 1, "error": None}, FAILURE]
+
+    @last_good.wrap("host")
+    async def scrape(league_key):
+        return results.pop(0)
+
+    asyncio.run(scrape("SerieA"))
+    breakers.get("host").record_failure()
+
+    assert asyncio.run(scrape("SerieA"))["meta"]["stale"] is True
+
+
+def test_last_good_is_bounded():
+    clock = FakeClock()
+    breakers, last_good = make_last_good(clock)
+    last_good.maxsize = 2
+    for league in ["SerieA", "Bundesliga", "Ligue1"]:
+        last_good.resolve("host", ("scrape", league), {"success": True, "data": league, "error": None})
+    breakers.get("host").record_failure()
+
+    assert last_good.resolve("host", ("scrape", "SerieA"), FAILURE) == FAILURE
+    assert last_good.resolve("host", ("scrape", "Ligue1"), FAILURE)["data"] == "Ligue1"
@@ -0,0 +1,49 @@
+import pytest
+
+import crawl
+from app.services.response_cache import is_success
+from app.services.season_store import SeasonStore
+
+
+def test_jobs_cover_only_the_leagues_each_scraper_supports():
+    jobs = crawl.build_jobs(["SerieA", "ProLeague"], 2021, 2023, ["teams", "scorers", "gamedays"])
+
+    assert ("teams", "ProLeague", 2021, 2022) in jobs
+    assert not [job for job in jobs if job[0] != "teams" and job[1] == "ProLeague"]
+    assert len(jobs) == 8
+
+
+@pytest.fixture
+def teams_scraper(monkeypatch):
+    calls = []
+
+    def scrape(league, start, end):
+        calls.append((league, start, end))
+        return {"success": True, "data": [f"{league} {start}"], "error": None}
+
+    monkeypatch.setitem(crawl.ENDPOINTS, "teams", (scrape, None, is_success))
+    return calls
+
+
+def test_resumed_crawl_skips_stored_seasons(tmp_path, teams_scraper):
+    store = SeasonStore(str(tmp_path / "seasons.sqlite3"))
+    jobs = crawl.build_jobs(["SerieA"], 2020, 2022, ["teams"])
+
+    assert crawl.crawl(store, jobs, workers=2) == {"ok": 2, "skipped": 0, "failed": 0}
+    assert crawl.crawl(store, jobs, workers=2) == {"ok": 0, "skipped": 2, "failed": 0}
+    assert len(teams_scraper) == 2
+    assert store.get("teams", "SerieA", 2020, 2021)[0]["data"] == ["SerieA 2020"]
+
+    assert crawl.crawl(store, jobs, workers=2, force=True) == {"ok": 2, "skipped": 0, "failed": 0}
+    assert len(teams_scraper) == 4
+
+
+def test_exit_code_fails_only_when_nothing_was_crawled(tmp_path, monkeypatch):
+    monkeypatch.setattr(crawl.upstream, "configure", lambda rates: None)
+    results = iter([{"success": True, "data": [], "error": None}, {"success": False, "data": None, "error": "Request error: down"}])
+    monkeypatch.setitem(crawl.ENDPOINTS, "teams", (lambda *season: next(results), None, is_success))
+    argv = ["--store", str(tmp_path / "seasons.sqlite3"), "--leagues", "SerieA", "--endpoints", "teams", "--workers", "1"]
+
+    assert crawl.main(argv + ["--start", "2020", "--end", "2021"]) == 0
+    assert crawl.main(argv + ["--start", "2021", "--end", "2022"]) == 1
+    assert crawl.main(argv + ["--start", "2020", "--end", "2021"]) == 0  # skipped, not failed
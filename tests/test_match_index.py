@@ -0,0 +1,54 @@
+from app.services.analytics import SeasonColumns, season_summary
+from app.services.match_index import MatchIndex, side_counts, split_match
+from app.services.standings import StandingsEngine
+from tests.fixtures import LIGUE1
+
+
+TEAMS = ["Lione", "Marsiglia", "Paris Saint-Germain", "Saint-Étienne"]
+
+
+def test_split_match_uses_the_season_to_find_the_separator():
+    counts = side_counts(LIGUE1)
+
+    assert split_match("Paris Saint-Germain-Lione", counts) == ["Paris Saint-Germain", "Lione"]
+    assert split_match("Paris Saint-Germain-Saint-Étienne", counts) == ["Paris Saint-Germain", "Saint-Étienne"]
+    assert split_match("Marsiglia-Saint-Étienne", counts) == ["Marsiglia", "Saint-Étienne"]
+
+
+def test_split_match_prefers_spaced_separators_and_dashes():
+    assert split_match("Paris Saint-Germain - Saint-Étienne") == ["Paris Saint-Germain", "Saint-Étienne"]
+    assert split_match("Saint-Étienne–Lione") == ["Saint-Étienne", "Lione"]
+    assert split_match("Inter-Milan") == ["Inter", "Milan"]
+
+
+def test_match_index_filters_hyphenated_teams():
+    index = MatchIndex(LIGUE1)
+
+    psg = index.query(team="Paris Saint-Germain")
+    assert [index.matches[p]["match"] for p in psg] == [
+        "Paris Saint-Germain-Lione",
+        "Marsiglia-Paris Saint-Germain",
+        "Paris Saint-Germain-Saint-Étienne",
+        "Lione-Paris Saint-Germain",
+    ]
+    assert len(index.query(team="saint-étienne")) == 4
+    assert sorted(index.by_team) == sorted(name.casefold() for name in TEAMS)
+
+
+def test_standings_of_hyphenated_teams():
+    engine = StandingsEngine(LIGUE1)
+
+    assert engine.teams == TEAMS
+    table = {row["Team"]: row for row in engine.table(engine.rounds)}
+    assert table["Paris Saint-Germain"]["Points"] == 7
+    assert table["Saint-Étienne"]["Points"] == 4
+    assert table["Paris Saint-Germain"]["Match"] == 3
+
+
+def test_analytics_of_hyphenated_teams():
+    columns = SeasonColumns(LIGUE1)
+
+    assert columns.teams == TEAMS
+    assert len(columns) == 6
+    form = season_summary(columns, 5)["form"]
+    assert form["Paris Saint-Germain"]["form"] == "WDW"
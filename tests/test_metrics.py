@@ -0,0 +1,43 @@
+import json
+
+from app.services.metrics import Counter, timed_scraper
+from app.services import metrics
+
+
+def test_timed_scraper_counts_each_failed_item_of_a_list(monkeypatch):
+    errors = Counter("test_scrape_errors_total", "", ("scraper", "cause"))
+    monkeypatch.setattr(metrics, "scrape_errors", errors)
+
+    @timed_scraper
+    def bulk(seasons):
+        return [
+            {"success": True, "data": "intro", "error": None},
+            {"success": False, "data": None, "error": "Request error: timeout"},
+            {"success": False, "data": None, "error": "Parsing error: no table"},
+        ]
+
+    assert len(bulk([])) == 3
+    assert errors._values == {("bulk", "request"): 1, ("bulk", "parsing"): 1}
+
+
+def test_timed_scraper_counts_a_failed_dict():
+    @timed_scraper
+    def single():
+        return {"success": False, "data": None, "error": "Internal error: boom"}
+
+    single()
+    assert ("single", "internal") in metrics.scrape_errors._values
+
+
+def test_timed_scraper_classifies_json_error_strings(monkeypatch):
+    errors = Counter("test_scrape_errors_total", "", ("scraper", "cause"))
+    monkeypatch.setattr(metrics, "scrape_errors", errors)
+
+    @timed_scraper
+    def giornate(error):
+        return json.dumps({"success": False, "error": error, "data": None})
+
+    giornate("Request error: 503 Server Error")
+    giornate("Chiave lega 'Narnia' non trovata nel dizionario.")
+
+    assert errors._values == {("giornate", "request"): 1, ("giornate", "not_found"): 1}
@@ -0,0 +1,101 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.services.rate_limit import TokenBucket, parse_rates
+from app.services.upstream_scheduler import BACKGROUND, LIVE, USER, UpstreamBusy, UpstreamScheduler
+from tests.fixtures import FakeClock
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.001)
+
+
+def test_token_bucket_allows_a_burst_then_waits():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=3, clock=clock)
+
+    assert [bucket.delay() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.delay() == pytest.approx(0.5)
+
+
+def test_token_bucket_refills_at_its_rate_up_to_capacity():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=3, clock=clock)
+    for _ in range(3):
+        bucket.delay()
+
+    clock.advance(0.25)
+    assert bucket.delay() == pytest.approx(0.25)
+    clock.advance(0.25)
+    assert bucket.delay() == 0.0
+
+    clock.advance(60)  # a long pause refills the burst, not more
+    assert [bucket.delay() for _ in range(4)][:3] == [0.0, 0.0, 0.0]
+    assert bucket.delay() > 0
+
+
+def test_parse_rates():
+    assert parse_rates("it.wikipedia.org=10, www.eurosport.it=2.5,") == {"it.wikipedia.org": 10.0, "www.eurosport.it": 2.5}
+
+
+def test_unlimited_hosts_are_not_queued():
+    scheduler = UpstreamScheduler({"it.wikipedia.org": 1}, burst=1, max_wait=0)
+    scheduler.acquire("example.org")
+    scheduler.acquire("example.org")
+
+
+def test_waiters_are_served_by_priority_then_arrival():
+    clock = FakeClock()
+    scheduler = UpstreamScheduler({"host": 64}, burst=1, max_wait=60, clock=clock)
+    scheduler.acquire("host")  # empties the bucket
+
+    order = []
+
+    def request(name, priority):
+        scheduler.acquire("host", priority)
+        order.append(name)
+
+    threads = []
+    for name, priority in [("crawl", BACKGROUND), ("user 1", USER), ("live", LIVE), ("user 2", USER)]:
+        thread = threading.Thread(target=request, args=(name, priority))
+        thread.start()
+        threads.append(thread)
+        wait_for(lambda: sum(scheduler.stats()["host"]["queue_depth"].values()) == len(threads))
+
+    for served in range(1, 5):
+        clock.advance(1 / 64)  # one token
+        wait_for(lambda: len(order) == served)
+    for thread in threads:
+        thread.join(5)
+
+    assert order == ["live", "user 1", "user 2", "crawl"]
+    priorities = scheduler.stats()["host"]["priorities"]
+    assert priorities["user"]["granted"] == 3 and priorities["background"]["granted"] == 1
+
+
+def test_upstream_busy_after_max_wait():
+    scheduler = UpstreamScheduler({"host": 0.001}, burst=1, max_wait=0.05)
+    scheduler.acquire("host")
+
+    with pytest.raises(UpstreamBusy):
+        scheduler.acquire("host")
+    assert scheduler.stats()["host"]["rejected"] == 1
+    assert sum(scheduler.stats()["host"]["queue_depth"].values()) == 0
+
+
+def test_async_waiters_share_the_queue_and_time_out():
+    scheduler = UpstreamScheduler({"host": 0.001}, burst=1, max_wait=0.05)
+
+    async def main():
+        await scheduler.acquire_async("host")
+        with pytest.raises(UpstreamBusy):
+            await scheduler.acquire_async("host")
+
+    asyncio.run(main())
+    assert scheduler.stats()["host"]["rejected"] == 1
@@ -0,0 +1,65 @@
+import threading
+import time
+from datetime import date
+
+from app.services.response_cache import CURRENT_SEASON_TTL, PAST_SEASON_TTL, ResponseCache, ttl_for
+from tests.fixtures import FakeClock
+
+
+def test_fresh_entry_is_a_hit():
+    clock = FakeClock()
+    cache = ResponseCache(clock=clock)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"success": True, "data": len(calls)}
+
+    assert cache.get("key", 60, compute) == {"success": True, "data": 1}
+    clock.advance(59)
+    assert cache.get("key", 60, compute) == {"success": True, "data": 1}
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_failures_are_not_cached():
+    cache = ResponseCache(clock=FakeClock())
+    cache.get("key", 60, lambda: {"success": False, "data": None, "error": "Request error: timeout"})
+    assert cache.peek("key") is None
+
+
+def test_expired_entry_is_served_stale_while_one_refresh_runs():
+    clock = FakeClock()
+    cache = ResponseCache(clock=clock)
+    cache.get("key", 60, lambda: "old")
+    clock.advance(61)
+
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def refresh():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "new"
+
+    assert cache.get("key", 60, refresh) == "old"
+    assert started.wait(5)
+    assert cache.get("key", 60, refresh) == "old"
+    assert cache.get("key", 60, refresh) == "old"
+    release.set()
+
+    deadline = time.monotonic() + 5
+    while cache.peek("key") != "new" and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert cache.peek("key") == "new"
+    assert len(calls) == 1
+    assert cache.stats()["stale_hits"] == 3
+    assert cache.get("key", 60, refresh) == "new"
+
+
+def test_current_season_expires_sooner_than_a_past_one():
+    year = date.today().year
+    assert ttl_for("scorers", year, year + 1) == CURRENT_SEASON_TTL
+    assert ttl_for("scorers", 2010, 2011) == PAST_SEASON_TTL
+    assert ttl_for("scorers", year, year + 1) < ttl_for("scorers", 2010, 2011)
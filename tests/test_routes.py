@@ -0,0 +1,194 @@
+import gzip
+import json
+import threading
+import time
+
+import pytest
+
+from app import routes
+from app.services import response_encoding
+from app.services.season_store import SeasonStore
+from tests.fixtures import LIGUE1
+
+
+def test_scorers_range_rejects_too_many_seasons(client, monkeypatch):
+    calls = []
+    monkeypatch.setattr(routes, "scrape_top_scorers", lambda *season: calls.append(season))
+
+    response = client.get("/api/scorers/range?league=SerieA,PremierLeague,Bundesliga&start=1990&end=2100")
+
+    assert response.status_code == 400
+    assert f"At most {routes.RANGE_MAX_SEASONS} league seasons" in response.get_json()["error"]
+    assert calls == []
+
+
+def test_scorers_range_rejects_empty_range(client):
+    response = client.get("/api/scorers/range?league=SerieA&start=2022&end=2022")
+
+    assert response.status_code == 400
+    assert response.get_json()["error"] == "'end' must be greater than 'start'."
+
+
+def test_scorers_range_within_the_limit(client, monkeypatch):
+    def scrape(league, start, end):
+        return {"success": True, "data": [{"Player": "Rossi", "Team": "Roma", "Appearances": "30", "Goals": str(start - 2000)}],
+                "error": None}
+
+    monkeypatch.setattr(routes, "scrape_top_scorers", scrape)
+
+    response = client.get("/api/scorers/range?league=SerieA&start=2020&end=2023")
+
+    body = response.get_json()
+    assert response.status_code == 200
+    assert body["success"] is True
+    assert body["data"]["seasons"] == 3
+
+
+@pytest.fixture
+def offline_store(tmp_path, monkeypatch):
+    store = SeasonStore(str(tmp_path / "seasons.sqlite3"), offline=True)
+    store.put("gamedays", "Ligue1", 2022, 2023, json.dumps(LIGUE1, ensure_ascii=False))
+    monkeypatch.setattr(routes, "season_store", store)
+    return store
+
+
+def test_gamedays_filters_offline_from_the_stored_season(client, offline_store):
+    response = client.get("/api/gamedays?league=Ligue1&start=2022&end=2023&matchday=3")
+
+    body = response.get_json()
+    assert body["success"] is True
+    assert [match["match"] for match in body["data"]["matches"]] == [
+        "Paris Saint-Germain-Saint-Étienne",
+        "Lione-Marsiglia",
+    ]
+
+
+def test_gamedays_filters_offline_without_the_stored_season(client, offline_store):
+    response = client.get("/api/gamedays?league=SerieA&start=2022&end=2023&team=Inter")
+
+    assert response.get_json()["error"] == "Offline mode: this data is not available in the local store."
+
+
+def ndjson(response) -> list:
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+def test_gamedays_ndjson_unknown_league(client):
+    lines = ndjson(client.get("/api/gamedays?league=Nowhere&start=2022&end=2023&format=ndjson"))
+
+    assert lines == [{"league": "Nowhere", "start": 2022, "end": 2023, "success": False,
+                      "error": "Chiave lega 'Nowhere' non trovata nel dizionario."}]
+
+
+def test_gamedays_ndjson_offline_from_the_stored_season(client, offline_store):
+    lines = ndjson(client.get("/api/gamedays?league=Ligue1&start=2022&end=2023&format=ndjson&unit=match"))
+
+    assert len(lines) == 8
+    assert lines[4]["matchday"] == 3 and lines[4]["match"] == "Paris Saint-Germain-Saint-Étienne"
+
+
+def test_gamedays_ndjson_does_not_hide_key_errors(client, monkeypatch):
+    def broken(league, start, end):
+        raise KeyError("home")
+        yield
+
+    monkeypatch.setattr(routes, "stream_league_giornate", broken)
+
+    with pytest.raises(KeyError):
+        client.get("/api/gamedays?league=SerieA&start=2022&end=2023&format=ndjson").get_data()
+
+
+def test_gamedays_export_rejects_too_many_seasons(client):
+    response = client.get("/api/gamedays/export?league=SerieA,Ligue1&start=1990&end=2100")
+
+    assert response.status_code == 400
+    assert f"At most {routes.RANGE_MAX_SEASONS} league seasons" in response.get_json()["error"]
+
+
+def test_standings_offline_from_the_stored_season(client, offline_store):
+    response = client.get("/api/standings?league=Ligue1&start=2022&end=2023&matchday=2")
+
+    body = response.get_json()
+    assert body["success"] is True
+    assert body["data"]["rounds"] == 4
+    assert [row["Team"] for row in body["data"]["table"]][0] == "Saint-Étienne"
+
+
+def test_analytics_offline_from_the_stored_season(client, offline_store):
+    response = client.get("/api/analytics?league=Ligue1&start=2022&end=2023")
+
+    body = response.get_json()
+    assert body["success"] is True
+    assert body["data"]["errors"] == []
+    assert body["data"]["seasons"][0]["form"]["Paris Saint-Germain"]["form"] == "WDW"
+
+
+def test_analytics_rejects_too_many_seasons(client):
+    response = client.get("/api/analytics?league=SerieA,Ligue1,Bundesliga&start=1990&end=2100")
+
+    assert response.status_code == 400
+
+
+def test_intro_range_rejects_too_many_seasons(client, monkeypatch):
+    calls = []
+    monkeypatch.setattr(routes, "get_wikipedia_intros", lambda seasons: calls.append(seasons))
+
+    response = client.get("/api/intro/range?league=SerieA&league=Ligue1&start=1990&end=2100")
+
+    assert response.status_code == 400
+    assert calls == []
+
+
+def test_intro_range_lists_every_league_season(client, monkeypatch):
+    monkeypatch.setattr(routes, "get_wikipedia_intros", lambda seasons: [
+        {"success": True, "data": {"text": f"{league} {start}"}, "error": None} for league, start, end in seasons
+    ])
+
+    response = client.get("/api/intro/range?league=SerieA,Ligue1&league=SerieA&start=2020&end=2022")
+
+    data = response.get_json()["data"]
+    assert [(item["league"], item["start"], item["end"]) for item in data] == [
+        ("SerieA", 2020, 2021), ("SerieA", 2021, 2022), ("Ligue1", 2020, 2021), ("Ligue1", 2021, 2022),
+    ]
+
+
+def test_batch_is_not_queued_behind_a_busy_range(client):
+    release = threading.Event()
+    blockers = [routes.range_pool.submit(release.wait, 10) for _ in range(routes.range_pool._max_workers)]
+    started = time.monotonic()
+    try:
+        response = client.post("/api/batch", json={"items": [{"endpoint": "teams", "league": "SerieA", "start": 2022}]})
+        elapsed = time.monotonic() - started
+    finally:
+        release.set()
+        for blocker in blockers:
+            blocker.result()
+
+    assert elapsed < 2
+    assert response.status_code == 200
+    assert response.get_json()["data"][0]["success"] is False
+
+
+def test_matching_etag_gets_304(client, offline_store):
+    first = client.get("/api/gamedays?league=Ligue1&start=2022&end=2023")
+    etag = first.headers["ETag"]
+
+    second = client.get("/api/gamedays?league=Ligue1&start=2022&end=2023", headers={"If-None-Match": etag})
+    changed = client.get("/api/gamedays?league=Ligue1&start=2022&end=2023", headers={"If-None-Match": '"other"'})
+
+    assert first.status_code == 200 and etag
+    assert second.status_code == 304 and second.data == b""
+    assert second.headers["ETag"] == etag
+    assert changed.status_code == 200
+
+
+def test_gzip_is_negotiated(client, offline_store):
+    plain = client.get("/api/gamedays?league=Ligue1&start=2022&end=2023", headers={"Accept-Encoding": "identity"})
+    zipped = client.get("/api/gamedays?league=Ligue1&start=2022&end=2023", headers={"Accept-Encoding": "gzip"})
+
+    assert len(plain.data) >= response_encoding.MIN_COMPRESS_SIZE
+    assert "Content-Encoding" not in plain.headers
+    assert zipped.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in zipped.headers["Vary"]
+    assert json.loads(gzip.decompress(zipped.data)) == plain.get_json()
+    assert zipped.headers["ETag"] != plain.headers["ETag"]
@@ -0,0 +1,66 @@
+import pytest
+import requests
+
+from app.services import scraping
+from app.services.page_cache import PageCache
+
+HTML = '<html><script>"wgRevisionId":42</script><table class="wikitable"></table></html>'
+
+
+def response(status: int, body: str = "", etag: str = None) -> requests.Response:
+    reply = requests.Response()
+    reply.status_code = status
+    reply._content = body.encode("utf-8")
+    reply.encoding = "utf-8"
+    if etag:
+        reply.headers["ETag"] = etag
+    return reply
+
+
+@pytest.fixture
+def pages(monkeypatch):
+    cache = PageCache(maxsize=4, ttl=60, retry_after=10)
+    monkeypatch.setattr(scraping, "season_pages", cache)
+    return cache
+
+
+def test_not_modified_page_is_reused_with_its_memos(pages, monkeypatch):
+    sent = []
+
+    def get(url, headers=None, **kwargs):
+        sent.append(headers)
+        return response(200, HTML, etag='"v1"') if headers is None else response(304, etag='"v1"')
+
+    monkeypatch.setattr(scraping.http_client, "get", get)
+    page = scraping._download_season_page("Serie_A_2022-2023")
+    page.store_memo("teams", {"success": True})
+    page.fetched_at -= 61
+
+    assert scraping._download_season_page("Serie_A_2022-2023", page) is page
+    assert sent[1] == {"If-None-Match": '"v1"'}
+    assert page.is_fresh(pages.ttl) and page.has_memo("teams")
+    assert pages.stats()["not_modified"] == 1
+
+
+def test_failed_revalidation_serves_the_stale_page_and_backs_off(pages, monkeypatch):
+    page = pages.put("Serie_A_2022-2023", HTML, etag='"v1"')
+    page.fetched_at -= 61
+
+    def unreachable(url, headers=None, **kwargs):
+        raise requests.ConnectionError("Wikipedia is down")
+
+    monkeypatch.setattr(scraping.http_client, "get", unreachable)
+
+    assert scraping._download_season_page("Serie_A_2022-2023", page) is page
+    assert page.is_fresh(pages.ttl)
+    assert pages.stats()["revalidation_errors"] == 1
+
+    page.fetched_at -= pages.retry_after
+    assert not page.is_fresh(pages.ttl)
+
+
+def test_failed_download_without_a_copy_raises(pages, monkeypatch):
+    monkeypatch.setattr(scraping.http_client, "get", lambda url, headers=None, **kwargs: response(503))
+
+    with pytest.raises(requests.HTTPError):
+        scraping._download_season_page("Serie_A_2022-2023")
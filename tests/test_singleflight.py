@@ -0,0 +1,170 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.services.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def run_concurrently(count, target):
+    results, errors = [None] * count, [None] * count
+
+    def worker(position):
+        try:
+            results[position] = target(position)
+        except Exception as e:
+            errors[position] = e
+
+    threads = [threading.Thread(target=worker, args=(position,)) for position in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    return results, errors
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.001)
+
+
+def test_concurrent_callers_share_one_result():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        release.wait(5)
+        return {"success": True}
+
+    def caller(position):
+        return flight.do(("ranking", "SerieA"), fetch)
+
+    thread_results = {}
+    runner = threading.Thread(target=lambda: thread_results.update(out=run_concurrently(8, caller)))
+    runner.start()
+    wait_for(lambda: flight.executed + flight.shared == 8)
+    release.set()
+    runner.join(5)
+
+    results, errors = thread_results["out"]
+    assert calls == [1]
+    assert errors == [None] * 8
+    assert all(result is results[0] for result in results)
+    assert flight.stats() == {"executed": 1, "shared": 7, "in_flight": 0}
+
+
+def test_concurrent_callers_share_one_exception():
+    flight = SingleFlight()
+    release = threading.Event()
+    error = RuntimeError("upstream down")
+
+    def fetch():
+        release.wait(5)
+        raise error
+
+    thread_results = {}
+    runner = threading.Thread(target=lambda: thread_results.update(
+        out=run_concurrently(4, lambda position: flight.do("key", fetch))))
+    runner.start()
+    wait_for(lambda: flight.executed + flight.shared == 4)
+    release.set()
+    runner.join(5)
+
+    _, errors = thread_results["out"]
+    assert all(e is error for e in errors)
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_sequential_calls_are_not_coalesced():
+    flight = SingleFlight()
+    assert flight.do("key", lambda: 1) == 1
+    assert flight.do("key", lambda: 2) == 2
+    assert flight.executed == 2
+
+
+def test_wrap_coalesces_league_aliases():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    @flight.wrap(aliases={"SerieA": "Serie_A_", "italy": "Serie_A_"})
+    def scrape(league_key, year_start, year_end):
+        calls.append(league_key)
+        release.wait(5)
+        return {"league": league_key}
+
+    leagues = ["SerieA", "italy", "SerieA", "italy"]
+    thread_results = {}
+    runner = threading.Thread(target=lambda: thread_results.update(
+        out=run_concurrently(4, lambda position: scrape(leagues[position], 2022, 2023))))
+    runner.start()
+    wait_for(lambda: flight.executed + flight.shared == 4)
+    release.set()
+    runner.join(5)
+
+    assert len(calls) == 1
+    assert flight.shared == 3
+
+
+def test_wrap_keeps_unknown_keys_apart_from_alias_targets():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    @flight.wrap(aliases={"italy": "serie-a"})
+    def scrape(league_key):
+        calls.append(league_key)
+        release.wait(5)
+        return league_key
+
+    # 'serie-a' is not a league key: it must not receive the result of 'italy'
+    leagues = ["italy", "serie-a"]
+    thread_results = {}
+    runner = threading.Thread(target=lambda: thread_results.update(
+        out=run_concurrently(2, lambda position: scrape(leagues[position]))))
+    runner.start()
+    wait_for(lambda: len(calls) == 2)
+    release.set()
+    runner.join(5)
+
+    assert thread_results["out"][0] == ["italy", "serie-a"]
+
+
+def test_async_single_flight_shares_one_task():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    @flight.wrap(aliases={"SerieA": "serie-a", "italy": "serie-a"})
+    async def scrape(league_key):
+        calls.append(league_key)
+        await asyncio.sleep(0.01)
+        return {"success": True}
+
+    async def main():
+        return await asyncio.gather(scrape("SerieA"), scrape("italy"), scrape("SerieA"))
+
+    results = asyncio.run(main())
+    assert len(calls) == 1
+    assert results[0] is results[1] is results[2]
+    assert flight.stats() == {"executed": 1, "shared": 2, "in_flight": 0}
+
+
+def test_async_single_flight_shares_exception():
+    flight = AsyncSingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("bad page")
+
+    async def main():
+        return await asyncio.gather(flight.do("key", fail), flight.do("key", fail), return_exceptions=True)
+
+    first, second = asyncio.run(main())
+    assert isinstance(first, ValueError) and first is second
+    with pytest.raises(ValueError):
+        asyncio.run(flight.do("key", fail))
@@ -0,0 +1,63 @@
+import pytest
+import requests
+
+from app.services import scraping
+from app.services.page_cache import PageCache
+from app.services.singleflight import SingleFlight
+from app.services.wiki_sections import SectionFetcher, SectionMissing
+
+REPLY = {
+    "title": "Ligue 1 2022-2023",
+    "revid": 1234,
+    "sections": [
+        {"anchor": "Stagione", "index": "1"},
+        {"anchor": "Squadre_partecipanti", "index": "2"},
+        {"anchor": "Allenatori_e_primatisti", "index": "T-1"},
+        {"anchor": "Classifica", "index": "T-2"},
+        {"anchor": "Risultati", "index": "3"},
+    ],
+}
+
+
+def test_store_index_skips_transcluded_sections():
+    fetcher = SectionFetcher(PageCache(maxsize=4, ttl=60), SingleFlight())
+
+    index = fetcher.store_index("Ligue_1_2022-2023", REPLY)
+
+    assert index.anchors == {"Stagione": 1, "Squadre_partecipanti": 2, "Risultati": 3}
+    assert index.revision == 1234
+    assert fetcher.cached_index("Ligue_1_2022-2023") is index
+    with pytest.raises(SectionMissing):
+        index.number("Classifica")
+
+
+class FullPage:
+    def memo(self, name, extract):
+        return {"success": True, "data": "full page", "error": None}
+
+
+@pytest.fixture
+def sections_mode(monkeypatch):
+    monkeypatch.setattr(scraping, "WIKI_FETCH", "sections")
+    monkeypatch.setattr(scraping, "season_pages", PageCache(maxsize=4, ttl=60))
+    monkeypatch.setattr(scraping, "get_season_page", lambda title: FullPage())
+
+
+@pytest.mark.parametrize("error", [SectionMissing("nosuchsection"), requests.ConnectionError("down")])
+def test_season_extract_falls_back_to_the_page_when_the_section_is_unavailable(sections_mode, monkeypatch, error):
+    def section(title, anchor):
+        raise error
+
+    monkeypatch.setattr(scraping.season_sections, "section", section)
+
+    assert scraping.season_extract("Ligue_1_2022-2023", "Squadre_partecipanti", "teams", None)["data"] == "full page"
+
+
+def test_season_extract_surfaces_programming_errors(sections_mode, monkeypatch):
+    def section(title, anchor):
+        return {}["missing"]
+
+    monkeypatch.setattr(scraping.season_sections, "section", section)
+
+    with pytest.raises(KeyError):
+        scraping.season_extract("Ligue_1_2022-2023", "Squadre_partecipanti", "teams", None)